@@ -1,8 +1,6 @@
 import os
 import time
 import json
-import io
-import base64
 import logging
 import socket
 
@@ -11,26 +9,35 @@ load_dotenv()
 
 import streamlit as st
 from streamlit_lottie import st_lottie
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.section import WD_SECTION_START
-from docx.enum.section import WD_ORIENT
 import requests
 from bs4 import BeautifulSoup
 
 # Selenium imports
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-# PDF reading
-from PyPDF2 import PdfReader
+from driver_pool import DriverPool, start_chrome
+from content_cache import content_key
+
+# ATS scoring
+from ats.extract import extract_text_cached
+from ats.scoring import score_pair
+from ats.weighting import IdfModel, ATS_IDF_MODEL_PATH
+from ats.profile import JobProfile, ResumeMatch
+from ats.taxonomy import default_taxonomy
+from ats.dedup import Deduplicator
+from ats.ingest import ingest, open_sink, INGEST_STORE_PATH
+from ats.index import ResumeIndex, LiveRanking, RESUME_INDEX_PATH
+# Resume templates are declarative specs (templetes/templates.json) compiled into render plans.
+from templetes import TEMPLATE_MAP, render_bytes
+from templetes.cache import document_bytes
+from templetes.bundle import render_all_zip
+from templetes.generate import profile_to_template_data
+from templetes.preview import render_html
+from templetes.patch import DocxEditor
 
 # --- Basic Configuration ---
 # logging
@@ -50,351 +57,43 @@ def load_lottieurl(url: str):
         return None
     return r.json()
 
-# ----------------- Resume Template Generation -----------------
-
-def _add_heading(doc, text, size=16, bold=True, color=None):
-    para = doc.add_paragraph()
-    run = para.add_run(text)
-    run.font.size = Pt(size)
-    run.bold = bold
-    if color:
-        run.font.color.rgb = RGBColor(*color)
-    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    return para
-
-def _add_section_heading(doc, text, color=None):
-    para = doc.add_paragraph()
-    run = para.add_run(text.upper())
-    run.font.size = Pt(12)
-    run.bold = True
-    if color:
-        run.font.color.rgb = RGBColor(*color)
-    para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    para.paragraph_format.space_before = Pt(12)
-    para.paragraph_format.space_after = Pt(6)
-    return para
-
-def _add_bullet_list(doc, items):
-    for item in items:
-        if item: # Ensure item is not empty
-            doc.add_paragraph(item, style="List Bullet")
-
-def template_minimal(data):
-    doc = Document()
-    _add_heading(doc, data.get('name', 'Your Name'), size=20)
-    doc.add_paragraph(data.get('title', ''))
-    doc.add_paragraph(data.get('contact', ''))
-    
-    _add_section_heading(doc, "Summary")
-    doc.add_paragraph(data.get('summary', ''))
-
-    _add_section_heading(doc, "Experience")
-    _add_bullet_list(doc, data.get('experience', []))
-
-    _add_section_heading(doc, "Education")
-    _add_bullet_list(doc, data.get('education', []))
-
-    _add_section_heading(doc, "Skills")
-    _add_bullet_list(doc, data.get('skills', []))
-
-    _add_section_heading(doc, "Projects")
-    _add_bullet_list(doc, data.get('projects', []))
-
-    _add_section_heading(doc, "Certifications")
-    _add_bullet_list(doc, data.get('certificates', []))
-
-    _add_section_heading(doc, "Personal Details")
-    for key, value in data.get('personal_details', {}).items():
-        doc.add_paragraph(f"{key}: {value}")
-
-    _add_section_heading(doc, "Declaration")
-    doc.add_paragraph(data.get('declaration', "I hereby declare that the information provided is true to the best of my knowledge."))
-    return doc
-
-def template_corporate(data):
-    doc = Document()
-    _add_heading(doc, data.get('name', ''), size=22, color=(0, 51, 102))
-    doc.add_paragraph(data.get('title', ''))
-    doc.add_paragraph(data.get('contact', ''))
-
-    _add_section_heading(doc, "Professional Summary", color=(0, 51, 102))
-    doc.add_paragraph(data.get('summary', ''))
-
-    _add_section_heading(doc, "Work History", color=(0, 51, 102))
-    _add_bullet_list(doc, data.get('experience', []))
-
-    _add_section_heading(doc, "Academic Background", color=(0, 51, 102))
-    _add_bullet_list(doc, data.get('education', []))
-
-    _add_section_heading(doc, "Core Competencies", color=(0, 51, 102))
-    _add_bullet_list(doc, data.get('skills', []))
-
-    _add_section_heading(doc, "Projects", color=(0, 51, 102))
-    _add_bullet_list(doc, data.get('projects', []))
-
-    _add_section_heading(doc, "Certifications", color=(255, 102, 0))
-    _add_bullet_list(doc, data.get('certificates', []))
-
-    _add_section_heading(doc, "Personal Details", color=(255, 102, 0))
-    for key, value in data.get('personal_details', {}).items():
-        doc.add_paragraph(f"{key}: {value}")
-
-    _add_section_heading(doc, "Declaration", color=(255, 102, 0))
-    doc.add_paragraph(data.get('declaration', "I hereby declare that the information provided is true to the best of my knowledge."))
-    return doc
-    
-def template_tech_modern(data):
-    doc = Document()
-    _add_heading(doc, data.get('name',''), size=24, color=(10, 102, 194))
-    doc.add_paragraph(data.get('title',''))
-    doc.add_paragraph(data.get('contact',''))
-    
-    _add_section_heading(doc, "Profile", color=(10, 102, 194))
-    doc.add_paragraph(data.get('summary',''))
-    
-    _add_section_heading(doc, "Projects & Experience", color=(10, 102, 194))
-    _add_bullet_list(doc, data.get('experience',[]))
-    _add_bullet_list(doc, data.get('projects',[]))
-
-    _add_section_heading(doc, "Education", color=(10, 102, 194))
-    _add_bullet_list(doc, data.get('education',[]))
-
-    _add_section_heading(doc, "Technical Skills", color=(10, 102, 194))
-    _add_bullet_list(doc, data.get('skills',[]))
-    
-    _add_section_heading(doc, "Certifications", color=(10, 102, 194))
-    _add_bullet_list(doc, data.get('certificates', []))
-
-    _add_section_heading(doc, "Personal Details", color=(255, 102, 0))
-    for key, value in data.get('personal_details', {}).items():
-        doc.add_paragraph(f"{key}: {value}")
-
-    _add_section_heading(doc, "Declaration", color=(255, 102, 0))
-    doc.add_paragraph(data.get('declaration', "I hereby declare that the information provided is true to the best of my knowledge."))
-    return doc
-
-def template_creative(data):
-    doc = Document()
-    _add_heading(doc, data.get('name',''), size=26, color=(255, 102, 0))
-    doc.add_paragraph(data.get('title',''))
-    doc.add_paragraph(data.get('contact',''))
-
-    _add_section_heading(doc, "About Me", color=(255, 102, 0))
-    doc.add_paragraph(data.get('summary',''))
-    
-    _add_section_heading(doc, "Experience Highlights", color=(255, 102, 0))
-    _add_bullet_list(doc, data.get('experience',[]))
-
-    _add_section_heading(doc, "Education Path", color=(255, 102, 0))
-    _add_bullet_list(doc, data.get('education',[]))
-
-    _add_section_heading(doc, "Skillset", color=(255, 102, 0))
-    _add_bullet_list(doc, data.get('skills',[]))
-
-    _add_section_heading(doc, "Projects", color=(255, 102, 0))
-    _add_bullet_list(doc, data.get('projects', []))
-
-    _add_section_heading(doc, "Certifications", color=(255, 102, 0))
-    _add_bullet_list(doc, data.get('certificates', []))
-
-    _add_section_heading(doc, "Personal Details", color=(255, 102, 0))
-    for key, value in data.get('personal_details', {}).items():
-        doc.add_paragraph(f"{key}: {value}")
-
-    _add_section_heading(doc, "Declaration", color=(255, 102, 0))
-    doc.add_paragraph(data.get('declaration', "I hereby declare that the information provided is true to the best of my knowledge."))
-    return doc
-
-def template_infographic(data):
-    doc = Document()
-    _add_heading(doc, data.get('name',''), size=24, color=(76, 175, 80))
-    doc.add_paragraph(data.get('title',''))
-    doc.add_paragraph(data.get('contact',''))
-
-    _add_section_heading(doc, "Snapshot", color=(76, 175, 80))
-    doc.add_paragraph(data.get('summary',''))
-    
-    _add_section_heading(doc, "Key Experiences", color=(76, 175, 80))
-    _add_bullet_list(doc, data.get('experience',[]))
-
-    _add_section_heading(doc, "Learning", color=(76, 175, 80))
-    _add_bullet_list(doc, data.get('education',[]))
+# ---------------- Utility helpers ----------------
+ALL_TEMPLATES = "All templates (ZIP)"
 
-    _add_section_heading(doc, "Proficiencies", color=(76, 175, 80))
-    _add_bullet_list(doc, data.get('skills',[]))
+SCORING_MODE_LABELS = {
+    "Skill-aware keywords": "profile",
+    "Keyword coverage (legacy)": "binary",
+    "BM25": "bm25",
+    "TF-IDF cosine": "tfidf",
+}
 
-    _add_section_heading(doc, "Projects", color=(76, 175, 80))
-    _add_bullet_list(doc, data.get('projects', []))
-    
-    _add_section_heading(doc, "Certifications", color=(76, 175, 80))
-    _add_bullet_list(doc, data.get('certificates', []))
+@st.cache_resource
+def load_idf_model(path=ATS_IDF_MODEL_PATH):
+    """Stored IDF weights for the weighted ATS modes, or None if not fitted yet."""
+    if not os.path.exists(path):
+        return None
+    return IdfModel.load(path)
 
-    _add_section_heading(doc, "Personal Info", color=(255, 102, 0))
-    for key, value in data.get('personal_details', {}).items():
-        doc.add_paragraph(f"{key}: {value}")
+@st.cache_resource(max_entries=256)
+def compile_job_profile(job_description):
+    """JobProfile compiled once per JD text and shared across reruns and sessions.
 
-    _add_section_heading(doc, "Declaration", color=(255, 102, 0))
-    doc.add_paragraph(data.get('declaration', "I hereby declare that the information provided is true to the best of my knowledge."))
-    return doc
+    cache_resource hands back the same object instead of unpickling a copy,
+    which would rebuild the matcher on every hit; callers must not mutate it.
+    """
+    return JobProfile.compile(job_description, load_idf_model())
 
-def template_bordered(data):
-    doc = Document()
-    doc.add_paragraph("_" * 100)
-    
-    _add_heading(doc, data.get('name',''), size=20, color=(0, 0, 0))
-    doc.add_paragraph(data.get('title',''))
-    doc.add_paragraph(data.get('contact',''))
-
-    _add_section_heading(doc, "Summary")
-    doc.add_paragraph(data.get('summary',''))
-    _add_section_heading(doc, "Experience")
-    _add_bullet_list(doc, data.get('experience',[]))
-    _add_section_heading(doc, "Education")
-    _add_bullet_list(doc, data.get('education',[]))
-    _add_section_heading(doc, "Skills")
-    _add_bullet_list(doc, data.get('skills',[]))
-    _add_section_heading(doc, "Projects")
-    _add_bullet_list(doc, data.get('projects',[]))
-    _add_section_heading(doc, "Certifications & Achievements")
-    _add_bullet_list(doc, data.get('certificates',[]))
-    _add_section_heading(doc, "Hobbies & Interests")
-    doc.add_paragraph(data.get('hobbies',''))
-    _add_section_heading(doc, "Personal Details")
-    for key, value in data.get('personal_details', {}).items():
-        doc.add_paragraph(f"{key}: {value}")
-    _add_section_heading(doc, "Declaration")
-    doc.add_paragraph(data.get('declaration',''))
-    
-    doc.add_paragraph("_" * 100)
-    return doc
-
-def template_side_panel(data):
-    doc = Document()
-    section = doc.sections[0]
-    section.top_margin = Inches(0.5)
-    section.bottom_margin = Inches(0.5)
-    section.left_margin = Inches(0.3)
-    section.right_margin = Inches(0.3)
-    
-    _add_heading(doc, data.get('name', ''), size=22, color=(33, 33, 33))
-    para = doc.add_paragraph(f"{data.get('title', '')}\n{data.get('contact', '')}")
-    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    table = doc.add_table(rows=1, cols=2)
-    table.columns[0].width = Inches(2.3)
-    table.columns[1].width = Inches(6.0)
-
-    left = table.cell(0, 0)
-    p = left.add_paragraph(); run = p.add_run("SKILLS"); run.bold = True
-    _add_bullet_list(left, data.get('skills', []))
-    p = left.add_paragraph(); run = p.add_run("HOBBIES & INTERESTS"); run.bold = True
-    left.add_paragraph(data.get('hobbies', ''))
-    p = left.add_paragraph(); run = p.add_run("PERSONAL DETAILS"); run.bold = True
-    for key, value in data.get('personal_details', {}).items():
-        left.add_paragraph(f"{key}: {value}")
-
-    right = table.cell(0, 1)
-    p = right.add_paragraph(); run = p.add_run("PROFILE SUMMARY"); run.bold = True
-    right.add_paragraph(data.get('summary', ''))
-    p = right.add_paragraph(); run = p.add_run("EXPERIENCE"); run.bold = True
-    _add_bullet_list(right, data.get('experience', []))
-    p = right.add_paragraph(); run = p.add_run("EDUCATION"); run.bold = True
-    _add_bullet_list(right, data.get('education', []))
-    p = right.add_paragraph(); run = p.add_run("PROJECTS"); run.bold = True
-    _add_bullet_list(right, data.get('projects', []))
-    p = right.add_paragraph(); run = p.add_run("CERTIFICATIONS"); run.bold = True
-    _add_bullet_list(right, data.get('certificates', []))
-    p = right.add_paragraph(); run = p.add_run("DECLARATION"); run.bold = True
-    right.add_paragraph(data.get('declaration', ''))
-    
-    return doc
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
-def template_academic(data):
-    doc = Document()
-    _add_heading(doc, data.get('name',''), size=18, color=(54, 69, 79))
-    doc.add_paragraph(data.get('title',''))
-    doc.add_paragraph(data.get('contact',''))
-    
-    _add_section_heading(doc, "Research Profile", color=(54, 69, 79))
-    doc.add_paragraph(data.get('summary',''))
-    _add_section_heading(doc, "Teaching / Research Experience", color=(54, 69, 79))
-    _add_bullet_list(doc, data.get('experience',[]))
-    _add_section_heading(doc, "Education", color=(54, 69, 79))
-    _add_bullet_list(doc, data.get('education',[]))
-    _add_section_heading(doc, "Publications & Skills", color=(54, 69, 79))
-    _add_bullet_list(doc, data.get('skills',[]))
-    _add_section_heading(doc, "Projects")
-    _add_bullet_list(doc, data.get('projects',[]))
-    _add_section_heading(doc, "Certifications & Achievements")
-    _add_bullet_list(doc, data.get('certificates',[]))
-    _add_section_heading(doc, "Hobbies & Interests")
-    doc.add_paragraph(data.get('hobbies',''))
-    _add_section_heading(doc, "Personal Details")
-    for key, value in data.get('personal_details', {}).items():
-        doc.add_paragraph(f"{key}: {value}")
-    _add_section_heading(doc, "Declaration")
-    doc.add_paragraph(data.get('declaration',''))
-    return doc
-
-def template_executive(data):
-    doc = Document()
-    _add_heading(doc, data.get('name', ''), size=20, color=(0,0,0))
-    doc.add_paragraph(data.get('title', ''))
-    doc.add_paragraph(data.get('contact', ''))
-    
-    _add_section_heading(doc, "Executive Summary", color=(80,80,80))
-    doc.add_paragraph(data.get('summary', ''))
-    _add_section_heading(doc, "Professional Experience", color=(80,80,80))
-    _add_bullet_list(doc, data.get('experience', []))
-    _add_section_heading(doc, "Education", color=(80,80,80))
-    _add_bullet_list(doc, data.get('education', []))
-    _add_section_heading(doc, "Key Skills", color=(80,80,80))
-    _add_bullet_list(doc, data.get('skills', []))
-    
-    return doc
-
-def template_simple_ats(data):
-    doc = Document()
-    doc.add_heading(data.get('name', 'Your Name'), level=1)
-    doc.add_paragraph(f"Title: {data.get('title', '')}")
-    doc.add_paragraph(f"Contact: {data.get('contact', '')}")
-    doc.add_heading("Summary", level=2)
-    doc.add_paragraph(data.get('summary', ''))
-    doc.add_heading("Experience", level=2)
-    for exp in data.get('experience', []):
-        doc.add_paragraph(exp, style="List Bullet")
-    doc.add_heading("Education", level=2)
-    for edu in data.get('education', []):
-        doc.add_paragraph(edu, style="List Bullet")
-    doc.add_heading("Skills", level=2)
-    doc.add_paragraph(", ".join(data.get('skills', [])))
-    doc.add_heading("Projects", level=2)
-    for proj in data.get('projects', []):
-        doc.add_paragraph(proj, style="List Bullet")
-    return doc
-
-
-# Template mapping
-TEMPLATE_MAP = {
-    "Minimal": template_minimal,
-    "Corporate": template_corporate,
-    "Tech Modern": template_tech_modern,
-    "Creative": template_creative,
-    "Infographic Style": template_infographic,
-    "Simple Bordered": template_bordered,
-    "Side Panel": template_side_panel,
-    "Academic / Research": template_academic,
-    "Executive": template_executive,
-    "Simple ATS-Friendly": template_simple_ats,
-}
+def download_button(data, filename="resume.docx", label="📥 Download Resume", mime=DOCX_MIME):
+    """Download button for a Document or raw bytes (DOCX or ZIP).
 
-# ---------------- Utility helpers ----------------
-def save_doc_to_link(doc, filename="resume.docx"):
-    bio = io.BytesIO()
-    doc.save(bio)
-    b64 = base64.b64encode(bio.getvalue()).decode()
-    link = f'<a href="data:application/vnd.openxmlformats-officedocument.wordprocessingml.document;base64,{b64}" download="{filename}" class="card-cta" style="text-decoration:none;display:inline-block;margin-top:12px;">📥 Download Resume</a>'
-    return link
+    Streamlit serves the bytes from its media endpoint when the button is
+    clicked; the page itself only carries a URL, not a base64 copy.
+    """
+    if not isinstance(data, bytes):
+        data = document_bytes(data)
+    return st.download_button(label, data, file_name=filename, mime=mime)
 
 def pretty_profile_html(profile):
     name = profile.get("name", "N/A")
@@ -429,8 +128,19 @@ def create_driver(headless=True, implicit_wait=10):
     opts.add_argument("--disable-blink-features=AutomationControlled")
     opts.add_argument("--window-size=1400,1000")
     opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36")
-    service = Service(ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=opts)
+    # chromedriver path is resolved once per machine, not per launch.
+    return start_chrome(opts)
+
+@st.cache_resource
+def driver_pool():
+    """Warm headless browsers shared by all sessions for the Selenium fallback.
+
+    One browser is started in the background when the pool is built, once
+    per process, so a first Selenium fetch does not pay Chrome's startup.
+    """
+    pool = DriverPool(create_driver)
+    pool.warm(1)
+    return pool
 
 def fetch_public_html(url, timeout=10):
     headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"}
@@ -442,28 +152,25 @@ def fetch_public_html(url, timeout=10):
         logging.info("requests fetch failed: %s", e)
     return None
 
-def fetch_profile_html_selenium(url, headless=True):
+def fetch_profile_html_selenium(url):
     """
     More robust Selenium fetcher that waits for the main profile element to load.
+    Uses a pooled, already running browser instead of starting Chrome per fetch.
     """
-    driver = None
     try:
-        driver = create_driver(headless=headless)
-        driver.get(url)
-        # Wait for the main profile container to be visible before parsing
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "main.scaffold-layout__main"))
-        )
-        html = driver.page_source
-        return html
+        with driver_pool().checkout() as driver:
+            driver.get(url)
+            try:
+                # Wait for the main profile container to be visible before parsing
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "main.scaffold-layout__main"))
+                )
+            except Exception as e:
+                logging.error(f"Selenium fetch failed: {e}")
+            return driver.page_source
     except Exception as e:
         logging.error(f"Selenium fetch failed: {e}")
-        if driver:
-            return driver.page_source
         return None
-    finally:
-        if driver:
-            driver.quit()
 
 
 def safe_text(sel):
@@ -529,19 +236,7 @@ def parse_linkedin_profile(html, profile_url):
     return {
         "name": name, "headline": headline, "location": location,
         "experiences": experiences, "educations": educations,
-        "skills": list(set(skills)), "profile_url": profile_url
-    }
-
-def build_template_data_from_profile(profile):
-    return {
-        "name": profile.get("name", ""),
-        "title": profile.get("headline", ""),
-        "contact": profile.get("location", ""),
-        "summary": profile.get("headline", ""),
-        "experience": [f"{exp.get('title', '')} at {exp.get('company', '')} ({exp.get('date_range', '')})\n{exp.get('summary', '')}" for exp in profile.get("experiences", [])],
-        "education": [f"{edu.get('degree', '')}, {edu.get('field','')} at {edu.get('school', '')} ({edu.get('date_range', '')})" for edu in profile.get("educations", [])],
-        "skills": profile.get("skills", []),
-        "projects": [], "certificates": [], "personal_details": {}, "declaration": "", "hobbies": ""
+        "skills": default_taxonomy().canonical_skills(skills), "profile_url": profile_url
     }
 
 # ---------------- UI styling and Layout ----------------
@@ -708,7 +403,8 @@ if st.session_state["page"] == "home":
 # --- CREATE PAGE ---
 if st.session_state["page"] == "create":
     st.markdown('<div class="big-card" style="max-width:1000px; margin:auto;"><h3 class="title">✍️ Create Your Resume</h3><p class="desc">Fill out the fields below and choose a template to generate your document.</p>', unsafe_allow_html=True)
-    with st.form("create_form"):
+    # No st.form: every committed edit reruns the page and refreshes the live preview.
+    with st.container():
         c1, c2 = st.columns(2)
         name = c1.text_input("Full Name", st.session_state.get("name", ""))
         title = c2.text_input("Job Title / Headline", st.session_state.get("title", ""))
@@ -723,27 +419,38 @@ if st.session_state["page"] == "create":
         hobbies = st.text_area("Hobbies & Interests", st.session_state.get("hobbies", ""), height=50)
         declaration = st.text_area("Declaration", st.session_state.get("declaration", "I hereby declare that the information provided is true to the best of my knowledge."), height=100)
 
-        template_choice = st.selectbox("Choose a Resume Template", list(TEMPLATE_MAP.keys()))
-        submitted = st.form_submit_button("Generate Resume Document")
-
-    if submitted:
-        data = {
-            "name": name, "title": title, "contact": contact, "summary": summary, "hobbies": hobbies, "declaration": declaration,
-            "experience": [e.strip() for e in experience.splitlines() if e.strip()],
-            "education": [e.strip() for e in education.splitlines() if e.strip()],
-            "skills": [s.strip() for s in skills.splitlines() if s.strip()],
-            "projects": [p.strip() for p in projects.splitlines() if p.strip()],
-            "certificates": [c.strip() for c in certificates.splitlines() if c.strip()],
-            # CORRECTED: Safely parse personal details
-            "personal_details": {
-                k.strip(): v.strip() for k, v in (
-                    line.split(":", 1) for line in personal_details.splitlines() if ":" in line
-                )
-            },
-        }
+        template_choice = st.selectbox("Choose a Resume Template", list(TEMPLATE_MAP.keys()) + [ALL_TEMPLATES])
+
+    data = {
+        "name": name, "title": title, "contact": contact, "summary": summary, "hobbies": hobbies, "declaration": declaration,
+        "experience": [e.strip() for e in experience.splitlines() if e.strip()],
+        "education": [e.strip() for e in education.splitlines() if e.strip()],
+        "skills": [s.strip() for s in skills.splitlines() if s.strip()],
+        "projects": [p.strip() for p in projects.splitlines() if p.strip()],
+        "certificates": [c.strip() for c in certificates.splitlines() if c.strip()],
+        # CORRECTED: Safely parse personal details
+        "personal_details": {
+            k.strip(): v.strip() for k, v in (
+                line.split(":", 1) for line in personal_details.splitlines() if ":" in line
+            )
+        },
+    }
+
+    preview_name = next(iter(TEMPLATE_MAP)) if template_choice == ALL_TEMPLATES else template_choice
+    with st.expander(f"👁️ Live preview — {preview_name}", expanded=True):
+        # Sections whose fields did not change come from the preview cache; no DOCX is built here.
+        st.markdown(render_html(TEMPLATE_MAP[preview_name], data), unsafe_allow_html=True)
+
+    if st.button("Generate Resume Document"):
         try:
-            doc = TEMPLATE_MAP[template_choice](data)
-            st.markdown(save_doc_to_link(doc, filename=f"{name.replace(' ','_')}_Resume.docx"), unsafe_allow_html=True)
+            if template_choice == ALL_TEMPLATES:
+                # Templates render in parallel worker processes.
+                zip_bytes = render_all_zip(data, prefix=f"{name.replace(' ','_')}_")
+                download_button(zip_bytes, f"{name.replace(' ','_')}_Resumes.zip", "📦 Download All Templates (ZIP)", "application/zip")
+            else:
+                # Identical inputs are served from the render cache without touching python-docx.
+                docx_bytes = render_bytes(template_choice, data)
+                download_button(docx_bytes, f"{name.replace(' ','_')}_Resume.docx")
             st.success("Your resume is ready for download!")
             st.balloons()
         except Exception as e:
@@ -755,8 +462,11 @@ if st.session_state["page"] == "linkedin":
     st.markdown('<div class="big-card" style="max-width:1000px;margin:auto;"><h3 class="title">🔗 Import from LinkedIn</h3>', unsafe_allow_html=True)
     st.info("ℹ️ Provide a **public** LinkedIn profile URL. Scraping is best-effort and may fail if LinkedIn blocks the request or changes its layout.")
     
+    # Builds (and warms) the shared pool on the first visit; later reruns get the cached one.
+    driver_pool()
+
     profile_url = st.text_input("LinkedIn Profile URL", placeholder="https://www.linkedin.com/in/your-profile-name")
-    template_choice = st.selectbox("Choose a Template For Your Resume", list(TEMPLATE_MAP.keys()))
+    template_choice = st.selectbox("Choose a Template For Your Resume", list(TEMPLATE_MAP.keys()) + [ALL_TEMPLATES])
     
     if st.button("Scrape & Generate Resume"):
         if not profile_url or "linkedin.com" not in profile_url:
@@ -784,11 +494,16 @@ if st.session_state["page"] == "linkedin":
                 st.markdown("### Scraped Data Preview")
                 st.markdown(pretty_profile_html(profile_data), unsafe_allow_html=True)
                 
-                template_data = build_template_data_from_profile(profile_data)
-                doc = TEMPLATE_MAP[template_choice](template_data)
+                template_data = profile_to_template_data(profile_data)
+                file_stem = template_data.get('name', 'resume').replace(' ','_')
                 
                 st.markdown("---")
-                st.markdown(save_doc_to_link(doc, filename=f"{template_data.get('name', 'resume').replace(' ','_')}_Resume.docx"), unsafe_allow_html=True)
+                if template_choice == ALL_TEMPLATES:
+                    zip_bytes = render_all_zip(template_data, prefix=f"{file_stem}_")
+                    download_button(zip_bytes, f"{file_stem}_Resumes.zip", "📦 Download All Templates (ZIP)", "application/zip")
+                else:
+                    docx_bytes = render_bytes(template_choice, template_data)
+                    download_button(docx_bytes, f"{file_stem}_Resume.docx")
                 st.balloons()
 
     st.markdown('</div>', unsafe_allow_html=True)
@@ -800,19 +515,14 @@ if st.session_state["page"] == "upload":
 
     if uploaded:
         try:
-            doc = Document(uploaded)
-            content = "\n".join([p.text for p in doc.paragraphs])
-            
+            # One line per paragraph; saving patches only the changed runs and keeps all formatting.
+            editor = DocxEditor(uploaded.getvalue())
+
             # CORRECTED: 'edited_text' is defined here by the text_area widget
-            edited_text = st.text_area("Edit resume text below", value=content, height=500)
+            edited_text = st.text_area("Edit resume text below", value=editor.text, height=500)
 
             if st.button("Save Edited Resume"):
-                new_doc = Document()
-                # CORRECTED: The loop correctly uses 'edited_text' which is now in scope
-                for line in edited_text.splitlines():
-                    new_doc.add_paragraph(line)
-
-                st.markdown(save_doc_to_link(new_doc, filename="Edited_Resume.docx"), unsafe_allow_html=True)
+                download_button(editor.save(edited_text), "Edited_Resume.docx")
                 st.success("Your edited resume is ready for download!")
 
         except Exception as e:
@@ -826,33 +536,114 @@ if st.session_state["page"] == "ats":
     c1, c2 = st.columns(2)
     uploaded_resume = c1.file_uploader("Upload Your Resume", type=["pdf", "docx"])
     job_description = c2.text_area("Paste Job Description", height=300, placeholder="Paste the full job description here...")
+    scoring_label = st.radio("Scoring Mode", list(SCORING_MODE_LABELS.keys()), horizontal=True)
+    scoring_mode = SCORING_MODE_LABELS[scoring_label]
+    tolerate_typos = scoring_mode == "profile" and st.checkbox("Tolerate typos (e.g. \"Postgress\" for PostgreSQL)")
 
     if st.button("Analyze Match Score"):
         if not uploaded_resume or not job_description:
             st.error("Please upload a resume and paste a job description.")
         else:
+            # Keep the extracted, tokenized resume across JD edits.
+            resume_key = content_key(uploaded_resume.getvalue())
+            cached = st.session_state.get("ats_resume")
             resume_text = ""
-            try:
-                if uploaded_resume.name.endswith(".pdf"):
-                    reader = PdfReader(uploaded_resume)
-                    resume_text = "".join(page.extract_text() for page in reader.pages)
-                else:
-                    doc = Document(uploaded_resume)
-                    resume_text = "\n".join([p.text for p in doc.paragraphs])
-            except Exception as e:
-                st.error(f"Error reading resume file: {e}")
+            if cached and cached["key"] == resume_key:
+                resume_text = cached["text"]
+            else:
+                try:
+                    resume_text = extract_text_cached(uploaded_resume)
+                    st.session_state["ats_resume"] = cached = {"key": resume_key, "text": resume_text, "match": None}
+                except Exception as e:
+                    st.error(f"Error reading resume file: {e}")
 
             if resume_text:
-                jd_words = set(w.lower() for w in job_description.split() if len(w) > 3 and w.isalpha())
-                resume_lower = resume_text.lower()
-                hits = [w for w in jd_words if w in resume_lower]
-                score = round(len(hits) / max(1, len(jd_words)) * 100)
+                if scoring_mode == "profile" and tolerate_typos:
+                    result = compile_job_profile(job_description).score(resume_text, fuzzy=True)
+                elif scoring_mode == "profile":
+                    if cached["match"] is None:
+                        cached["match"] = ResumeMatch.from_text(resume_text)
+                    match = cached["match"]
+                    first_run = not match.keywords
+                    result = match.update(compile_job_profile(job_description))
+                    if not first_run and (match.added or match.removed):
+                        st.caption(f"JD edit: +{len(match.added)} / -{len(match.removed)} keywords; only the new ones were matched.")
+                else:
+                    idf_model = load_idf_model() if scoring_mode != "binary" else None
+                    if scoring_mode != "binary" and idf_model is None:
+                        st.info(f"No IDF model found at {ATS_IDF_MODEL_PATH}; weights are estimated from this resume only. Fit one with `python -m ats.weighting`.")
+                    result = score_pair(resume_text, job_description, scoring_mode, idf_model)
+                hits, jd_words = result["matched"], result["keywords"]
+                score = result["score"]
                 
                 st.markdown(f'<div class="score-card"><h2>ATS Match Score: {score}%</h2><p>Found {len(hits)} of {len(jd_words)} potential keywords.</p></div>', unsafe_allow_html=True)
                 
                 c1, c2 = st.columns(2)
                 c1.success(f"**Matched Keywords:** {', '.join(hits)}")
-                missed = list(jd_words - set(hits))
+                missed = result["missed"]
                 c2.warning(f"**Keywords to Consider:** {', '.join(missed[:20])}") # Show top 20 missed
+                if result.get("fuzzy"):
+                    st.info(f"**Matched with a typo:** {', '.join(result['fuzzy'])}")
+
+    st.markdown("#### Bulk Screening")
+    bulk_zip = st.file_uploader("Upload a ZIP of resumes (PDF/DOCX)", type=["zip"], key="bulk_zip")
+    ranking = st.session_state.setdefault("bulk_ranking", LiveRanking())
+    b1, b2 = st.columns(2)
+    ingest_clicked = b1.button("Ingest & Rank Resumes")
+    rerank_clicked = b2.button("Update Ranking for Edited JD")
+
+    def show_ranking(top):
+        duplicates = st.session_state.get("bulk_duplicates", {})
+        if top:
+            st.table([{"Resume": t["doc_id"], "Match %": t["score"], "Keywords Found": t["hits"],
+                       "Near-duplicates": ", ".join(duplicates.get(t["doc_id"], []))} for t in top])
+        else:
+            st.info("No indexed resume shares a keyword with this job description.")
+
+    if ingest_clicked:
+        if not bulk_zip or not job_description:
+            st.error("Please upload a ZIP of resumes and paste a job description.")
+        else:
+            progress_bar = st.progress(0.0)
+            status = st.empty()
+            last_update = [0.0]
+
+            def show_progress(stats):
+                # Redraw at most ~5 times a second; every widget update is a websocket message.
+                if stats["seconds"] - last_update[0] < 0.2 and stats["done"] != stats["total"]:
+                    return
+                last_update[0] = stats["seconds"]
+                if stats["total"]:
+                    progress_bar.progress(min(1.0, stats["done"] / stats["total"]))
+                status.text(f"{stats['done']} / {stats['total'] or '?'} resumes · {stats['per_second']:.1f} resumes/s · {stats['errors']} errors")
+
+            sink = open_sink(INGEST_STORE_PATH)
+            dedup = Deduplicator()
+            try:
+                with ResumeIndex(RESUME_INDEX_PATH) as index:
+                    # Near-copies are stored but not indexed, so each group is scored once.
+                    stats = ingest(bulk_zip, sink, index, progress=show_progress, dedup=dedup)
+                    st.session_state["bulk_duplicates"] = dedup.clusters
+                    top = ranking.update(index, job_description, k=25)
+            except Exception as e:
+                st.error(f"Bulk ingestion failed: {e}")
+                top = None
+            finally:
+                sink.close()
+
+            if top is not None:
+                st.success(f"Ingested {stats['done']} resumes in {stats['seconds']:.1f}s ({stats['per_second']:.1f} resumes/s, {stats['errors']} unreadable, {stats['duplicates']} near-duplicates grouped).")
+                show_ranking(top)
+
+    if rerank_clicked:
+        if not job_description:
+            st.error("Please paste a job description.")
+        else:
+            # Only the posting lists of added/removed keywords are read.
+            with ResumeIndex(RESUME_INDEX_PATH) as index:
+                top = ranking.update(index, job_description, k=25)
+            if ranking.added or ranking.removed:
+                st.caption(f"Applied JD edit: +{len(ranking.added)} / -{len(ranking.removed)} keywords.")
+            show_ranking(top)
 
     st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
@@ -0,0 +1 @@
+from .scoring import score_many, score_pair
\ No newline at end of file
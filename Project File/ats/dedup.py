@@ -0,0 +1,127 @@
+# ats/dedup.py
+"""
+Near-duplicate resume detection with MinHash signatures and LSH.
+
+Each resume text becomes a set of 3-word shingles summarized by a 128-value
+MinHash signature; the fraction of equal values estimates the Jaccard
+similarity of two resumes. Signatures are cut into 16 bands of 8 values
+and every band is a bucket key, so a new resume is only compared with the
+few earlier resumes that share a bucket. Adding a resume is constant time
+on average, which keeps 100k+ resume batches far from pairwise comparison.
+
+Clusters are stars: the first resume of a cluster is its representative
+and later near-copies (estimated Jaccard >= DEDUP_THRESHOLD) are attached
+to it, so scoring only needs to run on representatives.
+
+Usage:
+    dedup = Deduplicator()
+    rep = dedup.add("cv_2.pdf", text)   # "cv_1.pdf" if it is a near-copy
+"""
+import os
+import re
+import zlib
+
+import numpy as np
+
+DEDUP_THRESHOLD = float(os.environ.get("DEDUP_THRESHOLD", "0.8"))
+NUM_PERM = 128
+BANDS = 16
+SHINGLE_WORDS = 3
+
+_WORD = re.compile(r"\w+")
+_rng = np.random.default_rng(20240607)
+_A = _rng.integers(1, 2 ** 63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64)
+_MIX = _rng.integers(1, 2 ** 63, SHINGLE_WORDS, dtype=np.uint64) | np.uint64(1)
+
+
+def shingle_hashes(text, k=SHINGLE_WORDS):
+    """Distinct 64-bit hashes of the k-word shingles of a text (stable across processes)."""
+    words = _WORD.findall(text.lower())
+    if not words:
+        return np.zeros(0, dtype=np.uint64)
+    h = np.fromiter((zlib.crc32(w.encode("utf-8")) for w in words), dtype=np.uint64, count=len(words))
+    if len(h) < k:
+        return np.unique(h)
+    n = len(h) - k + 1
+    out = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        out ^= h[j:j + n] * _MIX[j]
+    return np.unique(out)
+
+
+def minhash(text):
+    """uint32 MinHash signature of a text, or None if it has no words."""
+    shingles = shingle_hashes(text)
+    if not len(shingles):
+        return None
+    # Multiply-shift hashing; uint64 arithmetic wraps around.
+    hashed = (_A[:, None] * shingles[None, :] + _B[:, None]) >> np.uint64(32)
+    return hashed.min(axis=1).astype(np.uint32)
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+
+class Deduplicator:
+    """Groups near-duplicate resumes as they are added."""
+
+    def __init__(self, threshold=DEDUP_THRESHOLD, bands=BANDS):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self.keys = []            # representative keys, by position
+        self._signatures = []     # their signatures
+        self._buckets = [{} for _ in range(bands)]
+        self.clusters = {}        # representative key -> [duplicate keys]
+        self._rep = {}            # duplicate key -> representative key
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def duplicates(self):
+        return len(self._rep)
+
+    def _band_keys(self, sig):
+        r = self.rows
+        return [hash(sig[b * r:(b + 1) * r].tobytes()) for b in range(self.bands)]
+
+    def add(self, key, text=None, signature=None):
+        """Register a resume; returns the key of its cluster representative.
+
+        That is `key` itself for a new cluster. Resumes without any words
+        are never grouped.
+        """
+        sig = signature if signature is not None else minhash(text or "")
+        if sig is None:
+            self.clusters.setdefault(key, [])
+            return key
+        band_keys = self._band_keys(sig)
+        best, best_sim = None, self.threshold
+        seen = set()
+        for bucket, band_key in zip(self._buckets, band_keys):
+            pos = bucket.get(band_key)
+            if pos is None or pos in seen:
+                continue
+            seen.add(pos)
+            sim = similarity(sig, self._signatures[pos])
+            if sim >= best_sim:
+                best, best_sim = pos, sim
+        if best is not None:
+            rep = self.keys[best]
+            self.clusters[rep].append(key)
+            self._rep[key] = rep
+            return rep
+        pos = len(self.keys)
+        self.keys.append(key)
+        self._signatures.append(sig)
+        self.clusters[key] = []
+        for bucket, band_key in zip(self._buckets, band_keys):
+            bucket.setdefault(band_key, pos)
+        return key
+
+    def representative(self, key):
+        return self._rep.get(key, key)
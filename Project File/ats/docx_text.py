@@ -0,0 +1,104 @@
+# ats/docx_text.py
+"""
+Streaming DOCX text extraction.
+
+`Document(f).paragraphs` parses the whole package into python-docx objects
+and only returns top-level body paragraphs, so text in tables (the
+two-column templates keep skills and experience there), headers, footers
+and text boxes is lost. This module reads `word/document.xml` and the
+header/footer parts straight from the ZIP with lxml's iterparse and yields
+one line per paragraph in reading order: headers, then the body (table
+cells and text boxes where they occur), then footers. Finished elements
+are cleared as the parser goes, so memory stays flat however long the
+document is.
+
+Usage:
+    text = extract_docx_text(data)
+"""
+import io
+import zipfile
+import posixpath
+
+from lxml import etree
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+_OFFICE_DOCUMENT = _RT + "officeDocument"
+
+_P, _R, _T, _TAB, _BR, _CR = _W + "p", _W + "r", _W + "t", _W + "tab", _W + "br", _W + "cr"
+# Elements dropped from the tree once parsed.
+_FINISHED = {_P, _W + "tr", _W + "tbl"}
+# Only these reach Python; lxml skips events for everything else.
+_EVENT_TAGS = [_P, _T, _TAB, _BR, _CR, _MC_FALLBACK, *_FINISHED - {_P}]
+
+
+def _iter_part_text(stream):
+    """Paragraph texts of one part, in document order."""
+    paragraphs = []  # text buffers of the open (possibly nested) paragraphs
+    fallback = 0  # depth inside mc:Fallback, which repeats the mc:Choice content
+    events = etree.iterparse(stream, events=("start", "end"), tag=_EVENT_TAGS, resolve_entities=False, no_network=True)
+    for event, elem in events:
+        tag = elem.tag
+        if event == "start":
+            if tag == _MC_FALLBACK:
+                fallback += 1
+            elif tag == _P and not fallback:
+                paragraphs.append([])
+            continue
+        if tag == _MC_FALLBACK:
+            fallback -= 1
+        elif fallback or not paragraphs:
+            pass
+        elif tag == _T:
+            paragraphs[-1].append(elem.text or "")
+        elif tag == _TAB and elem.getparent().tag == _R:  # not a tab stop in w:tabs
+            paragraphs[-1].append("\t")
+        elif tag in (_BR, _CR):
+            paragraphs[-1].append("\n")
+        elif tag == _P:
+            yield "".join(paragraphs.pop())
+        if tag in _FINISHED:
+            elem.clear()
+            parent = elem.getparent()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def _parts(zf):
+    """Names of the header parts, the main document and the footer parts."""
+    document = "word/document.xml"
+    with zf.open("_rels/.rels") as f:
+        for rel in etree.parse(f).getroot().iter(_REL):
+            if rel.get("Type") == _OFFICE_DOCUMENT:
+                document = posixpath.normpath(rel.get("Target").lstrip("/"))
+    folder, name = posixpath.split(document)
+    headers, footers = [], []
+    rels = posixpath.join(folder, "_rels", name + ".rels")
+    if rels in zf.namelist():
+        with zf.open(rels) as f:
+            for rel in etree.parse(f).getroot().iter(_REL):
+                target = posixpath.normpath(posixpath.join(folder, rel.get("Target", "")))
+                if rel.get("Type") == _RT + "header":
+                    headers.append(target)
+                elif rel.get("Type") == _RT + "footer":
+                    footers.append(target)
+    return headers + [document] + footers
+
+
+def iter_docx_paragraphs(source):
+    """Yield the text of every paragraph of a DOCX (path, file object or bytes)."""
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    with zipfile.ZipFile(source) as zf:
+        names = set(zf.namelist())
+        for part in _parts(zf):
+            if part in names:
+                with zf.open(part) as stream:
+                    yield from _iter_part_text(stream)
+
+
+def extract_docx_text(source):
+    """Plain text of a DOCX, one line per paragraph."""
+    return "\n".join(iter_docx_paragraphs(source))
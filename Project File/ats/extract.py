@@ -0,0 +1,78 @@
+# ats/extract.py
+"""
+Resume text extraction shared by the ATS page and the batch scoring CLI.
+
+`extract_text_cached` keys extracted text by the SHA-256 of the file bytes,
+so re-analysing the same resume (Streamlit reruns, other job descriptions,
+other sessions) skips parsing. The in-process LRU is always on; setting
+EXTRACT_CACHE_PATH adds a SQLite layer shared by worker processes.
+"""
+import io
+import os
+
+from ats.docx_text import extract_docx_text
+from ats.pdf import extract_pdf_text, PDF_BACKEND, PDF_MAX_PAGES, PDF_MAX_CHARS
+from content_cache import TieredCache, content_key
+
+EXTRACT_CACHE_PATH = os.environ.get("EXTRACT_CACHE_PATH")
+EXTRACT_CACHE_MEMORY_MB = int(os.environ.get("EXTRACT_CACHE_MEMORY_MB", "64"))
+EXTRACT_CACHE_DISK_MB = int(os.environ.get("EXTRACT_CACHE_DISK_MB", "512"))
+
+# Bump when extraction output changes so stale cached text is not reused.
+EXTRACTOR_VERSION = 3
+
+_cache = TieredCache(
+    EXTRACT_CACHE_MEMORY_MB * 1024 * 1024,
+    EXTRACT_CACHE_PATH,
+    EXTRACT_CACHE_DISK_MB * 1024 * 1024,
+)
+
+
+def extract_text(source, name=None):
+    """Return the plain text of a PDF, DOCX or TXT resume.
+
+    `source` is a path or a file-like object (e.g. a Streamlit upload).
+    `name` is only needed for file-like objects without a `.name`.
+    """
+    kind = _kind(name or getattr(source, "name", None) or str(source))
+    if kind == "pdf":
+        return extract_pdf_text(read_bytes(source), max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS)
+    if kind == "txt":
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        data = source.read()
+        return data.decode("utf-8", errors="ignore") if isinstance(data, bytes) else data
+    # Streams the XML; includes tables, headers, footers and text boxes.
+    return extract_docx_text(source)
+
+
+def _kind(name):
+    name = name.lower()
+    if name.endswith(".pdf"):
+        return "pdf"
+    if name.endswith(".txt"):
+        return "txt"
+    return "docx"
+
+
+def read_bytes(source):
+    """Raw bytes of a path or file-like object (rewound first when possible)."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source.read()
+
+
+def extract_text_cached(source, name=None, cache=None):
+    """`extract_text` memoized by the content hash of the file."""
+    cache = cache or _cache
+    name = name or getattr(source, "name", None) or str(source)
+    data = read_bytes(source)
+    kind = _kind(name)
+    key = content_key(data, kind, EXTRACTOR_VERSION, PDF_BACKEND, PDF_MAX_PAGES, PDF_MAX_CHARS)
+    return cache.get_or_compute(key, lambda: extract_text(io.BytesIO(data), "resume." + kind))
@@ -0,0 +1,122 @@
+# ats/fuzzy.py
+"""
+Typo-tolerant term lookup with a SymSpell deletion index.
+
+The index is built once over the job-description vocabulary: every JD word
+(and every one-word alias of a JD skill, so "javascipt" can reach
+JavaScript) is stored under each string obtained by deleting up to
+`max_distance` characters from it. A resume token is looked up by
+generating its own deletions, so a lookup costs a few dozen dict probes
+whatever the number of keywords, and candidates are confirmed with a
+bounded edit distance. Lookups are memoized, and resume tokens repeat a lot.
+
+Short words are never corrected ("java" vs "lava"): distance 1 needs
+FUZZY_MIN_LENGTH characters, distance 2 needs FUZZY_MIN_LENGTH_2.
+"""
+import os
+
+FUZZY_MIN_LENGTH = int(os.environ.get("FUZZY_MIN_LENGTH", "5"))
+FUZZY_MIN_LENGTH_2 = int(os.environ.get("FUZZY_MIN_LENGTH_2", "9"))
+FUZZY_CACHE_SIZE = 200000  # memoized lookups kept per index
+
+
+def allowed_distance(word, max_distance=2):
+    if len(word) >= FUZZY_MIN_LENGTH_2:
+        return min(2, max_distance)
+    if len(word) >= FUZZY_MIN_LENGTH:
+        return min(1, max_distance)
+    return 0
+
+
+def deletions(word, distance):
+    """`word` and every string made by deleting up to `distance` characters."""
+    out = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        out |= frontier
+    return out
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance, or limit + 1 once it exceeds `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class FuzzyIndex:
+    """Maps misspelled tokens to JD terms (str tokens or taxonomy skill ids)."""
+
+    def __init__(self, terms, taxonomy=None, max_distance=2):
+        self.max_distance = max_distance
+        self._words = {}  # correct spelling -> JD term
+        skills = {t for t in terms if isinstance(t, int)}
+        for term in terms:
+            if isinstance(term, str):
+                self._words.setdefault(term, term)
+        if skills and taxonomy is not None:
+            for word, sid in taxonomy.word_aliases().items():
+                if sid in skills:
+                    self._words.setdefault(word, sid)
+        self._deletes = {}
+        for word in self._words:
+            for variant in deletions(word, allowed_distance(word, max_distance)):
+                self._deletes.setdefault(variant, []).append(word)
+        self._seen = {}
+
+    def __len__(self):
+        return len(self._words)
+
+    def lookup(self, token):
+        """(JD term, corrected word, distance) for a near-miss token, else None.
+
+        Exact spellings return None: they are the exact matcher's job.
+        """
+        if not isinstance(token, str):
+            return None  # already a taxonomy skill
+        try:
+            return self._seen[token]
+        except KeyError:
+            pass
+        result = None
+        limit = allowed_distance(token, self.max_distance)
+        if limit and token not in self._words:
+            best = None
+            for variant in deletions(token, limit):
+                for word in self._deletes.get(variant, ()):
+                    word_limit = min(limit, allowed_distance(word, self.max_distance))
+                    d = edit_distance(token, word, word_limit)
+                    if d <= word_limit and (best is None or (d, word) < best):
+                        best = (d, word)
+            if best is not None:
+                result = (self._words[best[1]], best[1], best[0])
+        if len(self._seen) >= FUZZY_CACHE_SIZE:
+            self._seen.clear()
+        self._seen[token] = result
+        return result
+
+    def correct(self, tokens):
+        """(corrected tokens, {position: original token}) for a token list."""
+        fixed = {}
+        out = list(tokens)
+        seen = self._seen
+        for i, token in enumerate(tokens):
+            if token.__class__ is int:
+                continue
+            hit = seen[token] if token in seen else self.lookup(token)
+            if hit is not None:
+                out[i] = hit[0]
+                fixed[i] = token
+        return out, fixed
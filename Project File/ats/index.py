@@ -0,0 +1,283 @@
+# ats/index.py
+"""
+Persistent inverted index over the resume corpus.
+
+Each ingested resume is tokenized once and stored as postings
+(term -> resume id, term frequency) in a SQLite file. A job description only
+reads the posting lists of its own keywords, so resumes that share no keyword
+with it are never touched, and the best k candidates are picked with a heap.
+
+Unlike the ATS page, the index matches whole words: "java" does not hit a
+resume that only says "javascript".
+
+A LiveRanking keeps the per-resume hit counts of the last JD, so editing
+the JD only reads the posting lists of the keywords that were added or
+removed.
+
+Usage:
+    python -m ats.index add cv1.pdf cv2.docx
+    python -m ats.index search backend_jd.txt -k 20
+"""
+import os
+import sys
+import heapq
+import sqlite3
+import logging
+import argparse
+from array import array
+from collections import Counter, defaultdict
+
+from ats.scoring import extract_keywords, resume_term_counts
+
+RESUME_INDEX_PATH = os.environ.get("RESUME_INDEX_PATH", "resume_index.sqlite3")
+
+# Posting lists are appended as one segment per flush; `compact` merges them.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY,
+    doc_id TEXT UNIQUE NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    segment INTEGER NOT NULL,
+    ids BLOB NOT NULL,
+    tfs BLOB NOT NULL,
+    PRIMARY KEY (term, segment)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS deleted (
+    id INTEGER PRIMARY KEY
+);
+"""
+
+
+class ResumeIndex:
+    """Keyword -> posting list index stored in a SQLite file.
+
+    Each posting list is a pair of packed uint32 arrays (resume ids and term
+    frequencies). Re-indexing or removing a resume leaves a tombstone that
+    searches skip until the next `compact`.
+    """
+
+    def __init__(self, path=RESUME_INDEX_PATH, batch_size=2000):
+        self.path = path
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+        self._deleted = set(r[0] for r in self.conn.execute("SELECT id FROM deleted"))
+        self._segment = self.conn.execute("SELECT COALESCE(MAX(segment), -1) + 1 FROM postings").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def stamp(self):
+        """Changes whenever resumes are added or removed."""
+        max_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM resumes").fetchone()[0]
+        return self.path, max_id, len(self._deleted)
+
+    def add(self, doc_id, resume_text):
+        """Index (or re-index) one resume under `doc_id`."""
+        self.add_many([(doc_id, resume_text)])
+
+    def add_many(self, docs):
+        """Index an iterable of (doc_id, resume_text) pairs.
+
+        Postings are buffered in memory and written every `batch_size`
+        resumes, so memory stays bounded for any number of documents.
+        """
+        n = 0
+        buffer = defaultdict(lambda: (array("I"), array("I")))
+        with self.conn:
+            for doc_id, text in docs:
+                counts = resume_term_counts(text)
+                self._delete(doc_id)
+                rid = self.conn.execute(
+                    "INSERT INTO resumes (id, doc_id, length) VALUES (?, ?, ?)",
+                    (self._next_id(), doc_id, sum(counts.values())),
+                ).lastrowid
+                for term, tf in counts.items():
+                    ids, tfs = buffer[term]
+                    ids.append(rid)
+                    tfs.append(tf)
+                n += 1
+                if n % self.batch_size == 0:
+                    self._flush(buffer)
+                    buffer.clear()
+            self._flush(buffer)
+        return n
+
+    def _next_id(self):
+        # SQLite would reuse the highest id once it is deleted; that id stays
+        # tombstoned (and in old postings) until `compact`, so skip past it.
+        return self.conn.execute(
+            "SELECT MAX(COALESCE((SELECT MAX(id) FROM resumes), 0), COALESCE((SELECT MAX(id) FROM deleted), 0)) + 1"
+        ).fetchone()[0]
+
+    def _flush(self, buffer):
+        if not buffer:
+            return
+        self.conn.executemany(
+            "INSERT INTO postings (term, segment, ids, tfs) VALUES (?, ?, ?, ?)",
+            ((term, self._segment, ids.tobytes(), tfs.tobytes()) for term, (ids, tfs) in buffer.items()),
+        )
+        self._segment += 1
+
+    def remove(self, doc_id):
+        with self.conn:
+            self._delete(doc_id)
+
+    def _delete(self, doc_id):
+        row = self.conn.execute("SELECT id FROM resumes WHERE doc_id = ?", (doc_id,)).fetchone()
+        if row:
+            self.conn.execute("DELETE FROM resumes WHERE id = ?", row)
+            self.conn.execute("INSERT OR IGNORE INTO deleted (id) VALUES (?)", row)
+            self._deleted.add(row[0])
+
+    def compact(self):
+        """Merge posting segments into one per term and drop tombstones."""
+        with self.conn:
+            terms = [r[0] for r in self.conn.execute("SELECT DISTINCT term FROM postings")]
+            for term in terms:
+                ids, tfs = self.postings(term)
+                self.conn.execute("DELETE FROM postings WHERE term = ?", (term,))
+                if ids:
+                    self.conn.execute(
+                        "INSERT INTO postings (term, segment, ids, tfs) VALUES (?, 0, ?, ?)",
+                        (term, ids.tobytes(), tfs.tobytes()),
+                    )
+            self.conn.execute("DELETE FROM deleted")
+        self._deleted.clear()
+        self._segment = 1
+        self.conn.execute("VACUUM")
+
+    def postings(self, term):
+        """(ids, tfs) arrays of live resumes containing `term`."""
+        ids, tfs = array("I"), array("I")
+        for seg_ids, seg_tfs in self.conn.execute(
+            "SELECT ids, tfs FROM postings WHERE term = ? ORDER BY segment", (term,)
+        ):
+            ids.frombytes(seg_ids)
+            tfs.frombytes(seg_tfs)
+        if self._deleted:
+            keep = [i for i, rid in enumerate(ids) if rid not in self._deleted]
+            ids = array("I", (ids[i] for i in keep))
+            tfs = array("I", (tfs[i] for i in keep))
+        return ids, tfs
+
+    def search(self, job_description, k=10):
+        """Top-k resumes for a job description.
+
+        Returns a list of dicts with `doc_id`, `score` (percentage of JD
+        keywords found) and `hits`, best first.
+        """
+        keywords = sorted(extract_keywords(job_description))
+        if not keywords:
+            return []
+        return self.top(self.hits(keywords), len(keywords), k)
+
+    def hits(self, terms):
+        """Counter of resume id -> number of `terms` it contains (tombstones included)."""
+        hits = Counter()
+        terms = list(terms)
+        if not terms:
+            return hits
+        placeholders = ",".join("?" * len(terms))
+        for (blob,) in self.conn.execute(f"SELECT ids FROM postings WHERE term IN ({placeholders})", terms):
+            ids = array("I")
+            ids.frombytes(blob)
+            hits.update(ids)
+        return hits
+
+    def top(self, hits, n_keywords, k=10):
+        """Best k live resumes of a hit Counter, in the `search` result format."""
+        live = ((rid, n) for rid, n in hits.items() if n > 0 and rid not in self._deleted)
+        top = heapq.nlargest(k, live, key=lambda item: (item[1], -item[0]))
+        if not top:
+            return []
+        names = dict(self.conn.execute(
+            f"SELECT id, doc_id FROM resumes WHERE id IN ({','.join('?' * len(top))})",
+            [rid for rid, _ in top],
+        ))
+        return [
+            {"doc_id": names[rid], "score": round(n / n_keywords * 100), "hits": n}
+            for rid, n in top
+        ]
+
+
+class LiveRanking:
+    """Candidate ranking that follows JD edits incrementally.
+
+    `update` diffs the new JD keywords against the previous ones and only
+    applies the posting lists of added and removed keywords to the stored
+    hit counts; no resume text is read. If the index has changed since the
+    last update, the counts are rebuilt from scratch.
+    """
+
+    def __init__(self):
+        self.keywords = frozenset()
+        self.hits = Counter()
+        self.added = self.removed = ()
+        self._stamp = None
+
+    def update(self, index, job_description, k=10):
+        """Top-k resumes for the edited JD (see ResumeIndex.search)."""
+        keywords = frozenset(extract_keywords(job_description))
+        stamp = index.stamp()
+        if stamp != self._stamp:
+            self.keywords, self.hits, self._stamp = frozenset(), Counter(), stamp
+        added, removed = keywords - self.keywords, self.keywords - keywords
+        if added:
+            self.hits.update(index.hits(added))
+        if removed:
+            self.hits.subtract(index.hits(removed))
+            self.hits = +self.hits
+        self.keywords = keywords
+        self.added, self.removed = sorted(added), sorted(removed)
+        if not keywords:
+            return []
+        return index.top(self.hits, len(keywords), k)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and query the resume keyword index.")
+    parser.add_argument("--index", default=RESUME_INDEX_PATH, help="SQLite index file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    add = sub.add_parser("add", help="Add resume files to the index")
+    add.add_argument("files", nargs="+")
+    search = sub.add_parser("search", help="Rank indexed resumes for a job description file")
+    search.add_argument("jd")
+    search.add_argument("-k", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    with ResumeIndex(args.index) as index:
+        if args.command == "add":
+            from ats.extract import extract_text_cached
+
+            def docs():
+                for path in args.files:
+                    try:
+                        yield path, extract_text_cached(path)
+                    except Exception as e:
+                        logging.error("Could not read %s: %s", path, e)
+
+            n = index.add_many(docs())
+            logging.info("Indexed %d resumes (%d total) -> %s", n, len(index), args.index)
+        else:
+            with open(args.jd, encoding="utf-8") as f:
+                jd = f.read()
+            for hit in index.search(jd, k=args.k):
+                print(f"{hit['score']}%\t{hit['hits']}\t{hit['doc_id']}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sys.exit(main())
@@ -0,0 +1,260 @@
+# ats/ingest.py
+"""
+Streaming bulk ingestion of resumes from a ZIP archive or a directory.
+
+Entries are read one at a time, extracted on a worker pool and written to a
+JSONL or SQLite store (and optionally the ResumeIndex) as results arrive.
+At most `2 * workers` entries are in flight, so memory stays flat however
+large the archive is. With a Deduplicator (ats/dedup.py), near-copies of an
+earlier resume are recorded with `duplicate_of` and kept out of the index
+and pool, so each cluster is scored once.
+
+Usage:
+    python -m ats.ingest resumes.zip --out ingested.jsonl --index resume_index.sqlite3
+    python -m ats.ingest resumes.zip --out ingested.jsonl --pool candidates.npz
+    python -m ats.ingest resumes.zip --out ingested.jsonl --index resume_index.sqlite3 --dedup
+    python -m ats.ingest ./resumes/ --out ingested.sqlite3
+"""
+import io
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import zipfile
+import argparse
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from ats import pdf
+from ats.extract import extract_text_cached
+
+RESUME_EXTENSIONS = (".pdf", ".docx", ".txt")
+INGEST_WORKERS = int(os.environ.get("INGEST_WORKERS", "0")) or os.cpu_count() or 1
+INGEST_STORE_PATH = os.environ.get("INGEST_STORE_PATH", "ingested_resumes.jsonl")
+
+
+def iter_entries(source):
+    """Yield (name, read) for every resume in a ZIP (path or file object) or directory.
+
+    `read()` returns the entry's bytes; nothing is loaded until it is called.
+    """
+    if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+        for root, _, files in os.walk(source):
+            for filename in sorted(files):
+                if filename.lower().endswith(RESUME_EXTENSIONS):
+                    path = os.path.join(root, filename)
+                    yield os.path.relpath(path, source), lambda path=path: _read_file(path)
+        return
+    with zipfile.ZipFile(source) as zf:
+        for info in zf.infolist():
+            if info.is_dir() or not info.filename.lower().endswith(RESUME_EXTENSIONS):
+                continue
+            if os.path.basename(info.filename).startswith(("._", "~$")):
+                continue  # macOS resource forks and Word lock files
+            yield info.filename, lambda info=info: zf.read(info)
+
+
+def _read_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def count_entries(source):
+    """Number of resumes in a ZIP, or None for directories (not walked twice)."""
+    if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+        return None
+    with zipfile.ZipFile(source) as zf:
+        n = sum(1 for info in zf.infolist()
+                if not info.is_dir() and info.filename.lower().endswith(RESUME_EXTENSIONS)
+                and not os.path.basename(info.filename).startswith(("._", "~$")))
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return n
+
+
+def extract_entry(name, data):
+    """Extraction record for one entry; errors are recorded, not raised."""
+    record = {
+        "name": name,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "size": len(data),
+        "text": "",
+        "error": None,
+        "duplicate_of": None,
+    }
+    try:
+        record["text"] = extract_text_cached(io.BytesIO(data), name)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["chars"] = len(record["text"])
+    return record
+
+
+class JsonlSink:
+    """Append one JSON object per extracted resume."""
+
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, "a", encoding="utf-8")
+
+    def write(self, record):
+        self._f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self._f.close()
+
+
+class SqliteSink:
+    """Store extracted resumes in a SQLite table keyed by entry name."""
+
+    def __init__(self, path, commit_every=200):
+        self.path = path
+        self.commit_every = commit_every
+        self._pending = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS resume_texts ("
+            "name TEXT PRIMARY KEY, sha256 TEXT, size INTEGER, chars INTEGER, error TEXT, text TEXT, duplicate_of TEXT)"
+        )
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(resume_texts)")}
+        if "duplicate_of" not in columns:
+            self.conn.execute("ALTER TABLE resume_texts ADD COLUMN duplicate_of TEXT")
+
+    def write(self, record):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO resume_texts (name, sha256, size, chars, error, text, duplicate_of) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (record["name"], record["sha256"], record["size"], record["chars"], record["error"], record["text"],
+             record["duplicate_of"]),
+        )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.conn.commit()
+            self._pending = 0
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def open_sink(path):
+    """JsonlSink or SqliteSink depending on the file extension."""
+    if path.endswith((".sqlite", ".sqlite3", ".db")):
+        return SqliteSink(path)
+    return JsonlSink(path)
+
+
+def _init_worker():
+    # Files are already spread over the workers; no nested PDF page pools.
+    pdf.PDF_WORKERS = 1
+
+
+def iter_records(source, workers=None):
+    """Yield extraction records for `source` as workers finish them."""
+    workers = workers or INGEST_WORKERS
+    if workers <= 1:
+        for name, read in iter_entries(source):
+            yield extract_entry(name, read())
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending = set()
+        for name, read in iter_entries(source):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(extract_entry, name, read()))
+        for future in pending:
+            yield future.result()
+
+
+def ingest(source, sink, index=None, workers=None, progress=None, pool=None, dedup=None):
+    """Extract every resume in `source` into `sink` (and `index`/`pool` if given).
+
+    `progress(stats)` is called after each stored resume with a dict holding
+    `done`, `total` (None if unknown), `errors`, `duplicates`, `bytes`,
+    `seconds` and `per_second`. Returns the final stats.
+    """
+    stats = {"done": 0, "total": count_entries(source), "errors": 0, "duplicates": 0,
+             "bytes": 0, "seconds": 0.0, "per_second": 0.0}
+    start = time.perf_counter()
+
+    def stored():
+        for record in iter_records(source, workers):
+            if dedup is not None and not record["error"]:
+                rep = dedup.add(record["name"], record["text"])
+                if rep != record["name"]:
+                    record["duplicate_of"] = rep
+            sink.write(record)
+            stats["done"] += 1
+            stats["errors"] += bool(record["error"])
+            stats["duplicates"] += record["duplicate_of"] is not None
+            stats["bytes"] += record["size"]
+            stats["seconds"] = time.perf_counter() - start
+            stats["per_second"] = stats["done"] / max(stats["seconds"], 1e-9)
+            if progress:
+                progress(stats)
+            if not record["error"] and record["duplicate_of"] is None:
+                if pool is not None:
+                    pool.add(record["name"], record["text"])
+                yield record["name"], record["text"]
+
+    if index is not None:
+        # The index buffers postings and writes them in batches.
+        index.add_many(stored())
+    else:
+        for _ in stored():
+            pass
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-extract resumes from a ZIP or directory.")
+    parser.add_argument("source", help="ZIP file or directory of PDF/DOCX/TXT resumes")
+    parser.add_argument("--out", default=INGEST_STORE_PATH, help="JSONL or .sqlite3 output store")
+    parser.add_argument("--index", help="Also add resumes to this ResumeIndex file")
+    parser.add_argument("--pool", help="Also build an ats.vocabulary CandidatePool and save it here (.npz)")
+    parser.add_argument("--dedup", action="store_true", help="Group near-duplicate resumes and only index one per group")
+    parser.add_argument("--workers", type=int, default=INGEST_WORKERS)
+    args = parser.parse_args(argv)
+
+    index = None
+    if args.index:
+        from ats.index import ResumeIndex
+
+        index = ResumeIndex(args.index)
+
+    pool = None
+    if args.pool:
+        from ats.vocabulary import CandidatePool
+
+        pool = CandidatePool()
+
+    dedup = None
+    if args.dedup:
+        from ats.dedup import Deduplicator
+
+        dedup = Deduplicator()
+
+    def report(stats):
+        if stats["done"] % 100 == 0:
+            logging.info("%d resumes, %.1f/s", stats["done"], stats["per_second"])
+
+    sink = open_sink(args.out)
+    try:
+        stats = ingest(args.source, sink, index, args.workers, report, pool, dedup)
+    finally:
+        sink.close()
+        if index is not None:
+            index.close()
+    if pool is not None:
+        pool.save(args.pool)
+    logging.info("Ingested %d resumes (%d errors, %d near-duplicates, %.1f MB) in %.1fs, %.1f resumes/s -> %s",
+                 stats["done"], stats["errors"], stats["duplicates"], stats["bytes"] / 1e6, stats["seconds"], stats["per_second"], args.out)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sys.exit(main())
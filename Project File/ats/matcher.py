@@ -0,0 +1,76 @@
+# ats/matcher.py
+"""
+Aho-Corasick automaton over token sequences.
+
+The automaton's alphabet is whole tokens (as produced by
+ats.profile.tokenize), not characters, so every match starts and ends on a
+token boundary: "java" never matches inside "javascript" and "power bi"
+only matches the two words in a row. It is built once per job description;
+matching visits each resume token once, whatever the number of phrases.
+"""
+
+
+class PhraseMatcher:
+    """Finds every keyword (a tuple of tokens) in a token list in one pass."""
+
+    def __init__(self, keywords):
+        self.keywords = [tuple(k) for k in keywords]
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for kid, words in enumerate(self.keywords):
+            self._insert(words, kid)
+        self._link()
+
+    def _insert(self, words, kid):
+        state = 0
+        for word in words:
+            nxt = self._goto[state].get(word)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][word] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (kid,)
+
+    def _link(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = list(goto[0].values())
+        for state in queue:
+            for word, child in goto[state].items():
+                f = fail[state]
+                while f and word not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(word, 0)
+                if out[fail[child]]:
+                    out[child] = out[child] + out[fail[child]]
+                queue.append(child)
+
+    def __len__(self):
+        return len(self._goto)
+
+    def iter_matches(self, tokens):
+        """Yield (end position, keyword id) for every occurrence."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for pos, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for kid in out[state]:
+                yield pos, kid
+
+    def find(self, tokens):
+        """Set of keyword ids occurring in the token list."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
@@ -0,0 +1,158 @@
+# ats/pdf.py
+"""
+Pluggable, parallel PDF text extraction.
+
+A backend is a pair of functions registered under a name:
+    count(data) -> number of pages
+    extract(data, page_numbers) -> list of page texts (same order)
+PyPDF2 ("pypdf2") is always available; pdfminer.six ("pdfminer") is used when
+installed. Pages that yield no text come back as "" instead of None.
+
+Long documents are split into page chunks extracted on a process pool.
+`iter_pdf_pages` streams (page number, text) pairs in reading order as the
+chunks finish and stops early once `max_pages` or `max_chars` is reached.
+"""
+import io
+import os
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from PyPDF2 import PdfReader
+
+try:
+    from pdfminer.high_level import extract_pages as _pdfminer_extract_pages
+    from pdfminer.layout import LTTextContainer
+    from pdfminer.pdfpage import PDFPage
+except ImportError:  # pdfminer.six is optional
+    _pdfminer_extract_pages = None
+
+PDF_BACKEND = os.environ.get("PDF_BACKEND", "pypdf2")
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", "0")) or os.cpu_count() or 1
+# Below this many pages the pool costs more than it saves.
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", "8"))
+PDF_PAGES_PER_TASK = 4
+# Optional caps for the ATS page and bulk jobs; unset means no limit.
+PDF_MAX_PAGES = int(os.environ["PDF_MAX_PAGES"]) if os.environ.get("PDF_MAX_PAGES") else None
+PDF_MAX_CHARS = int(os.environ["PDF_MAX_CHARS"]) if os.environ.get("PDF_MAX_CHARS") else None
+
+PDF_BACKENDS = {}
+
+
+def register_backend(name, count, extract):
+    """Make a PDF backend available by name."""
+    PDF_BACKENDS[name] = (count, extract)
+
+
+def _pypdf2_count(data):
+    return len(PdfReader(io.BytesIO(data)).pages)
+
+
+def _pypdf2_extract(data, page_numbers):
+    reader = PdfReader(io.BytesIO(data))
+    return [reader.pages[i].extract_text() or "" for i in page_numbers]
+
+
+register_backend("pypdf2", _pypdf2_count, _pypdf2_extract)
+
+
+if _pdfminer_extract_pages is not None:
+
+    def _pdfminer_count(data):
+        return sum(1 for _ in PDFPage.get_pages(io.BytesIO(data)))
+
+    def _pdfminer_extract(data, page_numbers):
+        texts = {}
+        # extract_pages yields pages in document order, not in `page_numbers` order.
+        for number, layout in zip(sorted(page_numbers), _pdfminer_extract_pages(io.BytesIO(data), page_numbers=page_numbers)):
+            texts[number] = "".join(el.get_text() for el in layout if isinstance(el, LTTextContainer))
+        return [texts.get(i, "") for i in page_numbers]
+
+    register_backend("pdfminer", _pdfminer_count, _pdfminer_extract)
+
+
+def _backend(name):
+    try:
+        return PDF_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF backend {name!r}; available: {', '.join(PDF_BACKENDS)}") from None
+
+
+def _extract_chunk(backend, data, page_numbers):
+    return _backend(backend)[1](data, page_numbers)
+
+
+_pool = None
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+    return _pool
+
+
+def iter_pdf_pages(data, backend=None, max_pages=None, max_chars=None, parallel=None):
+    """Yield (page number, text) for a PDF given as bytes, in page order.
+
+    Stops after `max_pages` pages or once `max_chars` characters have been
+    yielded; chunks that have not started yet are cancelled. `parallel`
+    forces the process pool on or off (default: on for long documents).
+    """
+    backend = backend or PDF_BACKEND
+    count, extract = _backend(backend)
+    n_pages = count(data)
+    if max_pages is not None:
+        n_pages = min(n_pages, max_pages)
+    if parallel is None:
+        parallel = n_pages >= PDF_PARALLEL_MIN_PAGES and PDF_WORKERS > 1
+    chunks = [list(range(i, min(i + PDF_PAGES_PER_TASK, n_pages))) for i in range(0, n_pages, PDF_PAGES_PER_TASK)]
+
+    if parallel:
+        pool = _get_pool()
+        futures = [pool.submit(_extract_chunk, backend, data, chunk) for chunk in chunks]
+        results = (f.result() for f in futures)
+    else:
+        futures = []
+        results = (extract(data, chunk) for chunk in chunks)
+
+    chars = 0
+    try:
+        for chunk, texts in zip(chunks, results):
+            for number, text in zip(chunk, texts):
+                if max_chars is not None and chars + len(text) >= max_chars:
+                    yield number, text[:max_chars - chars]
+                    return
+                chars += len(text)
+                yield number, text
+    finally:
+        for f in futures:
+            f.cancel()
+
+
+def extract_pdf_text(data, backend=None, max_pages=None, max_chars=None, parallel=None):
+    """Full text of a PDF given as bytes (pages joined without separator)."""
+    return "".join(text for _, text in iter_pdf_pages(data, backend, max_pages, max_chars, parallel))
+
+
+def fastest_backend(samples, backends=None, repeat=1):
+    """Name of the backend with the lowest total time over `samples` (PDF bytes).
+
+    Returns (name, timings). A backend that fails on any sample is not
+    timed further and gets None in `timings`; it is never picked. The name
+    is None if every backend failed.
+    """
+    timings = {}
+    for name in backends or list(PDF_BACKENDS):
+        start = time.perf_counter()
+        try:
+            for _ in range(repeat):
+                for data in samples:
+                    extract_pdf_text(data, name, parallel=False)
+        except Exception as e:
+            logging.warning("Backend %s failed on a sample: %s", name, e)
+            timings[name] = None
+            continue
+        timings[name] = time.perf_counter() - start
+    working = [name for name, seconds in timings.items() if seconds is not None]
+    return min(working, key=timings.get, default=None), timings
@@ -0,0 +1,255 @@
+# ats/profile.py
+"""
+Precompiled job-description profiles.
+
+A JobProfile is compiled once from a job description: its keywords are
+normalized tokens that keep technical spellings ("c++", "node.js", "aws",
+"ci/cd"), skills from the taxonomy in ats/taxonomy.py, multi-word phrases
+("machine learning", "power bi") and a weight per keyword. Scoring a resume
+is then a single pass of the compiled Aho-Corasick matcher (ats/matcher.py)
+over the resume tokens. Profiles serialize to JSON (or pickle) so they can
+be cached and reused across thousands of resumes.
+
+With `fuzzy=True`, near-miss spellings ("Postgress", "Javascipt",
+"Tensorflow2") are corrected through a SymSpell index over the JD
+vocabulary (ats/fuzzy.py) and reported apart from the exact hits.
+
+A ResumeMatch keeps one resume's tokens and what is known about its
+keywords, so re-scoring after a JD edit only matches the added keywords.
+"""
+import re
+import json
+
+from ats.fuzzy import FuzzyIndex
+from ats.matcher import PhraseMatcher
+from ats.tokens import tokenize, STOPWORDS
+from ats.taxonomy import default_taxonomy
+
+# Phrases never span punctuation or sentence ends.
+_CLAUSE_BREAK = re.compile(r"[,;:!?()\[\]|•\n]|\.(?=\s|$)")
+_QUOTED = re.compile(r"[\"“]([^\"”]{3,60})[\"”]")
+
+PROFILE_VERSION = 1
+
+
+def _is_keyword(token):
+    if isinstance(token, int):
+        return True  # taxonomy skill id
+    return token not in STOPWORDS and any(c.isalpha() for c in token)
+
+
+def _is_capitalized(surface):
+    return surface[:1].isupper()
+
+
+def _find_phrases(pairs, max_words=3):
+    """Runs of 2..max_words capitalized keyword tokens ("Senior Data Engineer").
+
+    Skills already recognized by the taxonomy have no surface and end a run.
+    """
+    phrases = []
+    run = []
+    for token, surface in pairs + [("", "")]:
+        if surface and _is_capitalized(surface) and _is_keyword(token):
+            run.append(token)
+            continue
+        if 2 <= len(run) <= max_words:
+            phrases.append(tuple(run))
+        run = []
+    return phrases
+
+
+def normalized_tokens(text, taxonomy=None):
+    """Taxonomy-normalized tokens of a text (skill aliases become skill ids)."""
+    return (taxonomy or default_taxonomy()).normalize([t for t, _ in tokenize(text)])
+
+
+def _display(keyword, taxonomy):
+    return " ".join(taxonomy.name(t) if isinstance(t, int) else t for t in keyword)
+
+
+class JobProfile:
+    """Compiled keywords, phrases and weights of one job description.
+
+    Keywords are tuples of tokens in which taxonomy skills are replaced by
+    their integer ids, so "k8s" in a resume matches "Kubernetes" in the JD.
+    """
+
+    def __init__(self, keywords, weights=None, taxonomy=None):
+        self.taxonomy = taxonomy or default_taxonomy()
+        self.keywords = [tuple(k) for k in keywords]
+        self.weights = list(weights) if weights is not None else [1.0] * len(self.keywords)
+        self.total_weight = sum(self.weights) or 1.0
+        self.matcher = PhraseMatcher(self.keywords)
+        self._fuzzy = None
+
+    @classmethod
+    def compile(cls, job_description, model=None, phrases=None, taxonomy=None):
+        """Build a profile from JD text.
+
+        `phrases` adds explicit multi-word keywords on top of the detected
+        ones (taxonomy skills, capitalized runs and quoted text). With an
+        ats.weighting IdfModel, keywords are weighted by BM25 idf; otherwise
+        all weigh 1.
+        """
+        taxonomy = taxonomy or default_taxonomy()
+        pairs = taxonomy.normalize_pairs(tokenize(job_description))
+        found = []
+        for clause in _CLAUSE_BREAK.split(job_description):
+            found.extend(_find_phrases(taxonomy.normalize_pairs(tokenize(clause))))
+        for phrase in _QUOTED.findall(job_description) + list(phrases or ()):
+            found.append(tuple(taxonomy.normalize([t for t, _ in tokenize(phrase)])))
+        found = [p for p in dict.fromkeys(found) if len(p) > 1]
+
+        # Tokens that only ever appear inside a phrase are not keywords on their own.
+        tokens = [t for t, _ in pairs]
+        covered = [False] * len(tokens)
+        for phrase in found:
+            n = len(phrase)
+            for i in range(len(tokens) - n + 1):
+                if tuple(tokens[i:i + n]) == phrase:
+                    covered[i:i + n] = [True] * n
+        singles = dict.fromkeys((t,) for t, c in zip(tokens, covered) if not c and _is_keyword(t))
+
+        keywords = sorted(set(found) | set(singles), key=lambda k: _display(k, taxonomy).lower())
+        weights = None
+        if model is not None:
+            terms = [[taxonomy.name(t).lower() if isinstance(t, int) else t for t in k] for k in keywords]
+            words = sorted({w for k in terms for w in k})
+            idf = dict(zip(words, model.bm25_idf(words).tolist()))
+            weights = [sum(idf[w] for w in k) for k in terms]
+        return cls(keywords, weights, taxonomy)
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def names(self, ids=None):
+        ids = range(len(self.keywords)) if ids is None else ids
+        return sorted((_display(self.keywords[i], self.taxonomy) for i in ids), key=str.lower)
+
+    def tokens(self, text):
+        """Taxonomy-normalized tokens of a text, as the matcher sees them."""
+        return normalized_tokens(text, self.taxonomy)
+
+    @property
+    def fuzzy(self):
+        """FuzzyIndex over the keyword vocabulary, built on first use."""
+        if self._fuzzy is None:
+            terms = {t for k in self.keywords for t in k}
+            self._fuzzy = FuzzyIndex(terms, self.taxonomy)
+        return self._fuzzy
+
+    def match(self, resume_text):
+        """Ids of the profile keywords found in a resume."""
+        return self.matcher.find(self.tokens(resume_text))
+
+    def match_fuzzy(self, resume_text):
+        """(exact keyword ids, {keyword id: misspelled resume tokens})."""
+        tokens = self.tokens(resume_text)
+        corrected, fixed = self.fuzzy.correct(tokens)
+        if not fixed:
+            return self.matcher.find(tokens), {}
+        exact, near = set(), {}
+        for end, kid in self.matcher.iter_matches(corrected):
+            if kid in exact:
+                continue
+            n = len(self.keywords[kid])
+            typos = [fixed[p] for p in range(end - n + 1, end + 1) if p in fixed]
+            if typos:
+                near.setdefault(kid, typos)
+            else:
+                exact.add(kid)
+        return exact, {kid: typos for kid, typos in near.items() if kid not in exact}
+
+    def score(self, resume_text, fuzzy=False):
+        """Score dict with `score`, `keywords`, `matched` and `missed`.
+
+        With `fuzzy`, typo matches count towards the score and are listed
+        under `fuzzy` as "Keyword (resume spelling)" instead of `matched`.
+        """
+        if fuzzy:
+            hits, near = self.match_fuzzy(resume_text)
+        else:
+            hits, near = self.match(resume_text), {}
+        return self.result(hits, near if fuzzy else None)
+
+    def result(self, hits, near=None):
+        """Score dict for exact keyword ids `hits` (and typo hits `near`)."""
+        found = hits | set(near or ())
+        result = {
+            "score": round(sum(self.weights[i] for i in found) / self.total_weight * 100),
+            "keywords": self.names(),
+            "matched": self.names(hits),
+            "missed": self.names(set(range(len(self.keywords))) - found),
+        }
+        if near is not None:
+            result["fuzzy"] = sorted((f"{_display(self.keywords[kid], self.taxonomy)} ({' '.join(typos)})"
+                                      for kid, typos in near.items()), key=str.lower)
+        return result
+
+    def score_many(self, resumes, fuzzy=False):
+        return [self.score(text, fuzzy) for text in resumes]
+
+    def to_dict(self):
+        """JSON-safe form; skills are stored by canonical name, not by id."""
+        keywords = [[{"skill": self.taxonomy.name(t)} if isinstance(t, int) else t for t in k] for k in self.keywords]
+        return {"version": PROFILE_VERSION, "keywords": keywords, "weights": self.weights}
+
+    @classmethod
+    def from_dict(cls, data, taxonomy=None):
+        taxonomy = taxonomy or default_taxonomy()
+
+        def token(t):
+            if isinstance(t, dict):
+                sid = taxonomy.id(t["skill"])
+                return sid if sid is not None else t["skill"].lower()
+            return t
+
+        return cls([[token(t) for t in k] for k in data["keywords"]], data["weights"], taxonomy)
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text, taxonomy=None):
+        return cls.from_dict(json.loads(text), taxonomy)
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        other = self.from_dict(state)
+        self.__dict__.update(other.__dict__)
+
+
+class ResumeMatch:
+    """One resume's keyword matches, updated incrementally as the JD changes.
+
+    The resume is tokenized once. `update(profile)` only runs a matcher over
+    the keywords it has not seen before (those added by the edit); removed
+    keywords simply drop out of the result.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.found = set()      # keywords present in the resume
+        self.checked = set()    # keywords already looked for
+        self.keywords = set()   # keywords of the last profile
+        self.added = self.removed = []
+
+    @classmethod
+    def from_text(cls, resume_text, taxonomy=None):
+        return cls(normalized_tokens(resume_text, taxonomy))
+
+    def update(self, profile):
+        """Score dict for `profile` (as JobProfile.score) after matching only new keywords."""
+        new = [k for k in profile.keywords if k not in self.checked]
+        if new:
+            matcher = PhraseMatcher(new)
+            self.found.update(new[i] for i in matcher.find(self.tokens))
+            self.checked.update(new)
+        keywords = set(profile.keywords)
+        self.added = sorted(_display(k, profile.taxonomy) for k in keywords - self.keywords)
+        self.removed = sorted(_display(k, profile.taxonomy) for k in self.keywords - keywords)
+        self.keywords = keywords
+        return profile.result({i for i, k in enumerate(profile.keywords) if k in self.found})
@@ -0,0 +1,179 @@
+# ats/scoring.py
+"""
+Batch ATS keyword scoring: N resumes against M job descriptions in one call.
+
+Every document is tokenized exactly once. The keywords of all job descriptions
+share one column space, each resume becomes a sparse row (the set of keyword
+columns it contains) and a job description's score is the overlap between its
+columns and the row.
+
+Matching rules are the ones the ATS page in app.py has always used:
+- a JD keyword is a whitespace-separated, purely alphabetic word longer than
+  3 characters, lowercased;
+- a keyword is a hit when it occurs anywhere in the lowercased resume text,
+  so "java" is a hit for a resume that only mentions "javascript".
+
+That binary score is the default mode. The "bm25" and "tfidf" modes weight
+keywords by IDF (see ats/weighting.py) and match whole words only.
+
+Usage:
+    python -m ats.scoring --resumes cv1.pdf cv2.docx --jds backend.txt data.txt
+    python -m ats.scoring --resumes cv*.pdf --jds backend.txt --mode bm25 --idf-model ats_idf_model.json
+"""
+import re
+import sys
+import json
+import logging
+import argparse
+from collections import Counter
+
+SCORING_MODES = ("binary", "bm25", "tfidf")
+
+_LETTER_RUN = re.compile(r"[^\W\d_]+")
+
+
+def extract_keywords(job_description):
+    """Keyword set of a job description (same filter as the ATS page)."""
+    return set(w.lower() for w in job_description.split() if len(w) > 3 and w.isalpha())
+
+
+def resume_tokens(resume_text):
+    """Distinct lowercase letter runs of a resume."""
+    return set(_LETTER_RUN.findall(resume_text.lower()))
+
+
+def resume_term_counts(resume_text):
+    """Term frequency of every lowercase letter run of a resume."""
+    return Counter(_LETTER_RUN.findall(resume_text.lower()))
+
+
+def _resume_row(resume_text, columns):
+    """Columns of every keyword that occurs in the resume text.
+
+    One C-level substring scan per keyword over the lowercased text is
+    faster than enumerating the substrings of the resume's tokens.
+    """
+    text = resume_text.lower()
+    return {col for keyword, col in columns.items() if keyword in text}
+
+
+class ScoreMatrix:
+    """Result of `score_many`.
+
+    `scores[i][j]` is the match percentage of resume i against job
+    description j; `matched(i, j)` and `missed(i, j)` list the keywords.
+    """
+
+    def __init__(self, vocabulary, jd_columns, rows, scores=None, mode="binary"):
+        self.vocabulary = vocabulary
+        self.jd_columns = jd_columns
+        self.rows = rows
+        self.mode = mode
+        if scores is None:
+            scores = [
+                [round(len(row & cols) / max(1, len(cols)) * 100) for cols in jd_columns]
+                for row in rows
+            ]
+        self.scores = scores
+
+    @property
+    def shape(self):
+        return len(self.rows), len(self.jd_columns)
+
+    def keywords(self, j):
+        return sorted(self.vocabulary[c] for c in self.jd_columns[j])
+
+    def matched(self, i, j):
+        return sorted(self.vocabulary[c] for c in self.jd_columns[j] & self.rows[i])
+
+    def missed(self, i, j):
+        return sorted(self.vocabulary[c] for c in self.jd_columns[j] - self.rows[i])
+
+    def to_dict(self):
+        n, m = self.shape
+        return {
+            "scores": self.scores,
+            "matched": [[self.matched(i, j) for j in range(m)] for i in range(n)],
+            "missed": [[self.missed(i, j) for j in range(m)] for i in range(n)],
+        }
+
+
+def score_many(resumes, job_descriptions, mode="binary", model=None):
+    """Score every resume text against every job description text.
+
+    `mode` is one of SCORING_MODES. The weighted modes use `model` (an
+    ats.weighting.IdfModel) or, without one, IDF fitted on `resumes`.
+    """
+    if mode not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode: {mode}")
+    columns = {}
+    jd_columns = []
+    for jd in job_descriptions:
+        jd_columns.append(frozenset(columns.setdefault(w, len(columns)) for w in extract_keywords(jd)))
+    vocabulary = sorted(columns, key=columns.get)
+
+    if mode != "binary":
+        from ats.weighting import weighted_scores
+
+        scores, rows = weighted_scores(resumes, vocabulary, columns, jd_columns, mode, model)
+        return ScoreMatrix(vocabulary, jd_columns, rows, scores.round().astype(int).tolist(), mode)
+
+    rows = [_resume_row(text, columns) for text in resumes]
+    return ScoreMatrix(vocabulary, jd_columns, rows)
+
+
+def score_pair(resume_text, job_description, mode="binary", model=None):
+    """Single resume / single JD result as shown on the ATS page."""
+    result = score_many([resume_text], [job_description], mode, model)
+    return {
+        "score": result.scores[0][0],
+        "keywords": result.keywords(0),
+        "matched": result.matched(0, 0),
+        "missed": result.missed(0, 0),
+    }
+
+
+def main(argv=None):
+    from ats.extract import extract_text_cached
+
+    parser = argparse.ArgumentParser(description="Score resumes against job descriptions.")
+    parser.add_argument("--resumes", nargs="+", required=True, help="PDF, DOCX or TXT resume files")
+    parser.add_argument("--jds", nargs="+", required=True, help="Plain-text job description files")
+    parser.add_argument("--mode", choices=SCORING_MODES, default="binary", help="Scoring mode")
+    parser.add_argument("--idf-model", help="IdfModel JSON for the weighted modes (default: fit on the resumes)")
+    parser.add_argument("--json", dest="json_path", help="Write scores and keywords to this JSON file")
+    args = parser.parse_args(argv)
+
+    resumes = []
+    for path in args.resumes:
+        try:
+            resumes.append(extract_text_cached(path))
+        except Exception as e:
+            logging.error("Could not read %s: %s", path, e)
+            resumes.append("")
+    jds = []
+    for path in args.jds:
+        with open(path, encoding="utf-8") as f:
+            jds.append(f.read())
+
+    model = None
+    if args.idf_model:
+        from ats.weighting import IdfModel
+
+        model = IdfModel.load(args.idf_model)
+    result = score_many(resumes, jds, args.mode, model)
+    for i, path in enumerate(args.resumes):
+        print(path + "\t" + "\t".join(f"{s}%" for s in result.scores[i]))
+
+    if args.json_path:
+        out = result.to_dict()
+        out["resumes"] = args.resumes
+        out["jds"] = args.jds
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(out, f, indent=2, ensure_ascii=False)
+        logging.info("Saved scores -> %s", args.json_path)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# ats/taxonomy.py
+"""
+Skill taxonomy: canonical skills and their aliases ("k8s" -> Kubernetes).
+
+The bundled ats/skills.json maps each canonical skill name to its aliases.
+Extra entries can be merged from the JSON file named by SKILL_TAXONOMY_PATH
+or with `SkillTaxonomy.extend`. Every canonical skill gets an integer id.
+
+Aliases are stored in a token trie (the same tokens as ats.tokens.tokenize),
+so `normalize` replaces the longest alias at each position of a token list
+with its skill id in one left-to-right pass. Downstream matching then
+compares ints instead of strings.
+"""
+import os
+import json
+
+from ats.tokens import tokenize
+
+SKILLS_PATH = os.path.join(os.path.dirname(__file__), "skills.json")
+SKILL_TAXONOMY_PATH = os.environ.get("SKILL_TAXONOMY_PATH")
+
+# Trie node layout: [children dict, skill id or None]
+_CHILDREN, _SKILL = 0, 1
+
+
+class SkillTaxonomy:
+    """Canonical skill names, ids and an alias trie."""
+
+    def __init__(self, mapping=None):
+        self.names = []
+        self._ids = {}
+        self._root = [{}, None]
+        self.max_alias_len = 0
+        if mapping:
+            self.extend(mapping)
+
+    @classmethod
+    def load(cls, *paths):
+        taxonomy = cls()
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                taxonomy.extend(json.load(f))
+        return taxonomy
+
+    def extend(self, mapping):
+        """Add {canonical name: [aliases]}; existing skills gain the new aliases."""
+        for name, aliases in mapping.items():
+            sid = self._ids.get(name.lower())
+            if sid is None:
+                sid = len(self.names)
+                self.names.append(name)
+                self._ids[name.lower()] = sid
+            for alias in [name, *aliases]:
+                self._insert([t for t, _ in tokenize(alias)], sid)
+
+    def _insert(self, tokens, sid):
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node[_CHILDREN].setdefault(token, [{}, None])
+        node[_SKILL] = sid
+        self.max_alias_len = max(self.max_alias_len, len(tokens))
+
+    def __len__(self):
+        return len(self.names)
+
+    def id(self, name):
+        """Skill id of a canonical name or alias, or None."""
+        tokens = [t for t, _ in tokenize(name)]
+        sid, end = self._longest(tokens, 0)
+        return sid if end == len(tokens) else None
+
+    def name(self, sid):
+        return self.names[sid]
+
+    def word_aliases(self):
+        """{token: skill id} for every alias that is a single token."""
+        return {token: node[_SKILL] for token, node in self._root[_CHILDREN].items() if node[_SKILL] is not None}
+
+    def _longest(self, tokens, start):
+        node = self._root
+        best, best_end = None, start
+        for i in range(start, len(tokens)):
+            node = node[_CHILDREN].get(tokens[i])
+            if node is None:
+                break
+            if node[_SKILL] is not None:
+                best, best_end = node[_SKILL], i + 1
+        return best, best_end
+
+    def _runs(self, tokens):
+        """Yield (start, end, skill id or None) covering `tokens` left to right."""
+        i, n = 0, len(tokens)
+        children = self._root[_CHILDREN]
+        while i < n:
+            if tokens[i] in children:
+                sid, end = self._longest(tokens, i)
+                if sid is not None:
+                    yield i, end, sid
+                    i = end
+                    continue
+            yield i, i + 1, None
+            i += 1
+
+    def normalize(self, tokens):
+        """Token list with every alias run replaced by its skill id."""
+        return [tokens[i] if sid is None else sid for i, _, sid in self._runs(tokens)]
+
+    def normalize_pairs(self, pairs):
+        """`normalize` for (token, surface) pairs; skills get a None surface."""
+        tokens = [t for t, _ in pairs]
+        return [pairs[i] if sid is None else (sid, None) for i, _, sid in self._runs(tokens)]
+
+    def canonical_skills(self, skills):
+        """Deduplicated skill list with known aliases replaced by canonical names."""
+        out = {}
+        for skill in skills:
+            sid = self.id(skill)
+            name = self.names[sid] if sid is not None else skill.strip()
+            if name:
+                out.setdefault(name.lower(), name)
+        return list(out.values())
+
+
+_default = None
+
+
+def default_taxonomy():
+    """Bundled taxonomy plus SKILL_TAXONOMY_PATH, loaded once per process."""
+    global _default
+    if _default is None:
+        paths = [SKILLS_PATH] + ([SKILL_TAXONOMY_PATH] if SKILL_TAXONOMY_PATH else [])
+        _default = SkillTaxonomy.load(*paths)
+    return _default
@@ -0,0 +1,45 @@
+# ats/tokens.py
+"""
+Tokenizer shared by job profiles, the skill taxonomy and fuzzy matching.
+"""
+import re
+
+# A token starts with a letter or digit (or a dot, for ".net") and may carry
+# the characters used in technology names.
+_TOKEN = re.compile(r"(?:(?<![\w.])\.)?[a-z0-9][a-z0-9+#./\-]*", re.IGNORECASE)
+_TRAILING = ".-/"
+
+STOPWORDS = frozenset("""
+a about above across after again against all also am an and and/or any are as at be been before being
+below between both but by can could did do does doing down during each etc e.g i.e few for from further
+had has have having he her here hers him his how if in into is it its itself just let may me more most
+must my no nor not now of off on once only or other our ours out over own per plus same she should so
+some such than that the their theirs them then there these they this those through to too under until
+up upon us very via was we were what when where which while who whom why will with within without would
+you your yours
+ability able including well strong good excellent work working team teams role looking
+join company candidate candidates responsibilities requirements required preferred years year
+knowledge understanding familiarity experienced skills skill using use
+""".split())
+
+
+def tokenize(text):
+    """Lowercase tokens of `text` as (token, surface) pairs in reading order.
+
+    Slash-joined words are split ("python/django") unless one side is an
+    abbreviation of at most two letters ("ci/cd", "ui/ux", "tcp/ip").
+    """
+    out = []
+    for m in _TOKEN.finditer(text):
+        surface = m.group().rstrip(_TRAILING)
+        if not surface:
+            continue
+        token = surface.lower()
+        if "/" in token:
+            parts = [p for p in token.split("/") if p]
+            if len(parts) > 1 and all(len(p) > 2 for p in parts):
+                # Lowercase surfaces keep "Python/Django" from reading as a phrase.
+                out.extend((p, p) for p in parts)
+                continue
+        out.append((token, surface))
+    return out
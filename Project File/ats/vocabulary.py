@@ -0,0 +1,164 @@
+# ats/vocabulary.py
+"""
+Interned vocabulary and a compact candidate pool for mass screening.
+
+Every normalized resume token (see JobProfile.tokens) is interned once into
+a Vocabulary of integer ids. A CandidatePool keeps each resume's distinct
+term ids as one sorted uint32 slice of a single flat array (CSR layout),
+about 4 bytes per term instead of a Python set of strings per resume.
+
+Scoring a JobProfile against the whole pool is vectorized: each JD token
+gets a bit, one gather over the flat array plus a bitwise-OR reduction per
+resume gives a bitset of the JD tokens every resume contains, and a keyword
+counts as present when all of its bits are set. Multi-word keywords
+therefore only require their words somewhere in the resume; use
+JobProfile.score on the shortlist for exact phrase matching.
+"""
+import json
+from array import array
+
+import numpy as np
+
+from ats.profile import normalized_tokens
+
+
+class Vocabulary:
+    """Bidirectional term <-> id mapping; terms are str tokens or int skill ids."""
+
+    def __init__(self, terms=None):
+        self.terms = []
+        self._ids = {}
+        for term in terms or ():
+            self.intern(term)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def intern(self, term):
+        tid = self._ids.get(term)
+        if tid is None:
+            tid = self._ids[term] = len(self.terms)
+            self.terms.append(term)
+        return tid
+
+    def get(self, term):
+        return self._ids.get(term)
+
+    def ids(self, terms):
+        """Sorted, de-duplicated uint32 array of ids, interning new terms."""
+        return array("I", sorted({self.intern(t) for t in terms}))
+
+    def to_list(self):
+        # Skill ids are ints; keep them apart from tokens that look like numbers.
+        return [{"skill": t} if isinstance(t, int) else t for t in self.terms]
+
+    @classmethod
+    def from_list(cls, items):
+        return cls(t["skill"] if isinstance(t, dict) else t for t in items)
+
+
+class CandidatePool:
+    """Resumes stored as sorted term-id slices of one flat uint32 array."""
+
+    def __init__(self, vocabulary=None):
+        self.vocabulary = vocabulary or Vocabulary()
+        self.doc_ids = []
+        self._indices = array("I")
+        self._indptr = array("Q", [0])
+        self._frozen = None
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    @property
+    def nbytes(self):
+        return self._indices.itemsize * len(self._indices) + self._indptr.itemsize * len(self._indptr)
+
+    def add(self, doc_id, resume_text):
+        self.add_tokens(doc_id, normalized_tokens(resume_text))
+
+    def add_tokens(self, doc_id, tokens):
+        # Drop the numpy views first: an array exporting its buffer cannot grow.
+        self._frozen = None
+        self._indices.extend(self.vocabulary.ids(tokens))
+        self._indptr.append(len(self._indices))
+        self.doc_ids.append(doc_id)
+
+    def terms(self, i):
+        """Terms of the i-th resume."""
+        start, end = self._indptr[i], self._indptr[i + 1]
+        return [self.vocabulary.terms[t] for t in self._indices[start:end]]
+
+    def _arrays(self):
+        if self._frozen is None:
+            # Zero-copy views over the array buffers.
+            self._frozen = (
+                np.frombuffer(self._indices, dtype=np.uint32) if len(self._indices) else np.zeros(0, np.uint32),
+                np.frombuffer(self._indptr, dtype=np.uint64).astype(np.int64),
+            )
+        return self._frozen
+
+    def token_bits(self, tokens):
+        """(n_resumes, n_words) uint64 bitsets: bit b of word w set when resume has tokens[64*w + b]."""
+        indices, indptr = self._arrays()
+        n_words = max(1, (len(tokens) + 63) // 64)
+        out = np.zeros((len(self.doc_ids), n_words), dtype=np.uint64)
+        if not len(indices) or not tokens:
+            return out
+        # reduceat needs strictly valid starts and returns garbage for empty
+        # rows, so reduce the non-empty rows only and leave the others zero.
+        nonempty = np.diff(indptr) > 0
+        starts = indptr[:-1][nonempty]
+        for w in range(n_words):
+            lut = np.zeros(len(self.vocabulary), dtype=np.uint64)
+            for b, token in enumerate(tokens[64 * w:64 * (w + 1)]):
+                tid = self.vocabulary.get(token)
+                if tid is not None:
+                    lut[tid] = np.uint64(1) << np.uint64(b)
+            gathered = lut[indices]
+            out[nonempty, w] = np.bitwise_or.reduceat(gathered, starts)
+        return out
+
+    def score(self, profile):
+        """Percentage scores of every resume for a JobProfile (float array)."""
+        tokens = sorted({t for k in profile.keywords for t in k}, key=repr)
+        position = {t: i for i, t in enumerate(tokens)}
+        bits = self.token_bits(tokens)
+        total = np.zeros(len(self.doc_ids), dtype=np.float64)
+        for keyword, weight in zip(profile.keywords, profile.weights):
+            present = np.ones(len(self.doc_ids), dtype=bool)
+            for token in set(keyword):
+                w, b = divmod(position[token], 64)
+                present &= (bits[:, w] >> np.uint64(b)) & np.uint64(1) == 1
+            total += weight * present
+        return 100 * total / profile.total_weight
+
+    def top(self, profile, k=10):
+        """Best k resumes as (doc_id, score) pairs, best first."""
+        scores = self.score(profile)
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.doc_ids[i], round(float(scores[i]))) for i in best]
+
+    def save(self, path):
+        """Write the pool to a .npz file (vocabulary and doc ids as JSON)."""
+        indices, indptr = self._arrays()
+        np.savez(
+            path,
+            indices=indices,
+            indptr=indptr,
+            vocabulary=np.array(json.dumps(self.vocabulary.to_list(), ensure_ascii=False)),
+            doc_ids=np.array(json.dumps(self.doc_ids, ensure_ascii=False)),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            pool = cls(Vocabulary.from_list(json.loads(str(data["vocabulary"]))))
+            pool.doc_ids = json.loads(str(data["doc_ids"]))
+            pool._indices = array("I", data["indices"].astype(np.uint32).tobytes())
+            pool._indptr = array("Q", data["indptr"].astype(np.uint64).tobytes())
+        return pool
@@ -0,0 +1,183 @@
+# ats/weighting.py
+"""
+IDF-weighted ATS scoring (BM25 and cosine TF-IDF) on sparse matrices.
+
+An `IdfModel` learns document frequencies from a corpus of resumes and job
+descriptions and is stored as JSON so every analysis uses the same weights.
+Scores for a whole batch are computed as one sparse product
+(resumes x keywords) @ (keywords x job descriptions).
+
+Weighted modes match whole words, so they use the term frequencies from
+`resume_term_counts` rather than the substring test of the binary mode.
+
+Usage:
+    python -m ats.weighting resumes/*.pdf jds/*.txt --out ats_idf_model.json
+"""
+import os
+import sys
+import json
+import math
+import logging
+import argparse
+
+import numpy as np
+from scipy import sparse
+
+from ats.scoring import resume_term_counts
+
+ATS_IDF_MODEL_PATH = os.environ.get("ATS_IDF_MODEL_PATH", "ats_idf_model.json")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+class IdfModel:
+    """Document frequencies of a corpus, with BM25 and smoothed TF-IDF idf."""
+
+    def __init__(self, df=None, n_docs=0, total_len=0):
+        self.df = df or {}
+        self.n_docs = n_docs
+        self.total_len = total_len
+
+    @property
+    def avgdl(self):
+        return self.total_len / self.n_docs if self.n_docs else 1.0
+
+    def update(self, counts):
+        """Add one document given its term counts."""
+        for term in counts:
+            self.df[term] = self.df.get(term, 0) + 1
+        self.n_docs += 1
+        self.total_len += sum(counts.values())
+
+    @classmethod
+    def fit(cls, texts):
+        model = cls()
+        for text in texts:
+            model.update(resume_term_counts(text))
+        return model
+
+    def bm25_idf(self, terms):
+        n = self.n_docs
+        return np.array([math.log((n - self.df.get(t, 0) + 0.5) / (self.df.get(t, 0) + 0.5) + 1) for t in terms])
+
+    def tfidf_idf(self, terms):
+        n = self.n_docs
+        return np.array([math.log((1 + n) / (1 + self.df.get(t, 0))) + 1 for t in terms])
+
+    def save(self, path=ATS_IDF_MODEL_PATH):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"n_docs": self.n_docs, "total_len": self.total_len, "df": self.df}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path=ATS_IDF_MODEL_PATH):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["df"], data["n_docs"], data["total_len"])
+
+
+def term_matrix(counts_list, columns):
+    """CSR matrix of term frequencies restricted to `columns` (term -> column)."""
+    indptr = [0]
+    indices = []
+    data = []
+    for counts in counts_list:
+        for term, tf in counts.items():
+            col = columns.get(term)
+            if col is not None:
+                indices.append(col)
+                data.append(tf)
+        indptr.append(len(indices))
+    return sparse.csr_matrix(
+        (np.array(data, dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+        shape=(len(counts_list), len(columns)),
+    )
+
+
+def keyword_matrix(jd_columns, n_terms):
+    """Binary (keywords x job descriptions) selection matrix."""
+    rows = [c for cols in jd_columns for c in cols]
+    cols = [j for j, c in enumerate(jd_columns) for _ in c]
+    return sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(n_terms, len(jd_columns))
+    )
+
+
+def bm25_scores(tf, doc_len, jd_matrix, idf, avgdl, k1=BM25_K1, b=BM25_B):
+    """BM25 percentage of the best achievable score, shape (resumes, JDs).
+
+    The best achievable score for a JD is the sum of (k1 + 1) * idf over its
+    keywords, the limit of a resume repeating every keyword.
+    """
+    tf = tf.tocsr(copy=True)
+    row_norm = k1 * (1 - b + b * np.asarray(doc_len, dtype=np.float32) / avgdl)
+    per_entry = np.repeat(row_norm, np.diff(tf.indptr))
+    tf.data = tf.data * (k1 + 1) / (tf.data + per_entry)
+    weighted = tf @ sparse.diags(idf.astype(np.float32))
+    raw = (weighted @ jd_matrix).toarray()
+    best = (k1 + 1) * (jd_matrix.T @ idf)
+    return 100 * raw / np.maximum(best, 1e-9)
+
+
+def tfidf_scores(tf, resume_norms, jd_matrix, idf):
+    """Cosine similarity (as a percentage) of resume and JD TF-IDF vectors.
+
+    JD vectors weight each keyword by its idf; resume norms are computed over
+    all resume terms, not only the JD keywords.
+    """
+    weighted = tf @ sparse.diags(idf.astype(np.float32))
+    jd_weighted = sparse.diags(idf.astype(np.float32)) @ jd_matrix
+    raw = (weighted @ jd_weighted).toarray()
+    jd_norms = np.sqrt(np.asarray(jd_weighted.multiply(jd_weighted).sum(axis=0))).ravel()
+    denom = np.outer(resume_norms, jd_norms)
+    return 100 * raw / np.maximum(denom, 1e-9)
+
+
+def resume_norm(counts, model):
+    """L2 norm of a resume's full TF-IDF vector."""
+    n = model.n_docs
+    return math.sqrt(sum((tf * (math.log((1 + n) / (1 + model.df.get(t, 0))) + 1)) ** 2 for t, tf in counts.items()))
+
+
+def weighted_scores(resumes, vocabulary, columns, jd_columns, mode, model=None):
+    """Score matrix and whole-word keyword rows for the weighted modes."""
+    counts_list = [resume_term_counts(text) for text in resumes]
+    if model is None:
+        model = IdfModel()
+        for counts in counts_list:
+            model.update(counts)
+    tf = term_matrix(counts_list, columns)
+    jd_matrix = keyword_matrix(jd_columns, len(vocabulary))
+    if mode == "bm25":
+        doc_len = [sum(c.values()) for c in counts_list]
+        scores = bm25_scores(tf, doc_len, jd_matrix, model.bm25_idf(vocabulary), model.avgdl)
+    elif mode == "tfidf":
+        norms = np.array([resume_norm(c, model) for c in counts_list], dtype=np.float32)
+        scores = tfidf_scores(tf, norms, jd_matrix, model.tfidf_idf(vocabulary))
+    else:
+        raise ValueError(f"Unknown scoring mode: {mode}")
+    rows = [set(tf.indices[tf.indptr[i]:tf.indptr[i + 1]].tolist()) for i in range(tf.shape[0])]
+    return scores, rows
+
+
+def main(argv=None):
+    from ats.extract import extract_text_cached
+
+    parser = argparse.ArgumentParser(description="Fit IDF weights on resumes and job descriptions.")
+    parser.add_argument("files", nargs="+", help="PDF, DOCX or TXT documents")
+    parser.add_argument("--out", default=ATS_IDF_MODEL_PATH, help="Where to write the IdfModel JSON")
+    args = parser.parse_args(argv)
+
+    model = IdfModel()
+    for path in args.files:
+        try:
+            model.update(resume_term_counts(extract_text_cached(path)))
+        except Exception as e:
+            logging.error("Could not read %s: %s", path, e)
+    model.save(args.out)
+    logging.info("Fitted IDF on %d documents (%d terms) -> %s", model.n_docs, len(model.df), args.out)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sys.exit(main())
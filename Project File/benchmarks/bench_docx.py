@@ -0,0 +1,82 @@
+# benchmarks/bench_docx.py
+"""
+DOCX text extraction: python-docx `Document(f).paragraphs` (the old path)
+against the streaming extractor in ats/docx_text.py.
+
+Without arguments the samples are every resume template rendered with a
+sample resume plus one long synthetic document; pass DOCX files to use
+your own. "chars" shows how much text each path finds: the old path
+misses table cells (Side Panel), headers, footers and text boxes.
+
+Usage (from "Project File"):
+    python -m benchmarks.bench_docx --repeat 20
+    python -m benchmarks.bench_docx samples/*.docx
+"""
+import io
+import sys
+import time
+import argparse
+
+from docx import Document
+
+from ats.docx_text import extract_docx_text
+from templetes import TEMPLATE_MAP
+from templetes.ooxml import docx_bytes
+
+from benchmarks.bench_templates import SAMPLE
+
+
+def document_text(data):
+    return "\n".join(p.text for p in Document(io.BytesIO(data)).paragraphs)
+
+
+def _long_document(paragraphs=5000):
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "Ann Lee - Curriculum Vitae"
+    for i in range(paragraphs):
+        doc.add_paragraph(f"Entry {i}: built and ran data pipelines in Python and SQL", "List Bullet")
+        if i % 500 == 0:
+            table = doc.add_table(rows=5, cols=2)
+            for row in table.rows:
+                row.cells[0].text, row.cells[1].text = "Skill", "Python"
+    bio = io.BytesIO()
+    doc.save(bio)
+    return bio.getvalue()
+
+
+def _ms(fn, data, repeat):
+    t = time.perf_counter()
+    for _ in range(repeat):
+        text = fn(data)
+    return (time.perf_counter() - t) / repeat * 1000, len(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("docx", nargs="*", help="Sample DOCX files (default: generated samples)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.docx:
+        samples = []
+        for path in args.docx:
+            with open(path, "rb") as f:
+                samples.append((path, f.read()))
+    else:
+        samples = [(name, docx_bytes(plan, SAMPLE)) for name, plan in TEMPLATE_MAP.items()]
+        samples.append(("long (5000 paragraphs)", _long_document()))
+
+    print(f"{'sample':<24} {'Document ms':>12} {'chars':>7} {'stream ms':>10} {'chars':>7} {'speedup':>8}")
+    totals = [0.0, 0.0]
+    for name, data in samples:
+        repeat = max(args.repeat // 10, 1) if len(data) > 200_000 else args.repeat
+        old_ms, old_chars = _ms(document_text, data, repeat)
+        new_ms, new_chars = _ms(extract_docx_text, data, repeat)
+        totals[0] += old_ms
+        totals[1] += new_ms
+        print(f"{name[-24:]:<24} {old_ms:12.2f} {old_chars:7d} {new_ms:10.2f} {new_chars:7d} {old_ms / new_ms:7.1f}x")
+    print(f"{'total':<24} {totals[0]:12.2f} {'':>7} {totals[1]:10.2f} {'':>7} {totals[0] / totals[1]:7.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
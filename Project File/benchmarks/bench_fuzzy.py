@@ -0,0 +1,70 @@
+# benchmarks/bench_fuzzy.py
+"""
+Cost of typo-tolerant (fuzzy) matching relative to exact matching.
+
+Synthetic resumes mix random filler words, real skill names and misspelled
+skill names; every resume is scored against one compiled JobProfile with
+`match` and with `match_fuzzy`. Both timings include tokenization, which is
+what a caller pays per resume. The first fuzzy pass (cold lookup cache) is
+reported separately.
+
+Usage (from "Project File"):
+    python -m benchmarks.bench_fuzzy --resumes 5000
+"""
+import sys
+import time
+import random
+import argparse
+
+from ats.profile import JobProfile
+
+SKILLS = ["postgresql", "javascript", "tensorflow", "kubernetes", "terraform", "python", "django", "docker", "communication", "leadership"]
+
+
+def typo(word, rng):
+    i = rng.randrange(1, len(word) - 1)
+    return rng.choice([word[:i] + word[i + 1:], word[:i] + word[i] + word[i:], word[:i] + word[i + 1] + word[i] + word[i + 2:]])
+
+
+def make_corpus(n, words=300, seed=0):
+    rng = random.Random(seed)
+    filler = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 11))) for _ in range(20000)]
+    resumes = []
+    for _ in range(n):
+        tokens = rng.choices(filler, k=words)
+        for skill in rng.sample(SKILLS, 5):
+            tokens[rng.randrange(words)] = typo(skill, rng) if rng.random() < 0.3 else skill
+        resumes.append(" ".join(tokens))
+    jd = "We are hiring. Required: " + ", ".join(SKILLS) + ". " + " ".join(rng.choices(filler[:500], k=40))
+    return resumes, jd
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=5000)
+    args = parser.parse_args(argv)
+    resumes, jd = make_corpus(args.resumes)
+    profile = JobProfile.compile(jd)
+
+    t = time.perf_counter()
+    exact_hits = sum(len(profile.match(text)) for text in resumes)
+    exact = time.perf_counter() - t
+
+    t = time.perf_counter()
+    for text in resumes:
+        profile.match_fuzzy(text)
+    cold = time.perf_counter() - t
+
+    t = time.perf_counter()
+    near_hits = sum(len(profile.match_fuzzy(text)[1]) for text in resumes)
+    fuzzy = time.perf_counter() - t
+
+    n = len(resumes)
+    print(f"{n} resumes, {len(profile)} keywords, fuzzy index of {len(profile.fuzzy)} words")
+    print(f"exact  {exact:6.3f}s ({n / exact:,.0f}/s) | {exact_hits} hits")
+    print(f"fuzzy  {fuzzy:6.3f}s ({n / fuzzy:,.0f}/s) | {near_hits} extra typo hits | {fuzzy / exact:.2f}x exact"
+          f" (cold cache {cold:.3f}s, {cold / exact:.2f}x)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
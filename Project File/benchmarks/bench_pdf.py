@@ -0,0 +1,47 @@
+# benchmarks/bench_pdf.py
+"""
+Compare PDF extraction backends on sample resumes and pick the fastest.
+
+Each backend is timed serially and on the process pool; the winner of the
+serial run is printed as the suggested PDF_BACKEND.
+
+Usage (from "Project File"):
+    python -m benchmarks.bench_pdf samples/*.pdf --repeat 3
+"""
+import sys
+import time
+import argparse
+
+from ats.pdf import PDF_BACKENDS, PDF_WORKERS, extract_pdf_text, fastest_backend
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction backends.")
+    parser.add_argument("pdfs", nargs="+", help="Sample PDF files")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    samples = []
+    for path in args.pdfs:
+        with open(path, "rb") as f:
+            samples.append(f.read())
+
+    best, timings = fastest_backend(samples, repeat=args.repeat)
+    for name in PDF_BACKENDS:
+        if timings[name] is None:
+            print(f"{name:>10} | failed")
+            continue
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for data in samples:
+                extract_pdf_text(data, name, parallel=True)
+        pooled = time.perf_counter() - start
+        print(f"{name:>10} | serial {timings[name]:7.3f}s | pool of {PDF_WORKERS} {pooled:7.3f}s")
+    if best is None:
+        print("Every backend failed on the samples.")
+        return 1
+    print(f"Fastest backend: {best}  (set PDF_BACKEND={best})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
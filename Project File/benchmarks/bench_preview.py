@@ -0,0 +1,51 @@
+# benchmarks/bench_preview.py
+"""
+Create-page preview latency: a cold HTML render, a rerun with nothing
+changed, and a rerun after editing one field (the common keystroke case),
+compared with building and saving the DOCX.
+
+Usage (from "Project File"):
+    python -m benchmarks.bench_preview --repeat 200
+"""
+import sys
+import time
+import argparse
+
+from templetes import TEMPLATE_MAP
+from templetes import preview
+from templetes.ooxml import docx_bytes
+
+from benchmarks.bench_templates import SAMPLE
+
+
+def _ms(fn, repeat):
+    t = time.perf_counter()
+    for i in range(repeat):
+        fn(i)
+    return (time.perf_counter() - t) / repeat * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    print(f"{'template':<22} {'cold ms':>8} {'rerun ms':>9} {'1 edit ms':>10} {'docx ms':>8}")
+    for name, plan in TEMPLATE_MAP.items():
+        def cold(i):
+            preview._fragment_html.cache_clear()
+            preview.render_html(plan, SAMPLE)
+
+        def edit(i):
+            preview.render_html(plan, dict(SAMPLE, summary=SAMPLE["summary"] + str(i)))
+
+        cold_ms = _ms(cold, args.repeat)
+        rerun_ms = _ms(lambda i: preview.render_html(plan, SAMPLE), args.repeat)
+        edit_ms = _ms(edit, args.repeat)
+        docx_bytes(plan, SAMPLE)  # warm up (prototype, fixed parts)
+        docx_ms = _ms(lambda i: docx_bytes(plan, SAMPLE), max(args.repeat // 10, 1))
+        print(f"{name:<22} {cold_ms:8.3f} {rerun_ms:9.3f} {edit_ms:10.3f} {docx_ms:8.2f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# benchmarks/bench_scoring.py
+"""
+Scoring throughput of the binary, BM25 and TF-IDF ATS modes.
+
+Resumes are synthetic (300 words drawn from a Zipf-like vocabulary) and each
+run scores all of them against 5 job descriptions. "page loop" is the ATS
+page's original per-pair check (`w in resume_lower` for every JD keyword),
+which the binary mode must match and beat. "tokenize" is the one-off
+cost of turning resume text into term counts; "score" is the sparse-matrix
+stage that a stored corpus pays per new requisition.
+
+Usage (from "Project File"):
+    python -m benchmarks.bench_scoring --sizes 10000 100000
+"""
+import sys
+import time
+import random
+import argparse
+
+import numpy as np
+
+from ats.scoring import score_many, extract_keywords, resume_term_counts
+from ats.weighting import (
+    IdfModel, term_matrix, keyword_matrix, bm25_scores, tfidf_scores, resume_norm,
+)
+
+
+def make_corpus(n, vocab_size=20000, words=300, seed=0):
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))) for _ in range(vocab_size)]
+    weights = [1 / (rank + 1) for rank in range(vocab_size)]
+    resumes = [" ".join(rng.choices(vocab, weights, k=words)) for _ in range(n)]
+    jds = [" ".join(rng.choices(vocab, weights, k=60)) for _ in range(5)]
+    return resumes, jds
+
+
+def page_loop(resumes, jds):
+    """Matched keyword sets the way the ATS page scored one pair at a time."""
+    out = []
+    for resume_text in resumes:
+        resume_lower = resume_text.lower()
+        out.append([{w for w in extract_keywords(jd) if w in resume_lower} for jd in jds])
+    return out
+
+
+def run(n):
+    resumes, jds = make_corpus(n)
+
+    t = time.perf_counter()
+    expected = page_loop(resumes, jds)
+    page = time.perf_counter() - t
+
+    t = time.perf_counter()
+    result = score_many(resumes, jds, "binary")
+    binary = time.perf_counter() - t
+    assert all(
+        set(result.matched(i, j)) == expected[i][j] for i in range(len(resumes)) for j in range(len(jds))
+    ), "binary mode disagrees with the page loop"
+
+    t = time.perf_counter()
+    counts_list = [resume_term_counts(text) for text in resumes]
+    model = IdfModel()
+    for counts in counts_list:
+        model.update(counts)
+    tokenize = time.perf_counter() - t
+
+    columns = {}
+    jd_columns = [frozenset(columns.setdefault(w, len(columns)) for w in extract_keywords(jd)) for jd in jds]
+    vocabulary = sorted(columns, key=columns.get)
+
+    t = time.perf_counter()
+    tf = term_matrix(counts_list, columns)
+    jd_matrix = keyword_matrix(jd_columns, len(vocabulary))
+    doc_len = np.array([sum(c.values()) for c in counts_list])
+    bm25_scores(tf, doc_len, jd_matrix, model.bm25_idf(vocabulary), model.avgdl)
+    bm25 = time.perf_counter() - t
+
+    norms = np.array([resume_norm(c, model) for c in counts_list], dtype=np.float32)
+    t = time.perf_counter()
+    tf = term_matrix(counts_list, columns)
+    tfidf_scores(tf, norms, jd_matrix, model.tfidf_idf(vocabulary))
+    tfidf = time.perf_counter() - t
+
+    print(f"{n:>7} resumes | page loop {page:6.2f}s | binary (end to end) {binary:6.2f}s | tokenize {tokenize:6.2f}s"
+          f" | bm25 score {bm25:6.3f}s ({n / bm25:,.0f}/s) | tfidf score {tfidf:6.3f}s ({n / tfidf:,.0f}/s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args(argv)
+    for n in args.sizes:
+        run(n)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
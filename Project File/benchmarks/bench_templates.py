@@ -0,0 +1,79 @@
+# benchmarks/bench_templates.py
+"""
+Render latency per resume template: fresh documents, prototypes, and the
+direct OOXML writer.
+
+"fresh" is the pre-prototype path: every render opens python-docx's
+default.docx with `Document()`, applies page setup and resolves paragraph
+styles by name. "prototype" clones the template's prepared prototype and
+uses pre-resolved style ids. "streamed" writes document.xml as text into
+a ZIP with pre-deflated fixed parts (ooxml.py; "-" for templates it does
+not support). All produce identical documents; timings include producing
+the DOCX bytes, as the app does.
+
+Usage (from "Project File"):
+    python -m benchmarks.bench_templates --repeat 50
+"""
+import io
+import sys
+import time
+import argparse
+
+from templetes import engine, ooxml
+from templetes import TEMPLATE_MAP
+
+SAMPLE = {
+    "name": "Ann Lee", "title": "Senior Data Engineer", "contact": "ann@example.com | +1 555 0100 | Berlin",
+    "summary": "Data engineer with eight years of experience building batch and streaming pipelines. " * 3,
+    "experience": [f"Role {i} at Company {i} (2015-2020)\nBuilt and ran data pipelines." for i in range(6)],
+    "education": ["MSc Computer Science, TU Berlin", "BSc Mathematics, LMU Munich"],
+    "skills": ["Python", "SQL", "Spark", "Kafka", "Airflow", "AWS", "Docker", "Kubernetes", "dbt", "Terraform"],
+    "projects": [f"Project {i}: open-source tooling" for i in range(4)],
+    "certificates": ["AWS Certified Data Analytics", "CKAD"],
+    "personal_details": {"Nationality": "German", "Languages": "English, German"},
+    "hobbies": "Climbing, chess", "declaration": "I hereby declare that the above is true.",
+}
+
+
+def _time(template, repeat):
+    template(SAMPLE)  # warm up (builds the prototype)
+    t = time.perf_counter()
+    for _ in range(repeat):
+        template(SAMPLE).save(io.BytesIO())
+    return (time.perf_counter() - t) / repeat * 1000
+
+
+def _time_streamed(plan, repeat):
+    ooxml.render_docx(plan, SAMPLE)  # warm up (deflates the fixed parts)
+    t = time.perf_counter()
+    for _ in range(repeat):
+        ooxml.render_docx(plan, SAMPLE)
+    return (time.perf_counter() - t) / repeat * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    print(f"{'template':<22} {'fresh ms':>9} {'prototype ms':>13} {'speedup':>8} {'streamed ms':>12} {'speedup':>8}")
+    totals = [0.0, 0.0, 0.0]
+    for name, template in TEMPLATE_MAP.items():
+        engine.TEMPLATE_PROTOTYPES = False
+        fresh = _time(template, args.repeat)
+        engine.TEMPLATE_PROTOTYPES = True
+        fast = _time(template, args.repeat)
+        streamed = _time_streamed(template, args.repeat) if ooxml.supports(template) else fast
+        totals[0] += fresh
+        totals[1] += fast
+        totals[2] += streamed
+        if ooxml.supports(template):
+            print(f"{name:<22} {fresh:9.2f} {fast:13.2f} {fresh / fast:7.1f}x {streamed:12.2f} {fresh / streamed:7.1f}x")
+        else:
+            print(f"{name:<22} {fresh:9.2f} {fast:13.2f} {fresh / fast:7.1f}x {'-':>12} {'-':>8}")
+    print(f"{'all templates':<22} {totals[0]:9.2f} {totals[1]:13.2f} {totals[0] / totals[1]:7.1f}x "
+          f"{totals[2]:12.2f} {totals[0] / totals[2]:7.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+# benchmarks/bench_vocabulary.py
+"""
+Memory and scoring time of a CandidatePool against per-resume sets of strings.
+
+Both hold the same taxonomy-normalized distinct terms of synthetic resumes
+(300 words from a Zipf-like vocabulary sprinkled with real skill names) and
+score one compiled JobProfile. Memory is what tracemalloc sees while the
+structure is built; the token lists fed to both are created outside that
+window.
+
+Usage (from "Project File"):
+    python -m benchmarks.bench_vocabulary --sizes 10000 100000
+"""
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from ats.profile import JobProfile, normalized_tokens
+from ats.vocabulary import CandidatePool
+
+SKILL_WORDS = ["python", "java", "sql", "kubernetes", "k8s", "aws", "docker", "react", "machine learning", "power bi"]
+
+
+def make_corpus(n, vocab_size=20000, words=300, seed=0):
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))) for _ in range(vocab_size)]
+    vocab[10:10 + len(SKILL_WORDS)] = SKILL_WORDS
+    weights = [1 / (rank + 1) for rank in range(vocab_size)]
+    resumes = [" ".join(rng.choices(vocab, weights, k=words)) for _ in range(n)]
+    jd = "Required: " + ", ".join(rng.choices(vocab[:400], k=30) + SKILL_WORDS[:6])
+    return resumes, jd
+
+
+def _measure(build):
+    tracemalloc.start()
+    t = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - t
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size, seconds
+
+
+def set_scores(sets, profile):
+    needed = [(frozenset(k), w) for k, w in zip(profile.keywords, profile.weights)]
+    return np.array([100 * sum(w for k, w in needed if k <= terms) / profile.total_weight for terms in sets])
+
+
+def run(n):
+    resumes, jd = make_corpus(n)
+    profile = JobProfile.compile(jd)
+    token_lists = [normalized_tokens(text) for text in resumes]
+    del resumes
+
+    sets, set_bytes, _ = _measure(lambda: [set(tokens) for tokens in token_lists])
+
+    def build_pool():
+        pool = CandidatePool()
+        for i, tokens in enumerate(token_lists):
+            pool.add_tokens(i, tokens)
+        return pool
+
+    pool, pool_bytes, _ = _measure(build_pool)
+
+    t = time.perf_counter()
+    expected = set_scores(sets, profile)
+    set_time = time.perf_counter() - t
+
+    pool.score(profile)  # warm the frozen arrays
+    t = time.perf_counter()
+    got = pool.score(profile)
+    pool_time = time.perf_counter() - t
+    assert np.allclose(expected, got)
+
+    print(f"{n:>7} resumes | sets {set_bytes / 1e6:8.1f} MB ({set_bytes / n:,.0f} B/resume) {set_time:6.3f}s"
+          f" | pool {pool_bytes / 1e6:8.1f} MB ({pool_bytes / n:,.0f} B/resume) {pool_time:6.3f}s"
+          f" | {set_bytes / pool_bytes:4.1f}x less memory, {set_time / pool_time:4.1f}x faster")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args(argv)
+    for n in args.sizes:
+        run(n)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+# content_cache.py
+"""
+Size-bounded caches keyed by content hashes.
+
+- LRUCache: in-process, bounded by the total size of the stored values.
+- DiskCache: SQLite file shared by every process that opens the same path,
+  bounded by total bytes and evicting least recently used entries.
+- TieredCache: an LRUCache in front of an optional DiskCache.
+
+Values are bytes or str; DiskCache stores them as BLOBs and gives back the
+same type.
+"""
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+
+def content_key(data, *parts):
+    """SHA-256 of `data` (bytes), optionally namespaced by extra `parts`."""
+    digest = hashlib.sha256(data).hexdigest()
+    return ":".join([digest, *map(str, parts)]) if parts else digest
+
+
+def _sizeof(value):
+    return len(value)
+
+
+class LRUCache:
+    """Thread-safe LRU mapping bounded by the summed `len()` of its values."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+                return self._data[key]
+            except KeyError:
+                return default
+
+    def put(self, key, value):
+        size = _sizeof(value)
+        if size > self.max_size:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.size -= _sizeof(old)
+            self._data[key] = value
+            self.size += size
+            while self.size > self.max_size:
+                _, evicted = self._data.popitem(last=False)
+                self.size -= _sizeof(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+
+class DiskCache:
+    """LRU cache in a SQLite file, safe to share between worker processes."""
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        is_text INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        atime REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS entries_by_atime ON entries (atime);
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._conn().executescript(self._SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key, default=None):
+        conn = self._conn()
+        row = conn.execute("SELECT value, is_text FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        conn.execute("UPDATE entries SET atime = ? WHERE key = ?", (time.time(), key))
+        value, is_text = row
+        return value.decode("utf-8") if is_text else bytes(value)
+
+    def put(self, key, value):
+        is_text = isinstance(value, str)
+        blob = value.encode("utf-8") if is_text else bytes(value)
+        if len(blob) > self.max_bytes:
+            return
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, is_text, size, atime) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, int(is_text), len(blob), time.time()),
+            )
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(conn, total)
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            conn.execute("ROLLBACK")
+            logging.warning("Disk cache write failed (%s): %s", self.path, e)
+
+    def _evict(self, conn, total):
+        # Drop least recently used entries until 90% of the budget is free.
+        target = self.max_bytes * 0.9
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY atime"):
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def clear(self):
+        self._conn().execute("DELETE FROM entries")
+
+
+class TieredCache:
+    """In-process LRU backed by an optional shared DiskCache."""
+
+    def __init__(self, memory_bytes, disk_path=None, disk_bytes=None):
+        self.memory = LRUCache(memory_bytes)
+        self.disk = DiskCache(disk_path, disk_bytes) if disk_path else None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.put(key, value)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
@@ -0,0 +1,235 @@
+# driver_pool.py
+"""
+Process-wide pool of warm Selenium Chrome drivers.
+
+Starting Chrome takes seconds, and `ChromeDriverManager().install()` may
+query the network for the latest driver on every call. The pool keeps up
+to DRIVER_POOL_SIZE headless drivers alive between fetches:
+
+- `checkout()` hands out an idle driver (starting one only when none is
+  idle and the pool is not full) and takes it back afterwards;
+- a driver that fails its health check on checkout, raised an error while
+  checked out, or has served DRIVER_MAX_USES fetches is quit and replaced
+  in the background;
+- `warm()` starts drivers ahead of the first request.
+
+The chromedriver path is resolved once: CHROMEDRIVER_PATH if set, else the
+path webdriver-manager installed last time (remembered in
+CHROMEDRIVER_PATH_CACHE, under the user's own cache directory so no other
+account can point it at a different binary), else a fresh install. `start_chrome` reinstalls
+it once if Chrome was upgraded past the cached driver.
+
+Usage:
+    pool = DriverPool(create_driver)
+    with pool.checkout() as driver:
+        driver.get(url)
+"""
+import os
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import SessionNotCreatedException
+
+DRIVER_POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", "2"))
+DRIVER_MAX_USES = int(os.environ.get("DRIVER_MAX_USES", "50"))
+DRIVER_CHECKOUT_TIMEOUT = float(os.environ.get("DRIVER_CHECKOUT_TIMEOUT", "120"))
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")
+CHROMEDRIVER_PATH_CACHE = os.environ.get(
+    "CHROMEDRIVER_PATH_CACHE",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "resumind", "chromedriver_path",
+    ),
+)
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def chromedriver_path(refresh=False):
+    """Path of the chromedriver binary, installing it only when unknown."""
+    global _driver_path
+    with _driver_path_lock:
+        if CHROMEDRIVER_PATH:
+            return CHROMEDRIVER_PATH
+        if _driver_path and not refresh and os.path.exists(_driver_path):
+            return _driver_path
+        if not refresh and os.path.exists(CHROMEDRIVER_PATH_CACHE):
+            with open(CHROMEDRIVER_PATH_CACHE, encoding="utf-8") as f:
+                cached = f.read().strip()
+            if cached and os.path.exists(cached):
+                _driver_path = cached
+                return cached
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        _driver_path = ChromeDriverManager().install()
+        try:
+            os.makedirs(os.path.dirname(CHROMEDRIVER_PATH_CACHE), mode=0o700, exist_ok=True)
+            with open(CHROMEDRIVER_PATH_CACHE, "w", encoding="utf-8") as f:
+                f.write(_driver_path)
+        except OSError as e:
+            logging.warning("Could not remember the chromedriver path: %s", e)
+        return _driver_path
+
+
+def start_chrome(options):
+    """webdriver.Chrome on the cached chromedriver, reinstalled once if Chrome has moved on."""
+    try:
+        return webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+    except SessionNotCreatedException:
+        if CHROMEDRIVER_PATH:
+            raise
+        logging.warning("Cached chromedriver does not match the installed Chrome; reinstalling it")
+        return webdriver.Chrome(service=Service(chromedriver_path(refresh=True)), options=options)
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def is_healthy(driver):
+    """True if the browser still answers a trivial script."""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """Thread-safe pool of drivers made by `factory()`."""
+
+    def __init__(self, factory, size=None, max_uses=None):
+        self.factory = factory
+        self.size = size or DRIVER_POOL_SIZE
+        self.max_uses = max_uses or DRIVER_MAX_USES
+        self._idle = []  # LIFO: the most recently used driver is the warmest
+        self._uses = {}
+        self._total = 0  # idle + checked out + starting
+        self._cond = threading.Condition()
+        self._closed = False
+        atexit.register(self.close)
+
+    def _start(self, idle=True):
+        """Start one driver (into the idle list if `idle`); its slot is already counted in _total."""
+        try:
+            driver = self.factory()
+        except Exception:
+            logging.exception("Failed to start a pooled WebDriver")
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            return None
+        with self._cond:
+            if self._closed:
+                self._total -= 1
+                _quit(driver)
+                return None
+            self._uses[driver] = 0
+            if idle:
+                self._idle.append(driver)
+                self._cond.notify()
+        return driver
+
+    def _start_in_background(self):
+        with self._cond:
+            if self._closed or self._total >= self.size:
+                return
+            self._total += 1
+        threading.Thread(target=self._start, name="driver-pool-start", daemon=True).start()
+
+    def warm(self, n=None, background=True):
+        """Start drivers until `n` (default: the pool size) exist."""
+        n = min(n or self.size, self.size)
+        while True:
+            with self._cond:
+                if self._closed or self._total >= n:
+                    return
+                if not background:
+                    self._total += 1
+            if background:
+                self._start_in_background()
+            elif self._start() is None:
+                return
+
+    def _discard(self, driver, replace=True):
+        with self._cond:
+            self._uses.pop(driver, None)
+            self._total -= 1
+            self._cond.notify()
+        _quit(driver)
+        if replace:
+            self._start_in_background()
+
+    def _acquire(self, timeout):
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("DriverPool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._total < self.size:
+                    self._total += 1
+                    break
+                if not self._cond.wait(timeout):
+                    raise TimeoutError(f"No WebDriver free within {timeout}s")
+        driver = self._start(idle=False)
+        if driver is None:
+            raise RuntimeError("Could not start a WebDriver")
+        return driver
+
+    @contextmanager
+    def checkout(self, timeout=None):
+        """Borrow a healthy driver; it goes back to the pool when the block exits."""
+        timeout = DRIVER_CHECKOUT_TIMEOUT if timeout is None else timeout
+        while True:
+            driver = self._acquire(timeout)
+            if is_healthy(driver):
+                break
+            logging.warning("Discarding an unresponsive WebDriver")
+            self._discard(driver, replace=False)
+        try:
+            yield driver
+        except Exception:
+            # The page may have left the browser in a bad state; do not reuse it.
+            self._discard(driver)
+            raise
+        self.release(driver)
+
+    def release(self, driver):
+        with self._cond:
+            self._uses[driver] = uses = self._uses.get(driver, 0) + 1
+        if uses >= self.max_uses:
+            logging.info("Recycling a WebDriver after %d uses", uses)
+            self._discard(driver)
+            return
+        try:
+            driver.get("about:blank")  # drop the last page's DOM and scripts
+        except Exception:
+            self._discard(driver)
+            return
+        with self._cond:
+            if self._closed:
+                self._total -= 1
+                self._uses.pop(driver, None)
+                _quit(driver)
+                return
+            self._idle.append(driver)
+            self._cond.notify()
+
+    def close(self):
+        """Quit every idle driver; checked-out drivers are quit when returned."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for driver in idle:
+            _quit(driver)
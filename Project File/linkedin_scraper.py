@@ -6,26 +6,36 @@ Notes:
 - Put your LINKEDIN_EMAIL and LINKEDIN_PASSWORD in a .env file (see .env.example).
 - For initial debugging set HEADLESS=False so you can watch login / 2FA.
 - If Chrome isn't found automatically, set CHROME_BINARY env var to the chrome executable path.
+- After a successful login the cookies and local storage are saved, encrypted, to
+  LINKEDIN_SESSION_PATH and restored into new drivers; a full login only happens
+  when that session is missing, older than LINKEDIN_SESSION_MAX_AGE_HOURS or rejected.
 """
 
 import os
 import time
 import json
 import logging
+import base64
+import weakref
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
 
 # Selenium imports
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-# webdriver-manager to auto-download chromedriver
-from webdriver_manager.chrome import ChromeDriverManager
+# warm driver pool; the chromedriver path is resolved once via webdriver-manager
+from driver_pool import DriverPool, start_chrome
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+except ImportError:  # without cryptography the session is simply not persisted
+    Fernet = None
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
@@ -36,6 +46,11 @@ PASSWORD = os.environ.get("LINKEDIN_PASSWORD")
 OUTPUT_JSON = os.environ.get("OUTPUT_JSON_PATH", "scraped_profile.json")
 HEADLESS = os.environ.get("HEADLESS", "True").lower() in ["true", "1", "yes"]
 CHROME_BINARY = os.environ.get("CHROME_BINARY", None)
+SESSION_PATH = os.environ.get("LINKEDIN_SESSION_PATH", ".linkedin_session")
+SESSION_MAX_AGE_HOURS = float(os.environ.get("LINKEDIN_SESSION_MAX_AGE_HOURS", "24"))
+# Optional Fernet key; by default the key is derived from the LinkedIn credentials.
+SESSION_KEY = os.environ.get("LINKEDIN_SESSION_KEY")
+LINKEDIN_URL = "https://www.linkedin.com"
 
 def _find_chrome_binary():
     """Try to locate Chrome/Chromium binary on common locations (Windows/Linux/Mac)."""
@@ -60,7 +75,7 @@ def _find_chrome_binary():
     return None
 
 def create_driver(headless=True, implicit_wait=8):
-    """Create Selenium Chrome driver using webdriver-manager Service wrapper."""
+    """Create Selenium Chrome driver on the cached chromedriver (see driver_pool.start_chrome)."""
     chrome_options = Options()
 
     # Headless options - use either modern headless or fallback
@@ -97,15 +112,8 @@ def create_driver(headless=True, implicit_wait=8):
     else:
         logging.warning("Chrome binary not found automatically. If driver fails to start, set CHROME_BINARY env var to chrome executable path.")
 
-    # try to construct Service and driver
     try:
-        service = Service(ChromeDriverManager().install())
-    except Exception as e:
-        logging.error("Failed to install/start chromedriver via webdriver_manager: %s", e)
-        raise
-
-    try:
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver = start_chrome(chrome_options)
         driver.implicitly_wait(implicit_wait)
         return driver
     except Exception as e:
@@ -114,6 +122,18 @@ def create_driver(headless=True, implicit_wait=8):
         logging.error("Common causes: Chrome not installed, version mismatch, path issues, or insufficient permissions.")
         raise
 
+_pool = None
+# Pooled drivers that already went through linkedin_login.
+_logged_in = weakref.WeakSet()
+
+
+def get_pool():
+    """Process-wide pool of warm drivers created with the HEADLESS setting."""
+    global _pool
+    if _pool is None:
+        _pool = DriverPool(lambda: create_driver(headless=HEADLESS))
+    return _pool
+
 def linkedin_login(driver):
     """Login to LinkedIn using credentials from .env"""
     if not EMAIL or not PASSWORD:
@@ -141,6 +161,98 @@ def linkedin_login(driver):
         logging.error("Login flow failed: %s", e)
         raise
 
+def _session_cipher(salt):
+    if SESSION_KEY:
+        return Fernet(SESSION_KEY.encode())
+    kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=200_000)
+    return Fernet(base64.urlsafe_b64encode(kdf.derive(f"{EMAIL}:{PASSWORD}".encode("utf-8"))))
+
+def save_session(driver, path=SESSION_PATH):
+    """Encrypt the driver's LinkedIn cookies and local storage to `path`."""
+    if Fernet is None:
+        logging.warning("cryptography is not installed; the LinkedIn session will not be saved.")
+        return False
+    session = {
+        "cookies": driver.get_cookies(),
+        "local_storage": driver.execute_script("return Object.assign({}, window.localStorage);"),
+    }
+    salt = os.urandom(16)
+    token = _session_cipher(salt).encrypt(json.dumps(session).encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(salt + token)
+    logging.info("Saved LinkedIn session -> %s", path)
+    return True
+
+def load_session(path=SESSION_PATH):
+    """The saved session, or None if missing, unreadable or older than the max age."""
+    if Fernet is None or not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        # Fernet tokens carry their creation time, so the ttl enforces the max age.
+        plain = _session_cipher(data[:16]).decrypt(data[16:], ttl=int(SESSION_MAX_AGE_HOURS * 3600))
+    except (InvalidToken, ValueError):
+        logging.info("Saved LinkedIn session expired or unreadable; a full login is needed.")
+        return None
+    return json.loads(plain)
+
+def is_logged_in(driver, timeout=10):
+    """True if the feed loads with the logged-in navigation (no login wall)."""
+    driver.get(LINKEDIN_URL + "/feed/")
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.ID, "global-nav-search")))
+    except Exception:
+        return False
+    return not any(marker in driver.current_url for marker in ("/login", "authwall", "checkpoint"))
+
+def restore_session(driver, path=SESSION_PATH):
+    """Load the saved cookies and local storage into `driver`; True if LinkedIn accepts them."""
+    session = load_session(path)
+    if not session:
+        return False
+    # Cookies can only be set for the domain currently open.
+    driver.get(LINKEDIN_URL + "/robots.txt")
+    driver.delete_all_cookies()
+    for cookie in session["cookies"]:
+        cookie = {k: v for k, v in cookie.items() if k != "sameSite" or v in ("Strict", "Lax", "None")}
+        if "expiry" in cookie:
+            cookie["expiry"] = int(cookie["expiry"])
+        try:
+            driver.add_cookie(cookie)
+        except Exception as e:
+            logging.debug("Skipping cookie %s: %s", cookie.get("name"), e)
+    driver.execute_script(
+        "const items = arguments[0]; for (const k in items) { window.localStorage.setItem(k, items[k]); }",
+        session.get("local_storage") or {},
+    )
+    if is_logged_in(driver):
+        logging.info("Restored LinkedIn session from %s", path)
+        return True
+    logging.info("Saved LinkedIn session was rejected; logging in again.")
+    return False
+
+def ensure_logged_in(driver):
+    """Log `driver` in once: from the saved session if still valid, else with credentials.
+
+    A driver is only remembered as logged in once that is confirmed, so a
+    failed login is retried on its next use.
+    """
+    if driver in _logged_in:
+        return
+    if not restore_session(driver):
+        logging.info("Logging into LinkedIn...")
+        linkedin_login(driver)
+        if not is_logged_in(driver):
+            logging.warning("Login could not be confirmed; the session was not saved.")
+            return
+        try:
+            save_session(driver)
+        except Exception as e:
+            logging.warning("Could not save the LinkedIn session: %s", e)
+    _logged_in.add(driver)
+
 def scrape_profile(driver, profile_url):
     """Open given LinkedIn profile URL and attempt to extract basic fields and recent posts."""
     driver.get(profile_url)
@@ -230,14 +342,12 @@ def scrape_profile(driver, profile_url):
     return profile
 
 def main(profile_url):
-    driver = None
     try:
-        logging.info("Starting Chrome WebDriver (headless=%s)", HEADLESS)
-        driver = create_driver(headless=HEADLESS)
-        logging.info("Logging into LinkedIn...")
-        linkedin_login(driver)
-        logging.info("Scraping profile: %s", profile_url)
-        scraped = scrape_profile(driver, profile_url)
+        logging.info("Checking out a Chrome WebDriver (headless=%s)", HEADLESS)
+        with get_pool().checkout() as driver:
+            ensure_logged_in(driver)
+            logging.info("Scraping profile: %s", profile_url)
+            scraped = scrape_profile(driver, profile_url)
         with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
             json.dump(scraped, f, indent=2, ensure_ascii=False)
         logging.info("Saved scraped data -> %s", OUTPUT_JSON)
@@ -251,12 +361,6 @@ def main(profile_url):
         except Exception:
             pass
         raise
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
 
 if __name__ == "__main__":
     import sys
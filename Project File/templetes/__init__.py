@@ -1 +1,2 @@
-from .templates import TEMPLATE_MAP
\ No newline at end of file
+from .templates import TEMPLATE_MAP
+from .cache import render_bytes
\ No newline at end of file
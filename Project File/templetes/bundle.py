@@ -0,0 +1,80 @@
+# templates/bundle.py
+"""
+Render one resume in every template at once and pack the results in a ZIP.
+
+Templates missing from the render cache are fanned out over a process pool
+(RENDER_WORKERS, default one per CPU), so the wall time is close to that of
+the slowest template rather than the sum of all of them. Results are
+written into the ZIP as they complete; cached templates are never sent to
+the pool.
+
+Usage:
+    zip_bytes = render_all_zip(data)
+"""
+import io
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .cache import render_bytes, render_key, _cache
+from .templates import TEMPLATE_MAP
+
+RENDER_WORKERS = int(os.environ.get("RENDER_WORKERS", "0")) or os.cpu_count() or 1
+
+_pool = None
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=RENDER_WORKERS)
+    return _pool
+
+
+def template_filename(template_name, prefix=""):
+    """File name for a template: "Academic / Research" -> "Academic_Research.docx"."""
+    return prefix + re.sub(r"[^A-Za-z0-9]+", "_", template_name).strip("_") + ".docx"
+
+
+def iter_renders(data, names=None, workers=None):
+    """Yield (template name, DOCX bytes) for each template as soon as it is ready."""
+    names = list(names or TEMPLATE_MAP)
+    workers = workers or RENDER_WORKERS
+    missing = []
+    for name in names:
+        docx = _cache.get(render_key(name, data))
+        if docx is None:
+            missing.append(name)
+        else:
+            yield name, docx
+    if len(missing) <= 1 or workers <= 1:
+        for name in missing:
+            yield name, render_bytes(name, data)
+        return
+    pool = _get_pool()
+    futures = {pool.submit(render_bytes, name, data): name for name in missing}
+    try:
+        for future in as_completed(futures):
+            name = futures[future]
+            docx = future.result()
+            _cache.put(render_key(name, data), docx)
+            yield name, docx
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def write_zip(out, data, names=None, workers=None, prefix=""):
+    """Write every template's DOCX for `data` into the ZIP file object `out`."""
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, docx in iter_renders(data, names, workers):
+            # DOCX files are already deflated; storing them avoids recompressing.
+            zf.writestr(template_filename(name, prefix), docx, compress_type=zipfile.ZIP_STORED)
+
+
+def render_all_zip(data, names=None, workers=None, prefix=""):
+    """ZIP (bytes) with `data` rendered in every template (or in `names`)."""
+    bio = io.BytesIO()
+    write_zip(bio, data, names, workers, prefix)
+    return bio.getvalue()
@@ -0,0 +1,59 @@
+# templates/cache.py
+"""
+Cache of rendered resumes as DOCX bytes.
+
+The key is the template name, its spec version and fingerprint, and the
+SHA-256 of the normalized resume data, so an identical request (a repeated
+"Generate" click, a Streamlit rerun, another session) returns the stored
+bytes without running python-docx. The in-process LRU is bounded by
+RENDER_CACHE_MEMORY_MB; setting RENDER_CACHE_PATH adds a SQLite layer
+shared by processes.
+"""
+import io
+import os
+import json
+import hashlib
+
+from content_cache import TieredCache, content_key
+
+from .engine import normalize_data
+from .ooxml import docx_bytes
+from .templates import TEMPLATE_MAP
+
+RENDER_CACHE_PATH = os.environ.get("RENDER_CACHE_PATH")
+RENDER_CACHE_MEMORY_MB = int(os.environ.get("RENDER_CACHE_MEMORY_MB", "32"))
+RENDER_CACHE_DISK_MB = int(os.environ.get("RENDER_CACHE_DISK_MB", "256"))
+
+_cache = TieredCache(
+    RENDER_CACHE_MEMORY_MB * 1024 * 1024,
+    RENDER_CACHE_PATH,
+    RENDER_CACHE_DISK_MB * 1024 * 1024,
+)
+
+
+def _fingerprint(plan):
+    # Guards against a spec edited without bumping its version.
+    spec = json.dumps(plan.spec, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(spec).hexdigest()[:16]
+
+
+def render_key(template_name, data):
+    """Cache key of one (template, resume data) render."""
+    plan = TEMPLATE_MAP[template_name]
+    payload = json.dumps(normalize_data(data), sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return content_key(payload, "render", template_name, plan.version, _fingerprint(plan))
+
+
+def document_bytes(doc):
+    bio = io.BytesIO()
+    doc.save(bio)
+    return bio.getvalue()
+
+
+def render_bytes(template_name, data, cache=None):
+    """DOCX bytes of `data` rendered with a TEMPLATE_MAP template, cached."""
+    cache = cache or _cache
+    return cache.get_or_compute(
+        render_key(template_name, data),
+        lambda: docx_bytes(TEMPLATE_MAP[template_name], data),
+    )
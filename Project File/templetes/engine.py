@@ -0,0 +1,303 @@
+# templates/engine.py
+"""
+Compiles declarative template specs into render plans and executes them.
+
+A spec (see templates.json) describes a template as data: header size and
+color, heading style, page margins, optional rules, an optional two-column
+table, and the ordered sections with their title, data field(s) and list
+style ("text", "bullets", "pairs" or "inline"). `compile_template` turns a
+spec into a TemplatePlan once: a flat list of (step, args) pairs where
+titles are already upper-cased and fonts, colors, alignment and spacing
+are already python-docx objects. Rendering is a loop over the steps.
+
+Documents start from a per-template DocumentPrototype (prototype.py) with
+the page setup applied, cloned in memory, and styled paragraphs get style
+ids resolved once. Set TEMPLATE_PROTOTYPES=0 to render every document from
+a fresh `Document()` with name-based styles instead.
+"""
+import os
+
+from docx import Document
+from docx.shared import Pt, Inches, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+from .prototype import DocumentPrototype
+
+TEMPLATE_PROTOTYPES = os.environ.get("TEMPLATE_PROTOTYPES", "1") != "0"
+
+TEXT_FIELDS = ("name", "title", "contact", "summary", "hobbies", "declaration")
+LIST_FIELDS = ("experience", "education", "skills", "projects", "certificates")
+# Keys older callers used for the same data.
+FIELD_ALIASES = {"certifications": "certificates"}
+
+_ALIGN = {"left": WD_ALIGN_PARAGRAPH.LEFT, "center": WD_ALIGN_PARAGRAPH.CENTER, "right": WD_ALIGN_PARAGRAPH.RIGHT}
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.splitlines()
+    return [str(v).strip() for v in value if v is not None and str(v).strip()]
+
+
+def _as_pairs(value):
+    if isinstance(value, dict):
+        return {str(k): "" if v is None else str(v) for k, v in value.items()}
+    pairs = {}
+    for line in _as_list(value):
+        if ":" in line:
+            k, v = line.split(":", 1)
+            pairs[k.strip()] = v.strip()
+    return pairs
+
+
+def normalize_data(data):
+    """Resume data in the shape every template expects.
+
+    Text fields are str (None when absent, so spec defaults apply), list
+    fields are lists of non-empty strings (a multi-line string is split)
+    and personal_details is a dict (parsed from "Key: Value" lines if
+    needed). Unknown keys are kept as they are.
+    """
+    data = dict(data or {})
+    for alias, field in FIELD_ALIASES.items():
+        if alias in data and field not in data:
+            data[field] = data.pop(alias)
+    for field in TEXT_FIELDS:
+        if data.get(field) is not None:
+            data[field] = str(data[field])
+        else:
+            data[field] = None
+    for field in LIST_FIELDS:
+        data[field] = _as_list(data.get(field))
+    data["personal_details"] = _as_pairs(data.get("personal_details"))
+    return data
+
+
+def _text_values(data):
+    return {k: data[k] or "" for k in TEXT_FIELDS}
+
+
+class _Context:
+    """Per-document render state."""
+
+    def __init__(self, doc, prototype=None):
+        self.doc = doc
+        self.prototype = prototype
+
+    def styled(self, container, text, style):
+        """`container.add_paragraph(text, style)` without a style-sheet scan when possible."""
+        if self.prototype is None:
+            return container.add_paragraph(text, style)
+        para = container.add_paragraph(text)
+        para._p.style = self.prototype.style_id(style)
+        return para
+
+
+def _heading_style(level):
+    # Same names python-docx's add_heading uses.
+    return "Title" if level == 0 else f"Heading {level}"
+
+
+# ---- render steps: step(container, ctx, data, *args) ----
+
+
+def _rule(container, ctx, data):
+    container.add_paragraph("_" * 100)
+
+
+def _name_run(container, ctx, data, placeholder, size, color):
+    para = container.add_paragraph()
+    run = para.add_run(data["name"] if data["name"] is not None else placeholder)
+    run.font.size = size
+    run.bold = True
+    if color is not None:
+        run.font.color.rgb = color
+    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+
+def _name_heading(container, ctx, data, placeholder, level):
+    ctx.styled(container, data["name"] if data["name"] is not None else placeholder, _heading_style(level))
+
+
+def _line(container, ctx, data, template, align):
+    para = container.add_paragraph(template.format_map(_text_values(data)))
+    if align is not None:
+        para.alignment = align
+
+
+def _heading_run(container, ctx, data, text, size, color, space_before, space_after):
+    para = container.add_paragraph()
+    run = para.add_run(text)
+    run.font.size = size
+    run.bold = True
+    if color is not None:
+        run.font.color.rgb = color
+    para.alignment = WD_ALIGN_PARAGRAPH.LEFT
+    para.paragraph_format.space_before = space_before
+    para.paragraph_format.space_after = space_after
+
+
+def _heading_label(container, ctx, data, text):
+    container.add_paragraph().add_run(text).bold = True
+
+
+def _heading_doc(container, ctx, data, text, level):
+    ctx.styled(container, text, _heading_style(level))
+
+
+def _text(container, ctx, data, field, default):
+    value = data.get(field)
+    container.add_paragraph(value if value is not None else default)
+
+
+def _bullets(container, ctx, data, fields):
+    for field in fields:
+        for item in data[field]:
+            ctx.styled(container, item, "List Bullet")
+
+
+def _pairs(container, ctx, data, field):
+    for key, value in data[field].items():
+        container.add_paragraph(f"{key}: {value}")
+
+
+def _inline(container, ctx, data, fields):
+    container.add_paragraph(", ".join(item for field in fields for item in data[field]))
+
+
+def _columns(container, ctx, data, widths, plans):
+    table = container.add_table(rows=1, cols=len(plans))
+    for column, width in zip(table.columns, widths):
+        column.width = width
+    for i, steps in enumerate(plans):
+        cell = table.cell(0, i)
+        for step, args in steps:
+            step(cell, ctx, data, *args)
+
+
+_BODY_STEPS = {"text": _text, "bullets": _bullets, "pairs": _pairs, "inline": _inline}
+
+
+def _rgb(color):
+    return RGBColor(*color) if color else None
+
+
+def _compile_sections(sections, heading):
+    steps = []
+    style = heading.get("style", "run")
+    upper = heading.get("upper", True)
+    for section in sections:
+        title = section["title"].upper() if upper else section["title"]
+        if style == "heading":
+            steps.append((_heading_doc, (title, heading.get("level", 2))))
+        elif style == "label":
+            steps.append((_heading_label, (title,)))
+        else:
+            steps.append((_heading_run, (
+                title,
+                Pt(heading.get("size", 12)),
+                _rgb(section.get("color", heading.get("color"))),
+                Pt(heading.get("space_before", 12)),
+                Pt(heading.get("space_after", 6)),
+            )))
+        kind = section.get("style", "text")
+        fields = section.get("fields") or [section["field"]]
+        fields = [FIELD_ALIASES.get(f, f) for f in fields]
+        if kind == "text":
+            steps.append((_text, (fields[0], section.get("default", ""))))
+        elif kind == "pairs":
+            steps.append((_pairs, (fields[0],)))
+        elif kind in _BODY_STEPS:
+            steps.append((_BODY_STEPS[kind], (tuple(fields),)))
+        else:
+            raise ValueError(f"Unknown section style {kind!r} in section {section['title']!r}")
+    return steps
+
+
+def _page_setup(margins):
+    def setup(doc):
+        section = doc.sections[0]
+        for side, value in margins:
+            setattr(section, f"{side}_margin", value)
+    return setup
+
+
+_prototypes = {}
+
+
+def _prototype(margins):
+    """One shared prototype per distinct page setup."""
+    prototype = _prototypes.get(margins)
+    if prototype is None:
+        prototype = _prototypes[margins] = DocumentPrototype(_page_setup(margins))
+    return prototype
+
+
+class TemplatePlan:
+    """A compiled template; call it with resume data to get a Document."""
+
+    def __init__(self, name, spec, steps, margins=()):
+        self.name = name
+        self.spec = spec
+        self.version = spec.get("version", 1)
+        self.steps = steps
+        self.margins = margins
+        self._prototype = None
+
+    @property
+    def prototype(self):
+        if self._prototype is None:
+            self._prototype = _prototype(self.margins)
+        return self._prototype
+
+    def __repr__(self):
+        return f"TemplatePlan({self.name!r}, version={self.version}, steps={len(self.steps)})"
+
+    def __call__(self, data):
+        return self.render(data)
+
+    def render(self, data, doc=None):
+        """Render normalized `data` into `doc` (a new Document by default)."""
+        if doc is None and TEMPLATE_PROTOTYPES:
+            ctx = _Context(self.prototype.clone(), self.prototype)
+        else:
+            if doc is None:
+                doc = Document()
+            _page_setup(self.margins)(doc)
+            ctx = _Context(doc)
+        doc = ctx.doc
+        data = normalize_data(data)
+        for step, args in self.steps:
+            step(doc, ctx, data, *args)
+        return doc
+
+
+def compile_template(name, spec):
+    """Compile one template spec into a TemplatePlan."""
+    steps = []
+    margins = tuple((side, Inches(v)) for side, v in sorted((spec.get("margins") or {}).items()))
+    if spec.get("rules"):
+        steps.append((_rule, ()))
+
+    header = spec.get("header", {})
+    placeholder = header.get("placeholder", "")
+    if header.get("style") == "heading":
+        steps.append((_name_heading, (placeholder, header.get("level", 1))))
+    else:
+        steps.append((_name_run, (placeholder, Pt(header.get("size", 16)), _rgb(header.get("color")))))
+    align = _ALIGN.get(header.get("align"))
+    for line in header.get("lines", ["{title}", "{contact}"]):
+        steps.append((_line, (line, align)))
+
+    heading = spec.get("heading", {})
+    steps.extend(_compile_sections(spec.get("sections", []), heading))
+    if spec.get("columns"):
+        columns = spec["columns"]
+        plans = [_compile_sections(sections, heading) for sections in columns["sections"]]
+        steps.append((_columns, (tuple(Inches(w) for w in columns["widths"]), plans)))
+
+    if spec.get("rules"):
+        steps.append((_rule, ()))
+    return TemplatePlan(name, spec, steps, margins)
@@ -0,0 +1,270 @@
+# templates/generate.py
+"""
+Bulk resume generation from a JSONL file of profiles.
+
+Each line is either template data (the dict the Create page builds) or a
+scraped LinkedIn profile (as written by linkedin_scraper.py), and is
+rendered through a TEMPLATE_MAP entry on a worker pool. Documents are
+written in input order to a directory or a ZIP as they finish; at most
+`2 * workers` lines are in flight, so memory stays flat for any input size.
+
+A checkpoint file next to the output records how many input lines are
+done; running the same command again resumes after them. That includes a
+ZIP left without its central directory by a killed run: the complete
+entries are recovered from their local headers (the cut-off file is kept as
+`.broken`). A line may pick its own template with a "template" key.
+
+Usage (from "Project File"):
+    python -m templetes.generate cohort.jsonl --template "Corporate" --out resumes/
+    python -m templetes.generate cohort.jsonl --out resumes.zip --workers 8
+"""
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+import logging
+import zipfile
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .bundle import template_filename
+from .ooxml import docx_bytes
+from .templates import TEMPLATE_MAP
+
+GENERATE_WORKERS = int(os.environ.get("GENERATE_WORKERS", "0")) or os.cpu_count() or 1
+CHECKPOINT_EVERY = 100
+
+
+def profile_to_template_data(profile):
+    """Template data for a scraped LinkedIn profile."""
+    return {
+        "name": profile.get("name", ""),
+        "title": profile.get("headline", ""),
+        "contact": profile.get("location", ""),
+        "summary": profile.get("headline", ""),
+        "experience": [f"{exp.get('title', '')} at {exp.get('company', '')} ({exp.get('date_range', '')})\n{exp.get('summary', '')}" for exp in profile.get("experiences", [])],
+        "education": [f"{edu.get('degree', '')}, {edu.get('field','')} at {edu.get('school', '')} ({edu.get('date_range', '')})" for edu in profile.get("educations", [])],
+        "skills": profile.get("skills", []),
+        "projects": [], "certificates": [], "personal_details": {}, "declaration": "", "hobbies": ""
+    }
+
+
+def template_data(record):
+    """Accept template data as is; convert LinkedIn profiles."""
+    if "experiences" in record or "headline" in record:
+        return profile_to_template_data(record)
+    return record
+
+
+def render_record(template_name, record):
+    """(file name stem, DOCX bytes) for one input record."""
+    data = template_data(record)
+    return data.get("name") or "resume", docx_bytes(TEMPLATE_MAP[template_name], data)
+
+
+def _render_line(lineno, line, template_name):
+    try:
+        record = json.loads(line)
+        template_name = record.pop("template", template_name)
+        stem, docx = render_record(template_name, record)
+        return lineno, template_filename(stem, f"{lineno:06d}_"), docx, None
+    except Exception as e:
+        return lineno, None, None, f"{type(e).__name__}: {e}"
+
+
+class DirectoryWriter:
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, filename, data):
+        target = os.path.join(self.path, filename)
+        with open(target + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(target + ".tmp", target)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _check_complete(path):
+    # Without its end record the archive is unusable, and zipfile would
+    # happily open the stored DOCX (itself a ZIP) nearest the end instead.
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() < 22:
+            raise zipfile.BadZipFile(path)
+        f.seek(-22, os.SEEK_END)
+        if f.read(4) != b"PK\x05\x06":
+            raise zipfile.BadZipFile(path)
+
+
+def _recover_zip(broken, path):
+    """Copy the complete entries of a ZIP that has no central directory into `path`.
+
+    ZipWriter stores entries uncompressed with their sizes and CRC in the
+    local header, so the file can be walked header by header; the walk stops
+    at the first entry that is cut off or does not check out.
+    """
+    kept = 0
+    with open(broken, "rb") as src, zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as dst:
+        while True:
+            header = src.read(30)
+            if len(header) < 30 or header[:4] != b"PK\x03\x04":
+                break
+            _, _, flags, method, dos_time, dos_date, crc, size, _, name_len, extra_len = struct.unpack(
+                "<IHHHHHIIIHH", header
+            )
+            name = src.read(name_len)
+            src.seek(extra_len, os.SEEK_CUR)
+            data = src.read(size)
+            if method != zipfile.ZIP_STORED or flags & 0x08 or len(data) < size or zlib.crc32(data) != crc:
+                break
+            date_time = (
+                (dos_date >> 9) + 1980, (dos_date >> 5) & 0xF, dos_date & 0x1F,
+                dos_time >> 11, (dos_time >> 5) & 0x3F, (dos_time & 0x1F) * 2,
+            )
+            dst.writestr(zipfile.ZipInfo(name.decode("utf-8" if flags & 0x800 else "cp437"), date_time), data)
+            kept += 1
+    return kept
+
+
+class ZipWriter:
+    """Appends to the ZIP; it is only complete after `close` (also on errors/Ctrl-C)."""
+
+    def __init__(self, path, resume):
+        self.path = path
+        mode = "a" if resume and os.path.exists(path) else "w"
+        if mode == "a":
+            _check_complete(path)
+        self._zf = zipfile.ZipFile(path, mode, zipfile.ZIP_STORED)
+        # Entries written after the last checkpoint are already there on resume.
+        self._names = set(self._zf.namelist())
+
+    def write(self, filename, data):
+        if filename not in self._names:
+            self._zf.writestr(filename, data)
+            self._names.add(filename)
+
+    def flush(self):
+        self._zf.fp.flush()
+
+    def close(self):
+        self._zf.close()
+
+
+def open_writer(path, resume):
+    if path.lower().endswith(".zip"):
+        return ZipWriter(path, resume)
+    return DirectoryWriter(path)
+
+
+def _read_checkpoint(path, source):
+    if not os.path.exists(path):
+        return 0
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("input") != os.path.abspath(source):
+        raise ValueError(f"Checkpoint {path} belongs to {state.get('input')}, not {source}")
+    return state["done"]
+
+
+def _write_checkpoint(path, source, done):
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"input": os.path.abspath(source), "done": done}, f)
+    os.replace(path + ".tmp", path)
+
+
+def iter_lines(source, start=0):
+    """(line number, line) pairs of a JSONL file from `start`, skipping blanks."""
+    with open(source, encoding="utf-8") as f:
+        for lineno, line in enumerate(f):
+            if lineno >= start and line.strip():
+                yield lineno, line
+
+
+def iter_rendered(lines, template_name, workers=None):
+    """Render (line number, line) pairs in order; yields _render_line results."""
+    workers = workers or GENERATE_WORKERS
+    if workers <= 1:
+        for lineno, line in lines:
+            yield _render_line(lineno, line, template_name)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for lineno, line in lines:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_render_line, lineno, line, template_name))
+        while pending:
+            yield pending.popleft().result()
+
+
+def generate(source, out, template_name, workers=None, resume=True, progress=None):
+    """Render every line of `source` into `out` (directory or .zip); returns stats."""
+    if template_name not in TEMPLATE_MAP:
+        raise KeyError(f"Unknown template {template_name!r}; choose from {', '.join(TEMPLATE_MAP)}")
+    checkpoint = out.rstrip("/\\") + ".checkpoint"
+    start = _read_checkpoint(checkpoint, source) if resume else 0
+    stats = {"done": 0, "errors": 0, "skipped": start, "seconds": 0.0, "per_second": 0.0}
+    try:
+        writer = open_writer(out, resume and start > 0)
+    except zipfile.BadZipFile:
+        # A killed run never wrote the ZIP's central directory; rebuild it
+        # from the entries that made it to disk and carry on from the checkpoint.
+        os.replace(out, out + ".broken")
+        kept = _recover_zip(out + ".broken", out)
+        logging.warning("%s was incomplete; recovered %d documents (original kept as %s.broken)", out, kept, out)
+        writer = open_writer(out, True)
+    t0 = time.perf_counter()
+    done_through = start
+    try:
+        for lineno, filename, docx, error in iter_rendered(iter_lines(source, start), template_name, workers):
+            if error:
+                stats["errors"] += 1
+                logging.warning("Line %d skipped: %s", lineno + 1, error)
+            else:
+                writer.write(filename, docx)
+                stats["done"] += 1
+            done_through = lineno + 1
+            stats["seconds"] = time.perf_counter() - t0
+            stats["per_second"] = stats["done"] / max(stats["seconds"], 1e-9)
+            if (stats["done"] + stats["errors"]) % CHECKPOINT_EVERY == 0:
+                writer.flush()
+                _write_checkpoint(checkpoint, source, done_through)
+                if progress:
+                    progress(stats)
+    finally:
+        writer.close()
+        _write_checkpoint(checkpoint, source, done_through)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render resumes in bulk from a JSONL file of profiles.")
+    parser.add_argument("source", help="JSONL file: one template-data dict or LinkedIn profile per line")
+    parser.add_argument("--out", required=True, help="Output directory, or a .zip file")
+    parser.add_argument("--template", default=next(iter(TEMPLATE_MAP)), choices=list(TEMPLATE_MAP))
+    parser.add_argument("--workers", type=int, default=GENERATE_WORKERS)
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore the checkpoint and start from the first line (resuming works for "
+                             "directories and for ZIPs cut off by a killed run)")
+    args = parser.parse_args(argv)
+
+    def report(stats):
+        logging.info("%d resumes, %.1f docs/s", stats["done"], stats["per_second"])
+
+    stats = generate(args.source, args.out, args.template, args.workers, not args.restart, report)
+    logging.info("Rendered %d resumes (%d errors, %d lines skipped from checkpoint) in %.1fs, %.1f docs/s -> %s",
+                 stats["done"], stats["errors"], stats["skipped"], stats["seconds"], stats["per_second"], args.out)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sys.exit(main())
@@ -0,0 +1,260 @@
+# templates/ooxml.py
+"""
+Direct DOCX writer for templates made only of paragraphs.
+
+python-docx builds an lxml tree for every paragraph and run, then
+serializes it and deflates every package part again on save, including
+the ~800 KB of styles that never change. For plain templates (everything
+except the two-column layouts) the output is predictable enough to write
+`word/document.xml` as text straight from the compiled plan's steps. The
+fixed parts (styles, numbering, theme, settings, ...) come from the
+template's DocumentPrototype and are deflated once; each render only
+writes document.xml and the ZIP directory.
+
+The result is the same DOCX python-docx would produce: every part is
+byte-identical, only the ZIP container differs (fixed timestamps).
+Templates the writer cannot express fall back to python-docx. Set
+TEMPLATE_STREAMING=0 to always use python-docx.
+
+Usage:
+    docx = docx_bytes(TEMPLATE_MAP["Simple ATS-Friendly"], data)
+"""
+import io
+import os
+import re
+import zlib
+import struct
+import zipfile
+import threading
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.opc.oxml import serialize_part_xml
+
+from . import engine
+from .engine import normalize_data, _text_values, _heading_style
+
+TEMPLATE_STREAMING = os.environ.get("TEMPLATE_STREAMING", "1") != "0"
+
+# Characters lxml refuses in text; python-docx raises ValueError on them too.
+_INVALID_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_DOS_TIME, _DOS_DATE = 0, (0 << 9) | (1 << 5) | 1  # 1980-01-01 00:00
+
+
+def _escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _t(text):
+    if _INVALID_XML.search(text):
+        raise ValueError("All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters")
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{_escape(text)}</w:t>'
+    return f"<w:t>{_escape(text)}</w:t>"
+
+
+def _run_content(text):
+    # Same mapping as python-docx's Run.text setter: tabs and line breaks
+    # become <w:tab/> and <w:br/> between <w:t> runs of plain text.
+    out = []
+    start = 0
+    for i, ch in enumerate(text):
+        if ch in "\t\n\r":
+            if i > start:
+                out.append(_t(text[start:i]))
+            out.append("<w:tab/>" if ch == "\t" else "<w:br/>")
+            start = i + 1
+    if start < len(text):
+        out.append(_t(text[start:]))
+    return "".join(out)
+
+
+def _paragraph(text, ppr="", rpr=""):
+    run = f"<w:r>{rpr}{_run_content(text)}</w:r>" if text or rpr else ""
+    if ppr:
+        ppr = f"<w:pPr>{ppr}</w:pPr>"
+    if not ppr and not run:
+        return "<w:p/>"
+    return f"<w:p>{ppr}{run}</w:p>"
+
+
+def _rpr(size=None, color=None, bold=False):
+    # Children in schema order: b, color, sz.
+    parts = ["<w:b/>"] if bold else []
+    if color is not None:
+        parts.append(f'<w:color w:val="{color}"/>')
+    if size is not None:
+        parts.append(f'<w:sz w:val="{int(size.pt * 2)}"/>')
+    return f"<w:rPr>{''.join(parts)}</w:rPr>"
+
+
+def _jc(align):
+    return f'<w:jc w:val="{WD_ALIGN_PARAGRAPH.to_xml(align)}"/>'
+
+
+def _style(ctx, name):
+    return f'<w:pStyle w:val="{ctx.style_id(name)}"/>'
+
+
+# ---- XML counterparts of engine's render steps: emit(out, ctx, data, *args) ----
+
+
+def _rule(out, ctx, data):
+    out.append(_paragraph("_" * 100))
+
+
+def _name_run(out, ctx, data, placeholder, size, color):
+    name = data["name"] if data["name"] is not None else placeholder
+    out.append(_paragraph(name, _jc(WD_ALIGN_PARAGRAPH.CENTER), _rpr(size, color, bold=True)))
+
+
+def _name_heading(out, ctx, data, placeholder, level):
+    name = data["name"] if data["name"] is not None else placeholder
+    out.append(_paragraph(name, _style(ctx, _heading_style(level))))
+
+
+def _line(out, ctx, data, template, align):
+    out.append(_paragraph(template.format_map(_text_values(data)), _jc(align) if align is not None else ""))
+
+
+def _heading_run(out, ctx, data, text, size, color, space_before, space_after):
+    spacing = f'<w:spacing w:before="{space_before.twips}" w:after="{space_after.twips}"/>'
+    out.append(_paragraph(text, spacing + _jc(WD_ALIGN_PARAGRAPH.LEFT), _rpr(size, color, bold=True)))
+
+
+def _heading_label(out, ctx, data, text):
+    out.append(_paragraph(text, rpr=_rpr(bold=True)))
+
+
+def _heading_doc(out, ctx, data, text, level):
+    out.append(_paragraph(text, _style(ctx, _heading_style(level))))
+
+
+def _text(out, ctx, data, field, default):
+    value = data.get(field)
+    out.append(_paragraph(value if value is not None else default))
+
+
+def _bullets(out, ctx, data, fields):
+    style = _style(ctx, "List Bullet")
+    for field in fields:
+        for item in data[field]:
+            out.append(_paragraph(item, style))
+
+
+def _pairs(out, ctx, data, field):
+    for key, value in data[field].items():
+        out.append(_paragraph(f"{key}: {value}"))
+
+
+def _inline(out, ctx, data, fields):
+    out.append(_paragraph(", ".join(item for field in fields for item in data[field])))
+
+
+_EMITTERS = {
+    engine._rule: _rule,
+    engine._name_run: _name_run,
+    engine._name_heading: _name_heading,
+    engine._line: _line,
+    engine._heading_run: _heading_run,
+    engine._heading_label: _heading_label,
+    engine._heading_doc: _heading_doc,
+    engine._text: _text,
+    engine._bullets: _bullets,
+    engine._pairs: _pairs,
+    engine._inline: _inline,
+}
+
+
+def supports(plan):
+    """True if every step of `plan` has an XML emitter (no tables)."""
+    return all(step in _EMITTERS for step, _ in plan.steps)
+
+
+class _Member:
+    """One ZIP entry: local header plus compressed data, and what the directory needs."""
+
+    def __init__(self, name, crc, size, compressed, method=zipfile.ZIP_DEFLATED, flags=0, dos_time=_DOS_TIME, dos_date=_DOS_DATE):
+        self.name = name.encode("utf-8")
+        self.header = (method, dos_time, dos_date, crc, len(compressed), size)
+        self.flags = flags
+        self.blob = struct.pack(
+            "<IHHHHHIIIHH", 0x04034B50, 20, flags, *self.header, len(self.name), 0,
+        ) + self.name + compressed
+
+    @classmethod
+    def deflated(cls, name, data):
+        deflate = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        return cls(name, zlib.crc32(data), len(data), deflate.compress(data) + deflate.flush())
+
+    def directory_entry(self, offset):
+        return struct.pack(
+            "<IHHHHHHIIIHHHHHII", 0x02014B50, 20, 20, self.flags, *self.header,
+            len(self.name), 0, 0, 0, 0, 0, offset,
+        ) + self.name
+
+
+def _zip(members):
+    """ZIP archive bytes from _Members, in order."""
+    out, directory = [], []
+    offset = 0
+    for member in members:
+        directory.append(member.directory_entry(offset))
+        out.append(member.blob)
+        offset += len(member.blob)
+    directory = b"".join(directory)
+    out.append(directory)
+    out.append(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(members), len(members), len(directory), offset, 0))
+    return b"".join(out)
+
+
+class _Package:
+    """The fixed parts of a prototype's DOCX, deflated once, around a document.xml slot."""
+
+    DOCUMENT = "word/document.xml"
+
+    def __init__(self, prototype):
+        bio = io.BytesIO()
+        prototype.clone().save(bio)
+        with zipfile.ZipFile(bio) as zf:
+            self.members = [None if name == self.DOCUMENT else _Member.deflated(name, zf.read(name)) for name in zf.namelist()]
+        document = serialize_part_xml(prototype.document.element)
+        split = document.index(b"<w:body>") + len(b"<w:body>")
+        self.head, self.tail = document[:split], document[split:]
+
+    def write(self, body):
+        """Complete DOCX bytes with `body` (XML text) as the document body."""
+        document = _Member.deflated(self.DOCUMENT, self.head + body.encode("utf-8") + self.tail)
+        return _zip([member or document for member in self.members])
+
+
+_packages = {}
+_lock = threading.Lock()
+
+
+def _package(plan):
+    package = _packages.get(plan.margins)
+    if package is None:
+        with _lock:
+            package = _packages.get(plan.margins)
+            if package is None:
+                package = _packages[plan.margins] = _Package(plan.prototype)
+    return package
+
+
+def render_docx(plan, data):
+    """DOCX bytes of `data` rendered with a plan that `supports`."""
+    data = normalize_data(data)
+    ctx = plan.prototype
+    out = []
+    for step, args in plan.steps:
+        _EMITTERS[step](out, ctx, data, *args)
+    return _package(plan).write("".join(out))
+
+
+def docx_bytes(plan, data):
+    """DOCX bytes of one render: streamed when possible, python-docx otherwise."""
+    if TEMPLATE_STREAMING and supports(plan):
+        return render_docx(plan, data)
+    bio = io.BytesIO()
+    plan(data).save(bio)
+    return bio.getvalue()
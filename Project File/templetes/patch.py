@@ -0,0 +1,320 @@
+# templates/patch.py
+"""
+In-place text edits of an existing DOCX for the Upload & Edit page.
+
+The page edits the document as plain text, one line per body paragraph
+(the same text python-docx's `doc.paragraphs` gives, minus paragraphs that
+only hold an image or a section break, which are kept as they are; a
+paragraph with text and an image loses only its text when its line is
+deleted). Instead of building
+a new Document from the edited lines, `DocxEditor.save` diffs the edited
+lines against the original ones, maps every changed line back to its
+paragraph and every changed character range back to the run it came from,
+and rewrites only those runs in word/document.xml. Paragraph and run
+properties, tables, headers, images and everything else stay as they were.
+
+Only the main document part is re-serialized and deflated; all other ZIP
+entries are copied through as their original compressed bytes. An
+unchanged text returns the uploaded bytes untouched.
+
+Usage:
+    editor = DocxEditor(uploaded.getvalue())
+    edited = st.text_area("...", editor.text)
+    docx = editor.save(edited)
+"""
+import copy
+import struct
+import zipfile
+import posixpath
+from io import BytesIO
+from bisect import bisect_right
+from difflib import SequenceMatcher
+
+from lxml import etree
+
+from .ooxml import _Member, _zip
+
+_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+_OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+
+
+def _w(tag):
+    return f"{{{_W}}}{tag}"
+
+
+_P, _R, _T, _TAB, _BR, _CR, _PPR, _RPR, _BODY, _SECTPR = (
+    _w(t) for t in ("p", "r", "t", "tab", "br", "cr", "pPr", "rPr", "body", "sectPr")
+)
+_TEXT_CHILDREN = {_T, _TAB, _BR, _CR}
+# Children that carry no content of their own: anything else in a paragraph
+# (drawings, fields, hyperlinks, a section break in pPr, ...) must survive edits.
+_PLAIN_RUN_CHILDREN = _TEXT_CHILDREN | {_RPR, _w("lastRenderedPageBreak")}
+_PLAIN_PARAGRAPH_CHILDREN = {_PPR, _R, _w("proofErr"), _w("bookmarkStart"), _w("bookmarkEnd")}
+
+
+def run_text(r):
+    """Text of a <w:r> the way python-docx reads it: tabs and breaks as \\t and \\n."""
+    parts = []
+    for child in r:
+        if child.tag == _T:
+            parts.append(child.text or "")
+        elif child.tag == _TAB:
+            parts.append("\t")
+        elif child.tag in (_BR, _CR):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _set_run_text(r, text):
+    """Replace the text of a run where its old text was, keeping other children in place."""
+    old = [c for c in r if c.tag in _TEXT_CHILDREN]
+    at = r.index(old[0]) if old else len(r)
+    for child in old:
+        r.remove(child)
+    new = []
+    start = 0
+    for i, ch in enumerate(text + "\n"):
+        if ch in "\t\n\r" or i == len(text):
+            if i > start:
+                t = etree.Element(_T)
+                t.text = text[start:i]
+                if len(t.text.strip()) < len(t.text):
+                    t.set(_XML_SPACE, "preserve")
+                new.append(t)
+            if i < len(text):
+                new.append(etree.Element(_TAB if ch == "\t" else _BR))
+            start = i + 1
+    r[at:at] = new
+
+
+def _runs(p):
+    return [child for child in p if child.tag == _R]
+
+
+def paragraph_text(p):
+    return "".join(run_text(r) for r in _runs(p))
+
+
+def _has_objects(p):
+    """True if `p` holds anything besides plain text runs, e.g. an image or a section break."""
+    ppr = p.find(_PPR)
+    if ppr is not None and ppr.find(_SECTPR) is not None:
+        return True
+    for child in p:
+        if child.tag not in _PLAIN_PARAGRAPH_CHILDREN:
+            return True
+        if child.tag == _R and any(c.tag not in _PLAIN_RUN_CHILDREN for c in child):
+            return True
+    return False
+
+
+def _editable_paragraphs(body):
+    """Body paragraphs shown for editing; those with only images or a section break are left out."""
+    return [p for p in body if p.tag == _P and (paragraph_text(p) or not _has_objects(p))]
+
+
+def _new_run(p, like=None):
+    r = etree.SubElement(p, _R)
+    rpr = like.find(_RPR) if like is not None else None
+    if rpr is not None:
+        r.append(copy.deepcopy(rpr))
+    return r
+
+
+def _patch_paragraph(p, text):
+    """Rewrite only the runs of `p` whose part of the text changed."""
+    runs = _runs(p)
+    texts = [run_text(r) for r in runs]
+    # Runs with text, by their start offset in the paragraph text.
+    spans, starts, pos = [], [], 0
+    for i, t in enumerate(texts):
+        if t:
+            spans.append(i)
+            starts.append(pos)
+            pos += len(t)
+    if not spans:
+        if text:
+            _set_run_text(_new_run(p, runs[0] if runs else None), text)
+        return
+
+    def owner(offset):
+        return spans[max(bisect_right(starts, offset) - 1, 0)]
+
+    old = "".join(texts)
+    pieces = {i: [] for i in spans}
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old, text, autojunk=False).get_opcodes():
+        if tag == "equal":
+            for k, i in enumerate(spans):
+                lo, hi = max(i1, starts[k]), min(i2, starts[k] + len(texts[i]))
+                if lo < hi:
+                    pieces[i].append(text[j1 + lo - i1:j1 + hi - i1])
+        elif tag == "replace":
+            pieces[owner(i1)].append(text[j1:j2])
+        elif tag == "insert":
+            # Typed text joins the run it follows (the one before the cursor).
+            pieces[owner(i1 - 1 if i1 else 0)].append(text[j1:j2])
+    for i in spans:
+        new = "".join(pieces[i])
+        if new != texts[i]:
+            _set_run_text(runs[i], new)
+
+
+def _new_paragraph(text, like=None):
+    p = etree.Element(_P)
+    if like is not None:
+        # A line added after a paragraph continues its formatting, like Enter in Word.
+        ppr = like.find(_PPR)
+        if ppr is not None:
+            p.append(copy.deepcopy(ppr))
+        runs = _runs(like)
+    else:
+        runs = []
+    if text:
+        _set_run_text(_new_run(p, runs[0] if runs else None), text)
+    return p
+
+
+def _raw_member(data, info):
+    """A _Member carrying an entry's original compressed bytes."""
+    offset = info.header_offset
+    name_len, extra_len = struct.unpack("<HH", data[offset + 26:offset + 30])
+    start = offset + 30 + name_len + extra_len
+    dos_date = (info.date_time[0] - 1980) << 9 | info.date_time[1] << 5 | info.date_time[2]
+    dos_time = info.date_time[3] << 11 | info.date_time[4] << 5 | info.date_time[5] // 2
+    return _Member(
+        info.filename, info.CRC, info.file_size, data[start:start + info.compress_size],
+        info.compress_type, info.flag_bits & ~0x08, dos_time, dos_date,
+    )
+
+
+# Changed blocks up to this many line pairs are aligned line by line.
+_ALIGN_LIMIT = 2500
+_MIN_SIMILARITY = 0.5
+
+
+def _align(old, new):
+    """Monotone pairing of two line lists maximizing total similarity.
+
+    Yields (i, j) with either side None for unpaired lines; lines are only
+    paired if they are at least _MIN_SIMILARITY alike.
+    """
+    n, m = len(old), len(new)
+    ratio = [[SequenceMatcher(None, a, b).ratio() for b in new] for a in old]
+    best = [[0.0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n - 1, -1, -1):
+        for j in range(m - 1, -1, -1):
+            pair = ratio[i][j] + best[i + 1][j + 1] if ratio[i][j] >= _MIN_SIMILARITY else -1.0
+            best[i][j] = max(pair, best[i + 1][j], best[i][j + 1])
+    i = j = 0
+    while i < n and j < m:
+        if ratio[i][j] >= _MIN_SIMILARITY and best[i][j] == ratio[i][j] + best[i + 1][j + 1]:
+            yield i, j
+            i, j = i + 1, j + 1
+        elif best[i][j] == best[i + 1][j]:
+            yield i, None
+            i += 1
+        else:
+            yield None, j
+            j += 1
+    for i in range(i, n):
+        yield i, None
+    for j in range(j, m):
+        yield None, j
+
+
+def _line_edits(old, new):
+    """(old index or None, new index or None, old position) for every line, in order."""
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old, new, autojunk=False).get_opcodes():
+        if tag == "equal" or (tag == "replace" and i2 - i1 == j2 - j1):
+            pairs = zip(range(i1, i2), range(j1, j2))
+        elif tag == "replace" and (i2 - i1) * (j2 - j1) <= _ALIGN_LIMIT:
+            pairs = ((None if i is None else i1 + i, None if j is None else j1 + j)
+                     for i, j in _align(old[i1:i2], new[j1:j2]))
+        else:
+            pairs = [(i, None) for i in range(i1, i2)] + [(None, j) for j in range(j1, j2)]
+        at = i1
+        for i, j in pairs:
+            if i is not None:
+                at = i + 1
+            yield i, j, at
+
+
+class DocxEditor:
+    """Body paragraphs of a DOCX as editable text, saved back in place."""
+
+    def __init__(self, data):
+        self.data = bytes(data)
+        self._zip = zipfile.ZipFile(BytesIO(self.data))
+        self.document_name = self._main_document()
+        self._xml = self._zip.read(self.document_name)
+        root = etree.fromstring(self._xml)
+        self.paragraphs = _editable_paragraphs(root.find(_BODY))
+        self.lines, self._owners = [], []
+        for k, p in enumerate(self.paragraphs):
+            for line in paragraph_text(p).split("\n"):
+                self.lines.append(line)
+                self._owners.append(k)
+
+    def _main_document(self):
+        rels = etree.fromstring(self._zip.read("_rels/.rels"))
+        for rel in rels:
+            if rel.get("Type") == _OFFICE_DOCUMENT:
+                return posixpath.normpath(rel.get("Target").lstrip("/"))
+        return "word/document.xml"
+
+    @property
+    def text(self):
+        return "\n".join(self.lines)
+
+    def _line_plan(self, new_lines):
+        """New lines per paragraph, and lines to insert as new paragraphs after index k (-1: at the start)."""
+        owners = self._owners
+        kept = [[] for _ in self.paragraphs]
+        inserted = {}
+        for i, j, at in _line_edits(self.lines, new_lines):
+            if i is not None:
+                if j is not None:
+                    kept[owners[i]].append(new_lines[j])
+            elif 0 < at < len(owners) and owners[at - 1] == owners[at]:
+                # Inside a paragraph with line breaks: stays in that paragraph.
+                kept[owners[at]].append(new_lines[j])
+            else:
+                inserted.setdefault(owners[at - 1] if at else -1, []).append(new_lines[j])
+        return kept, inserted
+
+    def _patched_xml(self, new_text):
+        root = etree.fromstring(self._xml)
+        body = root.find(_BODY)
+        paragraphs = _editable_paragraphs(body)
+        kept, inserted = self._line_plan(new_text.replace("\r\n", "\n").split("\n"))
+        for k, lines in inserted.items():
+            if k == -1:
+                for line in reversed(lines):
+                    body.insert(0, _new_paragraph(line))
+                continue
+            anchor = paragraphs[k]
+            for line in lines:
+                p = _new_paragraph(line, paragraphs[k])
+                anchor.addnext(p)
+                anchor = p
+        for p, lines in zip(paragraphs, kept):
+            if not lines and _has_objects(p):
+                _patch_paragraph(p, "")  # drop its text, keep the image or break
+            elif not lines:
+                body.remove(p)
+            else:
+                text = "\n".join(lines)
+                if text != paragraph_text(p):
+                    _patch_paragraph(p, text)
+        return etree.tostring(root, encoding="UTF-8", standalone=True)
+
+    def save(self, new_text):
+        """DOCX bytes with the edited text applied; the input bytes if nothing changed."""
+        if new_text.replace("\r\n", "\n") == self.text:
+            return self.data
+        document = _Member.deflated(self.document_name, self._patched_xml(new_text))
+        return _zip([
+            document if info.filename == self.document_name else _raw_member(self.data, info)
+            for info in self._zip.infolist()
+        ])
@@ -0,0 +1,187 @@
+# templates/preview.py
+"""
+HTML preview of a resume template for the Create page.
+
+The preview walks the same compiled plan as the DOCX renderer, but every
+step becomes an HTML fragment memoized on the content of the fields it
+reads: the header on name/title/contact, a section body on its own
+field(s), headings on nothing. Editing one field re-renders only the
+fragments that read it; everything else is a cache hit, so an update costs
+roughly one section's worth of escaping and string joins. No DOCX is built.
+
+Usage:
+    html = render_html(TEMPLATE_MAP["Corporate"], data)
+"""
+import os
+from html import escape
+from string import Formatter
+from functools import lru_cache
+
+from . import engine
+from .engine import normalize_data, TEXT_FIELDS
+
+PREVIEW_CACHE_SIZE = int(os.environ.get("PREVIEW_CACHE_SIZE", "4096"))
+
+_PAGE_STYLE = (
+    "background:#fff;color:#000;font-family:Calibri,Arial,sans-serif;font-size:11pt;"
+    "line-height:1.3;padding:36px 48px;box-shadow:0 2px 12px rgba(0,0,0,.15);"
+)
+
+
+def _text(value):
+    return escape(value).replace("\t", "&emsp;").replace("\r\n", "<br>").replace("\n", "<br>").replace("\r", "<br>")
+
+
+def _css(size=None, color=None, bold=False, align=None):
+    style = []
+    if size is not None:
+        style.append(f"font-size:{size.pt:g}pt")
+    if bold:
+        style.append("font-weight:bold")
+    if color is not None:
+        style.append(f"color:#{color}")
+    if align is not None:
+        style.append(f"text-align:{engine.WD_ALIGN_PARAGRAPH.to_xml(align)}")
+    return ";".join(style)
+
+
+def _p(text, style=""):
+    style = f' style="{style}"' if style else ""
+    return f"<p{style}>{_text(text)}</p>"
+
+
+def _heading(text, level):
+    tag = f"h{min(max(level, 1), 6)}"
+    return f"<{tag}>{_text(text)}</{tag}>"
+
+
+# ---- HTML counterparts of engine's render steps: emit(values, *args) ----
+# `values` maps the fields a step reads to their (frozen) content.
+
+
+def _rule(values):
+    return "<hr>"
+
+
+def _name_run(values, placeholder, size, color):
+    name = values["name"] if values["name"] is not None else placeholder
+    return _p(name, _css(size, color, bold=True, align=engine.WD_ALIGN_PARAGRAPH.CENTER) + ";margin:0")
+
+
+def _name_heading(values, placeholder, level):
+    return _heading(values["name"] if values["name"] is not None else placeholder, level)
+
+
+def _line(values, template, align):
+    text = template.format_map({k: v or "" for k, v in values.items()})
+    return _p(text, _css(align=align))
+
+
+def _heading_run(values, text, size, color, space_before, space_after):
+    margin = f";margin:{space_before.pt:g}pt 0 {space_after.pt:g}pt 0"
+    return _p(text, _css(size, color, bold=True) + margin)
+
+
+def _heading_label(values, text):
+    return f"<p><b>{_text(text)}</b></p>"
+
+
+def _heading_doc(values, text, level):
+    return _heading(text, level)
+
+
+def _text_section(values, field, default):
+    value = values[field]
+    return _p(value if value is not None else default)
+
+
+def _bullets(values, fields):
+    items = "".join(f"<li>{_text(item)}</li>" for field in fields for item in values[field])
+    return f"<ul>{items}</ul>" if items else ""
+
+
+def _pairs(values, field):
+    return "".join(_p(f"{key}: {value}") for key, value in values[field])
+
+
+def _inline(values, fields):
+    return _p(", ".join(item for field in fields for item in values[field]))
+
+
+def _line_fields(template, align):
+    return tuple(f for _, f, _, _ in Formatter().parse(template) if f in TEXT_FIELDS)
+
+
+# step -> (emitter, fields it reads given its args)
+_EMITTERS = {
+    engine._rule: (_rule, lambda: ()),
+    engine._name_run: (_name_run, lambda *a: ("name",)),
+    engine._name_heading: (_name_heading, lambda *a: ("name",)),
+    engine._line: (_line, _line_fields),
+    engine._heading_run: (_heading_run, lambda *a: ()),
+    engine._heading_label: (_heading_label, lambda *a: ()),
+    engine._heading_doc: (_heading_doc, lambda *a: ()),
+    engine._text: (_text_section, lambda field, default: (field,)),
+    engine._bullets: (_bullets, lambda fields: tuple(fields)),
+    engine._pairs: (_pairs, lambda field: (field,)),
+    engine._inline: (_inline, lambda fields: tuple(fields)),
+}
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(value.items())
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class _Fragment:
+    """One plan step; its HTML is memoized on the content of `fields`."""
+
+    __slots__ = ("emit", "args", "fields")
+
+    def __init__(self, step, args):
+        self.emit, fields = _EMITTERS[step]
+        self.args = args
+        self.fields = fields(*args)
+
+    def html(self, data):
+        return _fragment_html(self, tuple(_freeze(data[f]) for f in self.fields))
+
+
+@lru_cache(maxsize=PREVIEW_CACHE_SIZE)
+def _fragment_html(fragment, values):
+    return fragment.emit(dict(zip(fragment.fields, values)), *fragment.args)
+
+
+class _Columns:
+    def __init__(self, widths, plans):
+        self.widths = widths
+        self.columns = [_compile(steps) for steps in plans]
+
+    def html(self, data):
+        cells = "".join(
+            f'<td style="width:{width.inches:g}in;vertical-align:top;padding:0 8px">{_join(fragments, data)}</td>'
+            for width, fragments in zip(self.widths, self.columns)
+        )
+        return f'<table style="width:100%;border-collapse:collapse"><tr>{cells}</tr></table>'
+
+
+def _compile(steps):
+    return [_Columns(*args) if step is engine._columns else _Fragment(step, args) for step, args in steps]
+
+
+def _join(fragments, data):
+    return "".join(fragment.html(data) for fragment in fragments)
+
+
+_previews = {}
+
+
+def render_html(plan, data):
+    """HTML preview of `data` in a TemplatePlan's layout."""
+    fragments = _previews.get(plan)
+    if fragments is None:
+        fragments = _previews[plan] = _compile(plan.steps)
+    return f'<div class="resume-preview" style="{_PAGE_STYLE}">{_join(fragments, normalize_data(data))}</div>'
@@ -0,0 +1,69 @@
+# templates/prototype.py
+"""
+Prepared blank documents that are cloned instead of re-read from disk.
+
+`Document()` unzips and parses python-docx's bundled default.docx on every
+call. A DocumentPrototype does that once (plus any page setup such as
+margins) and `clone()` then builds a new package in memory: the parts a
+render writes to (the main document and its core properties) are deep
+copies, while styles, numbering, theme, fonts and settings are shared
+read-only with the prototype.
+
+Paragraph styles are also resolved to their style ids once per prototype;
+python-docx otherwise scans the whole style sheet on each styled paragraph.
+"""
+import copy
+import threading
+
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+# Package parts that renders modify; everything else is shared.
+_PER_DOCUMENT = {RT.OFFICE_DOCUMENT, RT.CORE_PROPERTIES}
+
+
+def _clone_part(part, package, cloned):
+    new = cloned.get(part)
+    if new is None:
+        new = cloned[part] = type(part)(part.partname, part.content_type, copy.deepcopy(part._element), package)
+        for rel in part.rels.values():
+            target = rel.target_ref if rel.is_external else cloned.get(rel.target_part, rel.target_part)
+            new.rels.add_relationship(rel.reltype, target, rel.rId, rel.is_external)
+    return new
+
+
+class DocumentPrototype:
+    """A blank Document prepared once; `clone()` returns fresh copies."""
+
+    def __init__(self, setup=None):
+        self.document = Document()
+        if setup is not None:
+            setup(self.document)
+        self._style_ids = {}
+        self._lock = threading.Lock()
+
+    def style_id(self, name):
+        """Style id for a style name ("List Bullet" -> "ListBullet")."""
+        try:
+            return self._style_ids[name]
+        except KeyError:
+            pass
+        with self._lock:
+            style = self.document.styles[name]
+            self._style_ids[name] = style.style_id
+        return style.style_id
+
+    def clone(self):
+        """A new Document with the prototype's content and setup."""
+        package = self.document.part.package
+        new_package = type(package)()
+        cloned = {}
+        for rel in package.rels.values():
+            if rel.is_external:
+                target = rel.target_ref
+            elif rel.reltype in _PER_DOCUMENT:
+                target = _clone_part(rel.target_part, new_package, cloned)
+            else:
+                target = rel.target_part
+            new_package.rels.add_relationship(rel.reltype, target, rel.rId, rel.is_external)
+        return new_package.main_document_part.document
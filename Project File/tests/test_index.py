@@ -0,0 +1,32 @@
+from ats.index import ResumeIndex
+
+JD = "Python engineer with Kubernetes"
+
+
+def hits(index):
+    return {hit["doc_id"]: hit["hits"] for hit in index.search(JD)}
+
+
+def test_readd_same_doc_stays_searchable():
+    index = ResumeIndex(":memory:")
+    index.add("a", "python kubernetes")
+    index.add("a", "python kubernetes")
+    assert hits(index) == {"a": 2}
+
+
+def test_remove_then_add_does_not_reuse_tombstoned_id():
+    index = ResumeIndex(":memory:")
+    index.add("a", "python kubernetes")
+    index.add("b", "python")
+    index.remove("b")
+    index.add("c", "kubernetes")
+    assert hits(index) == {"a": 2, "c": 1}
+
+
+def test_add_after_compact():
+    index = ResumeIndex(":memory:")
+    index.add("a", "python")
+    index.add("a", "kubernetes")
+    index.compact()
+    index.add("b", "python")
+    assert hits(index) == {"a": 1, "b": 1}
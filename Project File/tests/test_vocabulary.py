@@ -0,0 +1,30 @@
+from ats.profile import JobProfile
+from ats.vocabulary import CandidatePool
+
+
+def test_trailing_empty_resume_keeps_previous_terms():
+    profile = JobProfile.compile("Zebra and yak wranglers wanted")
+    pool = CandidatePool()
+    pool.add("a", "zebra yak")
+    before = pool.top(profile)
+    pool.add("b", "")
+    assert pool.top(profile) == before + [("b", 0)]
+
+
+def test_empty_rows_between_resumes():
+    profile = JobProfile.compile("Zebra and yak wranglers wanted")
+    pool = CandidatePool()
+    for doc_id, text in [("e1", ""), ("a", "zebra yak"), ("e2", ""), ("e3", ""), ("b", "yak"), ("e4", "")]:
+        pool.add(doc_id, text)
+    scores = dict(pool.top(profile, k=len(pool)))
+    assert scores["a"] > scores["b"] > 0
+    assert scores["e1"] == scores["e2"] == scores["e3"] == scores["e4"] == 0
+
+
+def test_add_after_scoring():
+    profile = JobProfile.compile("Zebra and yak wranglers wanted")
+    pool = CandidatePool()
+    pool.add("a", "zebra yak")
+    pool.top(profile)
+    pool.add("b", "yak and more words here")
+    assert dict(pool.top(profile)) == {"a": 50, "b": 25}